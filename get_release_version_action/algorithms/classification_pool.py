@@ -0,0 +1,128 @@
+"""Classify the version bumps of commits in chunks by a pool of worker processes."""
+import functools
+import logging
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, TypeAlias
+
+from ..utils import CommitMessage
+
+logger = logging.getLogger('wemogy.get-release-version-action.semantic')
+
+__all__ = [
+    'BumpFunctionFactory',
+    'ClassificationPool',
+    'PARALLEL_CHUNK_SIZE',
+    'get_worker_count'
+]
+
+PARALLEL_CHUNK_SIZE = 4096
+"""The number of commits a worker process classifies at once."""
+
+BumpFunctionFactory: TypeAlias = Callable[..., Callable[[CommitMessage], int]]
+"""
+A module-level function that creates the function mapping a commit to its version bump, e.g. ``get_bump_function``.
+The worker processes get the factory and its arguments instead of the bump function, which can't be pickled.
+"""
+
+
+def get_worker_count() -> int:
+    """Get the number of CPUs this process may run on, which is the default number of worker processes."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+class ClassificationPool:
+    """
+    Classify commits in chunks of ``PARALLEL_CHUNK_SIZE`` commits by a pool of worker processes, which is started
+    when the first chunk is full. At most two chunks per worker are in flight, so the messages of all commits are
+    never held at once.
+    """
+
+    def __init__(self, bump_function_factory: BumpFunctionFactory, bump_function_args: tuple[Any, ...], workers: int):
+        """
+        :param bump_function_factory: Creates the bump function of each worker process (see ``BumpFunctionFactory``).
+        :param bump_function_args: The arguments of ``bump_function_factory``, which have to be hashable.
+        :param workers: The number of worker processes.
+        """
+        self.bump_function_factory = bump_function_factory
+        self.bump_function_args = bump_function_args
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._chunk: list[CommitMessage] = []
+        self._in_flight: deque[tuple[list[str], Future[list[int]]]] = deque()
+
+    def add(self, commit: CommitMessage) -> list[tuple[str, int]]:
+        """
+        Add a commit to the current chunk.
+
+        :returns: The hashes and bumps of the oldest chunk, if too many chunks are in flight.
+        """
+        self._chunk.append(commit)
+
+        if len(self._chunk) < PARALLEL_CHUNK_SIZE:
+            return []
+
+        self._submit()
+
+        if len(self._in_flight) < 2 * self.workers:
+            return []
+
+        return self._collect()
+
+    def drain(self) -> Iterator[tuple[str, int]]:
+        """Classify the last chunk and get the hashes and bumps of all chunks in flight."""
+        if self._chunk:
+            self._submit()
+
+        while self._in_flight:
+            yield from self._collect()
+
+    def close(self) -> None:
+        """Stop the worker processes, the chunks that haven't been started are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _submit(self) -> None:
+        """Send the current chunk to the worker processes."""
+        if self._executor is None:
+            logger.debug('Classifying the remaining commits in %s worker processes', self.workers)
+            # The workers are spawned instead of forked, because forking copies the threads and pipes of the session.
+            self._executor = ProcessPoolExecutor(self.workers, multiprocessing.get_context('spawn'))
+
+        shas = [commit.hexsha for commit in self._chunk]
+        messages = [commit.message for commit in self._chunk]
+        self._in_flight.append((shas, self._executor.submit(
+            _classify_messages, self.bump_function_factory, self.bump_function_args, messages
+        )))
+        self._chunk = []
+
+    def _collect(self) -> list[tuple[str, int]]:
+        """Wait for the oldest chunk in flight and get its hashes and bumps."""
+        shas, future = self._in_flight.popleft()
+        return list(zip(shas, future.result()))
+
+
+@functools.cache
+def _get_worker_bump_function(
+        bump_function_factory: BumpFunctionFactory,
+        bump_function_args: tuple[Any, ...]
+) -> Callable[[CommitMessage], int]:
+    """Get the bump function of a worker process, which is created once per process."""
+    return bump_function_factory(*bump_function_args)
+
+
+def _classify_messages(
+        bump_function_factory: BumpFunctionFactory,
+        bump_function_args: tuple[Any, ...],
+        messages: list[str]
+) -> list[int]:
+    """Classify the messages of a chunk in a worker process."""
+    get_bump = _get_worker_bump_function(bump_function_factory, bump_function_args)
+    return [get_bump(CommitMessage(hexsha='', message=message)) for message in messages]
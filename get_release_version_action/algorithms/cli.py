@@ -2,9 +2,11 @@
 import logging.config
 from argparse import ArgumentParser
 
+from .commit_classifier import BUMP_CLASSIFIERS
 from .main_algorithm import main_algorithm
+from .tag_ordering import TAG_ORDERINGS
 from ..models import Inputs
-from ..utils import log_github_output, setup_logging, write_github_output
+from ..utils import OBJECT_READERS, log_github_output, setup_logging, write_github_output
 
 logger = logging.getLogger('wemogy.get-release-version-action')
 
@@ -101,6 +103,97 @@ def cli_entrypoint() -> None:
         help='The mode to use for determining the next version.'
     )
 
+    parser.add_argument(
+        '--only-reachable-tags',
+        dest='only_reachable_tags',
+        required=False,
+        default='false',
+        help='Only consider tags on commits that are reachable from `HEAD` when searching the previous version.'
+    )
+
+    parser.add_argument(
+        '--tag-ordering',
+        dest='tag_ordering',
+        required=False,
+        choices=TAG_ORDERINGS,
+        default='commit-date',
+        help='How to order the version tags in `semantic` mode: `commit-date` (newest commit first) or `semver`.'
+    )
+
+    parser.add_argument(
+        '--object-reader',
+        dest='object_reader',
+        required=False,
+        choices=OBJECT_READERS,
+        default='git',
+        help='How to read git objects: `git` (a `git cat-file` process) or `in-process` (from the pack files).'
+    )
+
+    parser.add_argument(
+        '--first-parent',
+        dest='first_parent',
+        required=False,
+        default='false',
+        help='Only analyze the first-parent chain of `HEAD`, which skips the commits of merged branches.'
+    )
+
+    parser.add_argument(
+        '--parse-merge-bodies',
+        dest='parse_merge_bodies',
+        required=False,
+        default='false',
+        help='Parse the body of merge commits instead of their subject, e.g. a pull request title.'
+    )
+
+    parser.add_argument(
+        '--ignore-cherry-picks',
+        dest='ignore_cherry_picks',
+        required=False,
+        default='false',
+        help='Ignore commits whose changes are already in the history of the previous version, e.g. cherry-picks.'
+    )
+
+    parser.add_argument(
+        '--bump-classifier',
+        dest='bump_classifier',
+        required=False,
+        choices=BUMP_CLASSIFIERS,
+        default='fast',
+        help='How to classify commit messages: `fast` (built-in) or `angular` (the parser of `semantic_release`).'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        dest='cache_dir',
+        required=False,
+        default='NONE',
+        help='The directory for the caches that are kept between runs. Use `NONE` for a directory inside `.git`.'
+    )
+
+    parser.add_argument(
+        '--parallel-threshold',
+        dest='parallel_threshold',
+        required=False,
+        default='0',
+        help='Classify the commits in worker processes above this number of unparsed commits. Use `0` to never do it.'
+    )
+
+    parser.add_argument(
+        '--commit-types-config',
+        dest='commit_types_config',
+        required=False,
+        default='NONE',
+        help='A YAML file that configures the commit types and their bumps (see the FAQ). Use `NONE` for the defaults.'
+    )
+
+    parser.add_argument(
+        '--squash-merge-entries',
+        dest='squash_merge_entries',
+        required=False,
+        default='false',
+        help='Also classify every header in the body of a commit, e.g. the `* feat: ...` entries of a squash merge.'
+    )
+
     args = parser.parse_args()
     setup_logging(args.verbose)
 
@@ -0,0 +1,174 @@
+"""Classify commit messages by their version bump without building the parse results of a commit parser."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+import yaml
+
+__all__ = [
+    'BUMP_CLASSIFIERS',
+    'CommitClassifier',
+    'CommitTypes'
+]
+
+BUMP_CLASSIFIERS = ('fast', 'angular')
+"""
+The possible values of the ``bump_classifier`` input: the built-in ``CommitClassifier`` or the
+``AngularCommitParser`` of ``semantic_release``.
+"""
+
+ALLOWED_TYPES = ('build', 'chore', 'ci', 'docs', 'feat', 'fix', 'perf', 'style', 'refactor', 'test')
+"""The commit types of conventional commits, in the order the ``AngularCommitParser`` tries them."""
+
+MINOR_TYPES = ('feat',)
+"""The commit types that bump the minor version."""
+
+PATCH_TYPES = ('fix', 'perf')
+"""The commit types that bump the patch version."""
+
+BREAKING_FOOTERS = ('BREAKING CHANGE', 'BREAKING-CHANGE')
+"""The footer tokens that mark a breaking change, like the ``AngularCommitParser`` recognizes them."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CommitTypes:
+    """
+    The configuration of the commit types and their version bumps, which is read from the ``commit_types_config``
+    file. The defaults are the ones of the ``AngularCommitParser``.
+    """
+
+    allowed: tuple[str, ...] = ALLOWED_TYPES
+    """The commit types of a valid header, the other types are no conventional commits."""
+
+    minor: tuple[str, ...] = MINOR_TYPES
+    """The commit types that bump the minor version."""
+
+    patch: tuple[str, ...] = PATCH_TYPES
+    """The commit types that bump the patch version, if they don't bump the minor version."""
+
+    breaking_footers: tuple[str, ...] = BREAKING_FOOTERS
+    """
+    The footer tokens that mark a breaking change, when a body paragraph starts with ``<token>:``. A space in a token
+    also matches a line break.
+    """
+
+    @classmethod
+    def load(cls, path: str | Path) -> CommitTypes:
+        """
+        Load the commit types from a YAML file with the optional lists ``allowed``, ``minor``, ``patch`` and
+        ``breaking-footers``, e.g.::
+
+            allowed: [build, chore, ci, docs, feat, fix, perf, style, refactor, test]
+            minor: [feat]
+            patch: [fix, perf, refactor]
+
+        The missing lists keep their defaults.
+        """
+        with open(path, 'r', encoding='utf-8') as config_stream:
+            config = yaml.load(config_stream, yaml.SafeLoader) or {}
+
+        if not isinstance(config, dict):
+            raise ValueError(f'Expected the commit types config "{path}" to be a mapping.')
+
+        names = {field.name for field in fields(cls)}
+        lists: dict[str, tuple[str, ...]] = {}
+
+        for key, value in config.items():
+            name = str(key).replace('-', '_')
+
+            if name not in names:
+                raise ValueError(f'Unknown key "{key}" in the commit types config "{path}".')
+
+            if not isinstance(value, list) or not all(isinstance(item, str) and item for item in value):
+                raise ValueError(f'Expected "{key}" in the commit types config "{path}" to be a list of strings.')
+
+            lists[name] = tuple(value)
+
+        if not lists.get('allowed', ALLOWED_TYPES):
+            raise ValueError(f'Expected "allowed" in the commit types config "{path}" to contain a commit type.')
+
+        return cls(**lists)
+
+
+class CommitClassifier:  # pylint: disable=too-few-public-methods
+    """
+    Map a commit message to its version bump (0 = chore / unknown, 1 = patch, 2 = minor, 3 = major) with two
+    regular expressions, one for the header and one for the ``BREAKING CHANGE:`` footers, which are compiled once
+    from the ``CommitTypes``, and a lookup table of the bump of each type.
+
+    With the same commit types, the bump is the same the ``AngularCommitParser`` of ``semantic_release`` determines:
+
+    * The header is ``<type>[(<scope>)][!]: <subject>`` at the start of the message. A message without such a header
+      doesn't bump the version.
+    * A ``!`` in the header or a body paragraph that starts with a ``BREAKING CHANGE:`` (or ``BREAKING-CHANGE:``)
+      footer is a major bump. The body only starts after an empty line that directly follows the subject line.
+    * Otherwise, the type decides the bump.
+    """
+
+    def __init__(self, commit_types: CommitTypes = CommitTypes()) -> None:
+        """:param commit_types: The commit types and their version bumps."""
+        # The same pattern as the one of the AngularCommitParser, so the same header is matched.
+        types = "|".join(map(re.escape, commit_types.allowed))
+        self._header = re.compile(rf'(?P<type>{types})(?:\([^\n]+\))?(?P<breaking>!)?:\s+[^\n]+')
+        # A header at the start of a line of the body, optionally as a list item, like a squash merge lists the commits.
+        self._entry = re.compile(
+            rf'^[ \t]*(?:[*-][ \t]+)?(?P<type>{types})(?:\([^\n]+\))?(?P<breaking>!)?:[ \t]+\S', re.MULTILINE
+        )
+        # A paragraph of the body that starts with a breaking change footer. The paragraphs are separated by an empty
+        # line and a line break within a paragraph counts as a space, like the AngularCommitParser joins the lines.
+        footers = '|'.join('[ \n]'.join(map(re.escape, footer.split(' '))) for footer in commit_types.breaking_footers)
+        # Without footers, the empty lookahead never matches.
+        self._breaking_change_footer = re.compile(rf'\n\n\s*(?:{footers or "(?!)"}):')
+        self._bumps = dict.fromkeys(commit_types.patch, 1) | dict.fromkeys(commit_types.minor, 2)
+
+    def classify(self, message: str) -> int:
+        """Get the version bump of a commit message."""
+        header = self._header.match(message)
+
+        if header is None:
+            return 0
+
+        if header.group('breaking') is not None:
+            return 3
+
+        end = header.end()
+
+        if message.startswith('\n\n', end) and self._has_breaking_change_footer(message, end):
+            return 3
+
+        return self._bumps.get(header.group('type'), 0)
+
+    def classify_entries(self, message: str) -> int:
+        """
+        Get the maximum version bump of a commit message and the entries of its body, like the ones of a squash merge
+        (``* feat: ...``). Every line of the body that starts with a header is an entry, the body is scanned once
+        for all entries and once for breaking change footers, which break the version even without a valid header.
+        """
+        bump = self.classify(message)
+        body_start = message.find('\n')
+
+        if bump == 3 or body_start == -1:
+            return bump
+
+        for entry in self._entry.finditer(message, body_start):
+            if entry.group('breaking') is not None:
+                return 3
+
+            bump = max(bump, self._bumps.get(entry.group('type'), 0))
+
+        if self._has_breaking_change_footer(message, body_start):
+            return 3
+
+        return bump
+
+    def _has_breaking_change_footer(self, message: str, body_start: int) -> bool:
+        """
+        Check if a paragraph of the body starts with a breaking change footer.
+        The body starts with the empty line at ``body_start``. Carriage returns are ignored, like Windows line endings.
+        """
+        if '\r' not in message:
+            return self._breaking_change_footer.search(message, body_start) is not None
+
+        return self._breaking_change_footer.search(message[body_start:].replace('\r', '')) is not None
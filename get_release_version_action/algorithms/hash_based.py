@@ -1,10 +1,9 @@
 """Get the next version based on the hash of the latest commit."""
 import logging
-
-import git
+import re
 
 from ..models import Inputs, GetNextVersionOutput
-from ..utils import get_sorted_tags
+from ..utils import GitSession, iter_tags_newest_first
 
 logger = logging.getLogger('wemogy.get-release-version-action.hash-based')
 
@@ -13,44 +12,65 @@ __all__ = [
 ]
 
 
-def build_tag_name(prefix: str, commit: git.Commit, suffix: str | None) -> str:
+def build_tag_name(prefix: str, commit_sha: str, suffix: str | None) -> str:
     """
-    Build a hash-based tag name by slicing the ``hexsha`` string to the first seven characters.
+    Build a hash-based tag name by slicing the commit hash to the first seven characters.
     Git often abbreviates hashes to seven characters as this is usually enough to uniquely identify a commit.
     """
-    return prefix + commit.hexsha[:7] + (f'-{suffix}' if suffix is not None else '')
+    return prefix + commit_sha[:7] + (f'-{suffix}' if suffix is not None else '')
 
 
-def get_current_version(repo: git.Repo, prefix: str, suffix: str | None) -> str | None:
+def get_current_version(
+        session: GitSession,
+        prefix: str,
+        suffix: str | None,
+        only_reachable: bool
+) -> str | None:
     """
     Get the current version (= the latest git tag that matches the versioning schema).
     If there are no tags, return ``None``.
+    If ``only_reachable`` is true, only tags reachable from ``HEAD`` are considered.
     """
-    for tag in get_sorted_tags(repo):
-        tag_name = build_tag_name(prefix, tag.commit, suffix)
+    # Only tags shaped like a hash-based tag name can match, so all other tags are never resolved to their commits.
+    candidate_pattern = re.compile(
+        re.escape(prefix) + '[0-9a-f]{7}' + re.escape(f'-{suffix}' if suffix is not None else '')
+    )
+
+    for tag in iter_tags_newest_first(
+            session,
+            lambda name: candidate_pattern.fullmatch(name) is not None,
+            only_reachable
+    ):
+        tag_name = build_tag_name(prefix, tag.commit_sha, suffix)
 
         # Check if the tag name starts with the specified prefix
         if tag.name == tag_name:
-            logger.debug('Found tag %s (%s)', tag.name, tag.commit.hexsha[:7])
-            return tag.commit.hexsha[:7]
+            logger.debug('Found tag %s (%s)', tag.name, tag.commit_sha[:7])
+            return tag.commit_sha[:7]
 
     logger.debug('Found no tags that have the prefix %s and the suffix %s', prefix, suffix)
     return None
 
 
-def get_next_version(inputs: Inputs, repo: git.Repo) -> GetNextVersionOutput:
+def get_next_version(inputs: Inputs, session: GitSession) -> GetNextVersionOutput:
     """
     Get the next version based on the hash of the latest commit.
 
     :returns: A tuple of the current version name, the next version and if the version was bumped.
     """
     current_version = get_current_version(
-        repo,
+        session,
         inputs.prefix,
-        inputs.reference_version_suffix
+        inputs.reference_version_suffix,
+        inputs.only_reachable_tags
     )
 
-    next_version = repo.head.commit.hexsha[:7]
+    head = session.read_object('HEAD^{commit}')
+
+    if head is None:
+        raise ValueError('HEAD does not point to a commit.')
+
+    next_version = head.sha[:7]
     version_bumped = current_version != next_version
 
     if not version_bumped:
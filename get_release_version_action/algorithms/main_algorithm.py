@@ -5,9 +5,11 @@ import os
 import git
 
 from ..models import Inputs, Outputs
-from ..utils import create_git_tag
+from ..utils import OBJECT_READERS, GitSession, create_git_tag
+from .commit_classifier import BUMP_CLASSIFIERS
 from .hash_based import get_next_version as get_next_version_hash
 from .semantic import get_next_version as get_next_semantic_version
+from .tag_ordering import TAG_ORDERINGS
 
 __all__ = [
     'main_algorithm'
@@ -15,6 +17,13 @@ __all__ = [
 
 logger = logging.getLogger('wemogy.get-release-version-action')
 
+CHOICE_INPUTS = {
+    'tag_ordering': TAG_ORDERINGS,
+    'object_reader': OBJECT_READERS,
+    'bump_classifier': BUMP_CLASSIFIERS
+}
+"""The inputs that must be one of the given values."""
+
 
 def main_algorithm(inputs: Inputs) -> Outputs:
     """The main algorithm."""
@@ -25,11 +34,17 @@ def main_algorithm(inputs: Inputs) -> Outputs:
         if inputs.git_email is None or inputs.git_username is None:
             raise ValueError('git email and username are required when a tag should be created!')
 
-    with git.Repo(os.getcwd()) as repo:
+    for name, choices in CHOICE_INPUTS.items():
+        value = getattr(inputs, name)
+
+        if value not in choices:
+            raise ValueError(f'Expected input "{name}" to be one of {", ".join(choices)}, but got "{value}".')
+
+    with git.Repo(os.getcwd()) as repo, GitSession(repo, inputs.object_reader, inputs.cache_dir) as session:
         if inputs.mode == 'semantic':
-            previous_version_tag_name, new_version, version_bumped = get_next_semantic_version(inputs, repo)
+            previous_version_tag_name, new_version, version_bumped = get_next_semantic_version(inputs, session)
         elif inputs.mode == 'hash-based':
-            previous_version_tag_name, new_version, version_bumped = get_next_version_hash(inputs, repo)
+            previous_version_tag_name, new_version, version_bumped = get_next_version_hash(inputs, session)
         else:
             raise ValueError(f'Expected input "mode" to be either "semantic" or "hash-based", but got "{inputs.mode}".')
 
@@ -49,7 +64,7 @@ def main_algorithm(inputs: Inputs) -> Outputs:
             if inputs.git_email is None or inputs.git_username is None:
                 raise ValueError('git email and username are required when a tag should be created!')
 
-            create_git_tag(new_version_tag_name, inputs.git_username, inputs.git_email)
+            create_git_tag(session, new_version_tag_name, inputs.git_username, inputs.git_email)
 
         output = Outputs(
             version=new_version,
@@ -60,4 +75,5 @@ def main_algorithm(inputs: Inputs) -> Outputs:
         )
 
         logger.info('Outputs: %s', output)
+        logger.info('Spawned %s git processes', session.spawned_processes)
         return output
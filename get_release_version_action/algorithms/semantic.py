@@ -1,13 +1,32 @@
 """Get the next version based on conventional commits and semantic versioning."""
+import contextlib
+import functools
+import hashlib
 import logging
+from collections.abc import Callable, Generator, Iterable, Iterator
+from pathlib import Path
+from typing import cast
 
 import git
 from semantic_release import LevelBump, ParseError
-from semantic_release.commit_parser import AngularCommitParser, AngularParserOptions
+from semantic_release.commit_parser import AngularCommitParser, AngularParserOptions, ParseResult
 from semver import Version
 
 from ..models import GetNextVersionOutput, Inputs
-from ..utils import get_sorted_tags
+from ..utils import (
+    CommitCache,
+    CommitMessage,
+    GitSession,
+    GitTag,
+    TagSortKey,
+    find_cherry_picks,
+    iter_commit_messages,
+    iter_tags_newest_first
+)
+from .classification_pool import ClassificationPool, get_worker_count
+from .commit_classifier import BREAKING_FOOTERS, CommitClassifier, CommitTypes
+from .tag_matcher import TagKind, TagNameMatcher
+from .tag_ordering import get_semver_sort_key
 
 logger = logging.getLogger('wemogy.get-release-version-action.semantic')
 
@@ -15,166 +34,304 @@ __all__ = [
     'get_next_version'
 ]
 
+BUMP_CACHE_HEADER = 'get-release-version-action bump cache v1'
+"""The first line of the bump cache files, a cache with another header is ignored."""
 
-def get_current_version(
-        repo: git.Repo,
-        prefix: str,
-        suffix: str | None,
-        bumping_suffix: str,
-        reference_version_suffix: str | None
-) -> git.TagReference | None:
-    """
-    GGet the current version (= the latest git tag that matches the versioning schema).
-    If there are no tags, return ``None``.
+
+def get_current_versions(
+        session: GitSession,
+        matcher: TagNameMatcher,
+        only_reachable: bool,
+        sort_key: TagSortKey | None = None
+) -> tuple[GitTag | None, GitTag | None]:
     """
-    for tag in get_sorted_tags(repo):
-        if not tag.name.startswith(prefix):
-            continue
-
-        if reference_version_suffix is None:
-            if suffix is None:
-                dash_count = tag.name.count('-')
-
-                if bumping_suffix in tag.name and dash_count == 1:
-                    logger.debug(
-                        'Found tag %s (%s) with prefix "%s" and suffix "%s"',
-                        tag.name, tag.commit.hexsha, prefix, suffix
-                    )
-                    return tag
-
-                if dash_count == 0:
-                    logger.debug(
-                        'Found tag %s (%s) with prefix "%s" and suffix "%s"',
-                        tag.name, tag.commit.hexsha, prefix, suffix
-                    )
-                    return tag
-                continue
+    Get the reference version and the current version (= the latest git tags that match the versioning schema)
+    in a single scan over the tags, which stops as soon as both are found.
+    If there are no matching tags, the version is ``None``.
+    If ``only_reachable`` is true, only tags reachable from ``HEAD`` are considered.
+    If a ``sort_key`` is given, the tags are ordered by it instead of the time of their commits.
 
-            if suffix in tag.name:
-                logger.debug(
-                    'Found tag %s (%s) with prefix "%s" and suffix "%s"',
-                    tag.name, tag.commit.hexsha, prefix, suffix
-                )
-                return tag
+    :returns: A tuple of the reference version tag and the current version tag.
+    """
+    reference_version_tag: GitTag | None = None
+    current_version_tag: GitTag | None = None
+    kinds: dict[str, TagKind] = {}
 
-            continue
+    def is_version(name: str) -> bool:
+        kind = matcher.classify(name)
 
-        # Check if the not bumped version has the reference version suffix
-        if tag.name.endswith(reference_version_suffix):
-            logger.debug(
-                'Found tag %s (%s) with prefix "%s" and suffix "%s"',
-                tag.name, tag.commit.hexsha, prefix, reference_version_suffix
-            )
-            return tag
+        if kind:
+            kinds[name] = kind
 
-        # Check if the bumped version has the current suffix
-        if suffix is None:
-            dash_count = tag.name.count('-')
-            if dash_count != 1:
-                continue
+        return bool(kind)
 
-            if f'-{bumping_suffix}' in tag.name:
-                logger.debug(
-                    'Found tag %s (%s) with prefix "%s" and suffix "%s"',
-                    tag.name, tag.commit.hexsha, prefix, suffix
-                )
-                return tag
+    # Irrelevant tags are filtered out by their name before their commits are resolved.
+    # The kinds of the matching tags are kept, so each name is only classified once.
+    for tag in iter_tags_newest_first(session, is_version, only_reachable, sort_key):
+        kind = kinds[tag.name]
 
-            continue
+        if reference_version_tag is None and TagKind.REFERENCE in kind:
+            logger.debug(
+                'Found reference version tag %s (%s) with prefix "%s" and suffix "%s"',
+                tag.name, tag.commit_sha, matcher.prefix, matcher.reference_version_suffix
+            )
+            reference_version_tag = tag
 
-        if f'{suffix}-{bumping_suffix}' in tag.name:
+        if current_version_tag is None and TagKind.CURRENT in kind:
             logger.debug(
-                'Found tag %s (%s) with prefix "%s" and suffix "%s"',
-                tag.name, tag.commit.hexsha, prefix, suffix
+                'Found current version tag %s (%s) with prefix "%s" and suffix "%s"',
+                tag.name, tag.commit_sha, matcher.prefix, matcher.suffix
             )
-            return tag
+            current_version_tag = tag
+
+        if reference_version_tag is not None and current_version_tag is not None:
+            return reference_version_tag, current_version_tag
 
     logger.debug(
         'Found no tags that have the prefix "%s" and suffix "%s" / "%s"',
-        prefix, suffix, reference_version_suffix
+        matcher.prefix, matcher.suffix, matcher.reference_version_suffix
     )
-    return None
+    return reference_version_tag, current_version_tag
 
 
-def get_new_commits(repo: git.Repo, tag: git.TagReference | None) -> list[git.Commit]:
-    """Get all commits newer than the specified tag."""
-    max_commits = 50
-    commit_offset = 0
-    reached_starting_tag = False
-    new_commits: list[git.Commit] = []
+def get_new_commits(session: GitSession, tag: GitTag | None, first_parent: bool = False) -> Iterator[CommitMessage]:
+    """
+    Lazily get all commits that are reachable from ``HEAD``, but not from the commit of the specified tag,
+    and that are not older than the commit of the tag.
 
-    while not reached_starting_tag:
-        try:
-            commits = repo.iter_commits(max_count=max_commits, skip=commit_offset)
-        except ValueError:
-            logger.warning('No commits found')
-            return []
+    The commits are walked like ``git log --max-age=<tag timestamp> <tag commit>..HEAD`` through the object reader of
+    the session, which stops as soon as only the history behind the tag is left instead of comparing every commit
+    with the tag. If the tag is on another branch, its history is excluded instead of walking the full history of
+    ``HEAD``.
 
-        i = 0
+    Commits older than the tag are still ignored, as before: when a version is promoted to the next release channel,
+    the commits that were cherry-picked onto that channel earlier are already part of the promoted version.
 
-        for commit in commits:
-            i += 1
+    :param first_parent: Only walk the first-parent chain of ``HEAD``, which skips the commits of merged branches.
+    """
+    if tag is None:
+        commits = iter_commit_messages(session, first_parent=first_parent)
+    else:
+        logger.debug('Collecting the commits since current version %s (%s)', tag.name, tag.commit_sha)
+        commits = iter_commit_messages(
+            session, exclude=tag.commit_sha, max_age=tag.committed_date, first_parent=first_parent
+        )
 
-            if tag is None:
-                logger.debug('Commit %s was found', commit.hexsha)
-                new_commits.append(commit)
-                continue
+    found_commits = False
 
-            if commit == tag.commit:
-                logger.debug(
-                    'Commit %s is current version %s (%s)',
-                    commit.hexsha, tag.name, tag.commit.hexsha
-                )
-                reached_starting_tag = True
-                break
+    for commit in commits:
+        found_commits = True
+        logger.debug('Commit %s was found', commit.hexsha)
+        yield commit
 
-            logger.debug(
-                'Commit %s is newer than current version %s (%s)',
-                commit.hexsha, tag.name, tag.commit.hexsha
-            )
-            new_commits.append(commit)
+    if not found_commits and tag is None:
+        logger.warning('No commits found')
 
-        commit_offset += max_commits
 
-        if i < max_commits:
-            logger.debug('Reached the end of the commit history')
-            break
+def parse_commit(commit_parser: AngularCommitParser, commit: CommitMessage) -> ParseResult:
+    """Parse a commit message without a ``git.Commit`` object, the parser only reads the message and the hash."""
+    return commit_parser.parse(cast(git.Commit, commit))
 
-    return new_commits
 
+def get_merge_body(commit: CommitMessage) -> CommitMessage:
+    """
+    Get the body of a merge commit as its message, e.g. the pull request title GitHub puts below the
+    ``Merge pull request #1 from ...`` subject. Other commits are returned as they are.
+    """
+    if len(commit.parents) < 2:
+        return commit
+
+    _, _, body = commit.message.partition('\n\n')
+    logger.debug('Parsing the body of merge commit %s', commit.hexsha)
+    return CommitMessage(hexsha=commit.hexsha, message=body.lstrip('\n'), parents=commit.parents)
 
-def analyze_commits(
-        repo: git.Repo,
-        current_version_tag: git.TagReference | None,
-        current_version: str | None
-) -> tuple[str, bool]:
-    """Determine the next version."""
-    # 1. Add all commits to a list until the commit with the current_version_tag is reached
-    new_commits = get_new_commits(repo, current_version_tag)
 
-    # 2. Apply conventional commits to the list
-    commit_parser = AngularCommitParser(AngularParserOptions())
-    parsing_results = [commit_parser.parse(commit) for commit in new_commits]
+def get_commit_bump(commit_parser: AngularCommitParser, commit: CommitMessage) -> int:
+    """Reduce the parsing result of the commit to an integer: 0 = chore / unknown, 1 = patch, 2 = minor, 3 = major."""
+    result = parse_commit(commit_parser, commit)
 
-    # 3. Check if the list contains major, minor or patch
-    # Reduce the parsing results to an integer: 0 = chore / unknown, 1 = patch, 2 = minor, 3 = major
-    commit_bumps = [
+    return (
         0 if isinstance(result, ParseError) else
         3 if result.bump == LevelBump.MAJOR else
         2 if result.bump == LevelBump.MINOR else
         1 if result.bump == LevelBump.PATCH else
         0
-        for result in parsing_results
-    ]
+    )
+
+
+def get_bump_function(
+        bump_classifier: str,
+        commit_types: CommitTypes = CommitTypes(),
+        squash_merge_entries: bool = False
+) -> Callable[[CommitMessage], int]:
+    """
+    Get the function that maps a commit to its version bump (see ``get_commit_bump``) for the ``bump_classifier``
+    input: the built-in ``CommitClassifier`` for ``fast`` or the ``AngularCommitParser`` for ``angular``.
+    Both determine the same bumps, but the ``CommitClassifier`` doesn't build the parse results.
+
+    :param commit_types: The commit types and their bumps. The ``AngularCommitParser`` only recognizes the default
+        breaking change footers.
+    :param squash_merge_entries: Also classify the entries of the body (see ``CommitClassifier.classify_entries``),
+        which is only supported by the ``CommitClassifier``.
+    """
+    if bump_classifier == 'angular':
+        if commit_types.breaking_footers != BREAKING_FOOTERS:
+            raise ValueError('The breaking change footers can only be configured for the "fast" bump classifier.')
+
+        if squash_merge_entries:
+            raise ValueError('The squash merge entries can only be classified by the "fast" bump classifier.')
+
+        return functools.partial(get_commit_bump, AngularCommitParser(AngularParserOptions(
+            allowed_tags=commit_types.allowed,
+            minor_tags=commit_types.minor,
+            patch_tags=commit_types.patch
+        )))
+
+    classifier = CommitClassifier(commit_types)
+
+    if squash_merge_entries:
+        return lambda commit: classifier.classify_entries(commit.message)
+
+    return lambda commit: classifier.classify(commit.message)
+
+
+def get_bump_cache_path(session: GitSession, inputs: Inputs, commit_types: CommitTypes = CommitTypes()) -> Path:
+    """
+    Get the path of the bump cache for the inputs and commit types that change the bump of a commit, so each
+    configuration of the commit parsing has its own cache. Runs for different versions and release channels share
+    the cache, so a commit is only classified once for all of them.
+    """
+    config = f'{inputs.bump_classifier}\t{inputs.parse_merge_bodies}\t{inputs.squash_merge_entries}\t{commit_types!r}'
+    return session.cache_dir / f'bumps-{hashlib.sha256(config.encode("utf-8")).hexdigest()[:16]}'
+
+
+def classify_commits(
+        commits: Iterable[CommitMessage],
+        inputs: Inputs,
+        cache: CommitCache,
+        workers: int | None = None,
+        commit_types: CommitTypes = CommitTypes()
+) -> Generator[tuple[str, int], None, None]:
+    """
+    Get the version bump of each commit (see ``get_bump_function`` and ``get_merge_body``) as a tuple of the hash
+    and the bump.
+
+    The bump of a commit never changes, so it is looked up in the cache first and only the commits whose bump isn't
+    cached yet are classified. The first ``parallel_threshold`` of them are classified in this process, the remaining
+    ones in chunks by a pool of worker processes (see ``ClassificationPool``). Their bumps are yielded in the order
+    of the chunks, when a chunk is done.
+
+    :param workers: The number of worker processes, defaults to the number of CPUs. With a single worker or a
+        ``parallel_threshold`` of 0, all commits are classified in this process.
+    :param commit_types: The commit types and their bumps (see ``CommitTypes``).
+    """
+    bump_function_args = (inputs.bump_classifier, commit_types, inputs.squash_merge_entries)
+    get_bump = get_bump_function(*bump_function_args)
+    workers = workers or get_worker_count()
+    parallel = inputs.parallel_threshold > 0 and workers > 1
+    classified = 0
+    pool = ClassificationPool(get_bump_function, bump_function_args, workers)
+
+    try:
+        for commit in commits:
+            cached = cache.get(commit.hexsha)
+
+            if cached is not None:
+                yield commit.hexsha, int(cached)
+                continue
+
+            if inputs.parse_merge_bodies:
+                commit = get_merge_body(commit)
+
+            if parallel and classified >= inputs.parallel_threshold:
+                bumps = pool.add(commit)
+            else:
+                classified += 1
+                bumps = [(commit.hexsha, get_bump(commit))]
+
+            for sha, bump in bumps:
+                cache.set(sha, str(bump))
+                yield sha, bump
+
+        for sha, bump in pool.drain():
+            cache.set(sha, str(bump))
+            yield sha, bump
+    finally:
+        pool.close()
+
+
+def get_version_to_bump(session: GitSession, current_version_tag: GitTag | None, inputs: Inputs) -> int:
+    """
+    Walk the commits newer than the current version tag and get their maximum bump as an integer:
+    0 = chore / unknown, 1 = patch, 2 = minor, 3 = major.
+
+    The walk is configured by the ``first_parent`` (see ``get_new_commits``), ``parse_merge_bodies``
+    (see ``get_merge_body``), ``ignore_cherry_picks`` (see ``find_cherry_picks``), ``bump_classifier`` and
+    ``squash_merge_entries`` (see ``get_bump_function``) inputs. The commit types are loaded once from the
+    ``commit_types_config`` file (see ``CommitTypes``).
+
+    The commits are classified by ``classify_commits``, which caches their bumps in the cache directory.
+    """
+    commit_types = CommitTypes.load(inputs.commit_types_config) if inputs.commit_types_config else CommitTypes()
+    cache = CommitCache(get_bump_cache_path(session, inputs, commit_types), BUMP_CACHE_HEADER)
+    check_cherry_picks = inputs.ignore_cherry_picks and current_version_tag is not None
+
+    # A major bump can't be exceeded, so the walk stops at the first one, unless every commit should be logged.
+    # Cherry-picks are only known after the walk, so a major bump of a cherry-pick could still be ignored.
+    stop_at_major = not logger.isEnabledFor(logging.DEBUG) and not check_cherry_picks
+
+    version_to_bump = 0
+    bumps: dict[str, int] = {}
+
+    commits = get_new_commits(session, current_version_tag, inputs.first_parent)
+
+    with contextlib.closing(classify_commits(commits, inputs, cache, commit_types=commit_types)) as commit_bumps:
+        for sha, bump in commit_bumps:
+            if check_cherry_picks:
+                # Only the hashes of the bumping commits are kept, their patch ids are compared after the walk.
+                if bump > 0:
+                    bumps[sha] = bump
+            else:
+                version_to_bump = max(version_to_bump, bump)
+
+                if version_to_bump == 3 and stop_at_major:
+                    break
+
+    cache.save()
+
+    if current_version_tag is not None and check_cherry_picks:
+        cherry_picks = find_cherry_picks(session, list(bumps), current_version_tag.commit_sha)
+
+        for sha in cherry_picks:
+            logger.debug('Ignoring commit %s, its changes are already in %s', sha, current_version_tag.name)
+
+        version_to_bump = max((bump for sha, bump in bumps.items() if sha not in cherry_picks), default=0)
+
+    return version_to_bump
+
+
+def analyze_commits(
+        session: GitSession,
+        current_version_tag: GitTag | None,
+        current_version: str | None,
+        inputs: Inputs | None = None
+) -> tuple[str, bool]:
+    """
+    Determine the next version.
+
+    :param inputs: The inputs that configure the walk over the commits (see ``get_version_to_bump``).
+        Defaults to the default inputs.
+    """
+    # 1. Walk the commits newer than the current_version_tag and apply conventional commits to each of them
+    # 2. The maximum bump of all commits is the version needed to be bumped
+    version_to_bump = get_version_to_bump(session, current_version_tag, inputs or Inputs())
 
-    # The maximum of the numbers in commit_bumps is the version needed to be bumped
-    version_to_bump = max(commit_bumps, default=0)
     logger.debug(
         'Version to bump is %s (0 = chore / unknown, 1 = patch, 2 = minor, 3 = major)',
         version_to_bump
     )
 
-    # 4. Bump the version
+    # 3. Bump the version
     current_version_obj = Version.parse(current_version or '0.0.0')
 
     if version_to_bump == 1:
@@ -187,7 +344,7 @@ def analyze_commits(
     return current_version or '0.0.0', False
 
 
-def get_next_version(inputs: Inputs, repo: git.Repo) -> GetNextVersionOutput:
+def get_next_version(inputs: Inputs, session: GitSession) -> GetNextVersionOutput:
     """
     Get the next version based on conventional commits and semantic versioning.
 
@@ -195,22 +352,14 @@ def get_next_version(inputs: Inputs, repo: git.Repo) -> GetNextVersionOutput:
     """
     # The reference version is the latest version, possibly on another branch / channel.
     # It is used to get the next version.
-    reference_version_tag = get_current_version(
-        repo,
-        inputs.prefix,
-        inputs.suffix,
-        inputs.bumping_suffix,
-        inputs.reference_version_suffix
-    )
-
     # The current version is the latest version on this branch / channel.
     # It is the version in the previous-version action output.
-    current_version_tag = get_current_version(
-        repo,
-        inputs.prefix,
-        inputs.suffix,
-        inputs.bumping_suffix,
-        None
+    # Both are resolved in the same scan over the tags.
+    reference_version_tag, current_version_tag = get_current_versions(
+        session,
+        TagNameMatcher.from_inputs(inputs),
+        inputs.only_reachable_tags,
+        get_semver_sort_key(inputs.prefix, inputs.bumping_suffix) if inputs.tag_ordering == 'semver' else None
     )
 
     current_version_tag_name = current_version_tag.name if current_version_tag is not None else None
@@ -227,7 +376,12 @@ def get_next_version(inputs: Inputs, repo: git.Repo) -> GetNextVersionOutput:
         if inputs.suffix is not None:
             reference_version = reference_version.replace(f'-{inputs.suffix}', '', 1)
 
-    next_version, version_bumped = analyze_commits(repo, reference_version_tag, reference_version)
+    next_version, version_bumped = analyze_commits(
+        session,
+        reference_version_tag,
+        reference_version,
+        inputs
+    )
 
     # No change that requires a semantic version increase
     if not version_bumped:
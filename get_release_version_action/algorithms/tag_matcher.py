@@ -0,0 +1,90 @@
+"""Classify tag names as reference and / or current version tags of a release channel."""
+from __future__ import annotations
+
+import re
+from enum import IntFlag
+
+from ..models import Inputs
+
+__all__ = [
+    'TagKind',
+    'TagNameMatcher'
+]
+
+
+class TagKind(IntFlag):
+    """The kinds of version tags a tag name can be. A tag name can be both kinds at the same time."""
+    NONE = 0
+    """The tag is irrelevant for the release channel."""
+
+    CURRENT = 1
+    """The tag is a version of the release channel (the version in the previous-version output)."""
+
+    REFERENCE = 2
+    """The tag is a version the next version can be based on (possibly from another release channel)."""
+
+
+class TagNameMatcher:
+    """
+    Classify tag names with a single anchored regular expression compiled once from the inputs.
+
+    A tag name is a current version tag if it starts with the prefix and
+
+    * contains the suffix, if a suffix is set, or
+    * has no dash or exactly one dash and contains the bumping suffix, if no suffix is set.
+
+    A tag name is a reference version tag if it starts with the prefix and
+
+    * is a current version tag, if no reference version suffix is set, or
+    * ends with the reference version suffix, or
+    * contains ``<suffix>-<bumping suffix>``, if a suffix is set, or
+    * has exactly one dash and contains ``-<bumping suffix>``, if no suffix is set.
+    """
+
+    def __init__(self, prefix: str, suffix: str | None, bumping_suffix: str, reference_version_suffix: str | None):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.bumping_suffix = bumping_suffix
+        self.reference_version_suffix = reference_version_suffix
+
+        bumping = re.escape(bumping_suffix)
+
+        if suffix is None:
+            current = rf'(?:(?=.*{bumping})[^-]*-[^-]*|[^-]*)$'
+        else:
+            current = rf'.*{re.escape(suffix)}'
+
+        if reference_version_suffix is None:
+            reference = current
+        elif suffix is None:
+            reference = rf'(?:.*{re.escape(reference_version_suffix)}$|(?=.*-{bumping})[^-]*-[^-]*$)'
+        else:
+            reference = rf'(?:.*{re.escape(reference_version_suffix)}$|.*{re.escape(suffix)}-{bumping})'
+
+        # Every kind is an optional lookahead at the start of the name, so one match call evaluates all of them.
+        self._pattern = re.compile(
+            rf'(?={re.escape(prefix)})(?:(?=(?P<current>{current})))?(?:(?=(?P<reference>{reference})))?',
+            flags=re.DOTALL
+        )
+
+    @classmethod
+    def from_inputs(cls, inputs: Inputs) -> TagNameMatcher:
+        """Compile the matcher for the release channel described by the inputs."""
+        return cls(inputs.prefix, inputs.suffix, inputs.bumping_suffix, inputs.reference_version_suffix)
+
+    def classify(self, tag_name: str) -> TagKind:
+        """Classify the tag name as reference and / or current version tag."""
+        match = self._pattern.match(tag_name)
+
+        if match is None:
+            return TagKind.NONE
+
+        kind = TagKind.NONE
+
+        if match.group('current') is not None:
+            kind |= TagKind.CURRENT
+
+        if match.group('reference') is not None:
+            kind |= TagKind.REFERENCE
+
+        return kind
@@ -0,0 +1,52 @@
+"""Order version tags by their semantic version precedence instead of the time of their commits."""
+import re
+
+from semver import Version
+
+from ..utils import GitTag, TagSortKey
+
+__all__ = [
+    'TAG_ORDERINGS',
+    'get_semver_sort_key',
+    'parse_version'
+]
+
+TAG_ORDERINGS = ('commit-date', 'semver')
+"""The possible values of the ``tag_ordering`` input."""
+
+
+def parse_version(version: str) -> Version | None:
+    """Parse a semantic version, or get ``None`` if it is not a valid semantic version."""
+    try:
+        return Version.parse(version)
+    except ValueError:
+        return None
+
+
+def get_semver_sort_key(prefix: str, bumping_suffix: str) -> TagSortKey:
+    """
+    Get a sort key that orders version tags by their semantic version precedence, highest version first.
+
+    The versions are compared by major, minor and patch version and then by the counter of the bumping suffix
+    (``1.0.0-hotfix.2`` is newer than ``1.0.0-hotfix.1``, which is newer than ``1.0.0``). Versions of different
+    release channels (``1.0.0-beta`` and ``1.0.0``) are equal, so the time of their commits breaks the tie.
+    Tags that are not a valid semantic version come after all versions, newest commit first.
+
+    :param prefix: The prefix of the version tags, which is removed before parsing the version.
+    :param bumping_suffix: The suffix whose counter is incremented for hotfixes.
+    """
+    counter_pattern = re.compile(rf'(?:^|-){re.escape(bumping_suffix)}\.(\d+)$')
+
+    def sort_key(tag: GitTag) -> tuple[int, ...]:
+        version = parse_version(tag.name.removeprefix(prefix))
+
+        if version is None:
+            return 1, 0, 0, 0, 0, -tag.committed_date
+
+        counter = counter_pattern.search(version.prerelease or '')
+        precedence = (version.major, version.minor, version.patch, int(counter.group(1)) if counter else 0)
+
+        # The highest version and the newest commit come first.
+        return 0, *(-part for part in precedence), -tag.committed_date
+
+    return sort_key
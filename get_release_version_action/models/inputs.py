@@ -46,6 +46,39 @@ class Inputs:
     mode: str = 'semantic'
     """The mode to use for determining the next version. Possible values: `semantic`, `hash-based`."""
 
+    only_reachable_tags: bool = False
+    """Only consider tags on commits that are reachable from `HEAD` when searching the previous version."""
+
+    tag_ordering: str = 'commit-date'
+    """How to order the version tags in `semantic` mode: `commit-date` (newest commit first) or `semver`."""
+
+    object_reader: str = 'git'
+    """How to read git objects: `git` (a `git cat-file` process) or `in-process` (from the pack files)."""
+
+    first_parent: bool = False
+    """Only analyze the first-parent chain of `HEAD`, which skips the commits of merged branches."""
+
+    parse_merge_bodies: bool = False
+    """Parse the body of merge commits instead of their subject, e.g. a pull request title."""
+
+    ignore_cherry_picks: bool = False
+    """Ignore commits whose changes are already in the history of the previous version, e.g. cherry-picks."""
+
+    bump_classifier: str = 'fast'
+    """How to classify commit messages: `fast` (built-in) or `angular` (the parser of `semantic_release`)."""
+
+    cache_dir: str | None = None
+    """The directory for the caches that are kept between runs. Use `NONE` for a directory inside `.git`."""
+
+    parallel_threshold: int = 0
+    """Classify the commits in worker processes above this number of unparsed commits. Use `0` to never do it."""
+
+    commit_types_config: str | None = None
+    """A YAML file that configures the commit types and their bumps (see the FAQ). Use `NONE` for the defaults."""
+
+    squash_merge_entries: bool = False
+    """Also classify every header in the body of a commit, e.g. the `* feat: ...` entries of a squash merge."""
+
     @classmethod
     def from_argparse(cls, args: argparse.Namespace) -> Inputs:
         """Convert the ``argparse`` Namespace into an inputs object."""
@@ -1,8 +1,22 @@
 """Utilities."""
+from .cache import CommitCache
 from .commands import run_command
 from .github_output import log_github_output, write_github_output
 from .logger import IndentLoggingFormatter, setup_logging
-from .git import create_git_tag, get_sorted_tags
+from .refs import TagRef, read_tag_refs
+from .commits import CommitMessage, iter_commit_messages
+from .session import OBJECT_READERS, GitSession
+from .patch_ids import find_cherry_picks
+from .git import (
+    GitTag,
+    TagNameFilter,
+    TagSortKey,
+    create_git_tag,
+    get_reachable_tag_names,
+    get_sorted_tags,
+    iter_tags_newest_first,
+    read_tags
+)
 
 __all__ = [
     'setup_logging',
@@ -10,6 +24,20 @@ __all__ = [
     'write_github_output',
     'log_github_output',
     'run_command',
+    'GitTag',
     'create_git_tag',
-    'get_sorted_tags'
+    'TagNameFilter',
+    'TagSortKey',
+    'read_tags',
+    'get_sorted_tags',
+    'get_reachable_tag_names',
+    'iter_tags_newest_first',
+    'TagRef',
+    'read_tag_refs',
+    'CommitMessage',
+    'iter_commit_messages',
+    'GitSession',
+    'OBJECT_READERS',
+    'find_cherry_picks',
+    'CommitCache'
 ]
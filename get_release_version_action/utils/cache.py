@@ -0,0 +1,147 @@
+"""Utilities for caches that persist between runs of the action."""
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+import git
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'CommitCache',
+    'get_cache_dir',
+    'read_cache_file',
+    'write_cache_file'
+]
+
+T = TypeVar('T')
+
+CACHE_DIRECTORY_NAME = 'get-release-version-action'
+"""The name of the cache directory inside the git directory."""
+
+MAX_CACHE_ENTRIES = 100_000
+"""The default maximum number of values of a ``CommitCache``, a few megabytes in memory and on disk."""
+
+
+def get_cache_dir(repo: git.Repo) -> Path:
+    """Get the directory for caches, which is inside the git directory shared by all worktrees."""
+    return Path(repo.common_dir) / CACHE_DIRECTORY_NAME
+
+
+def read_cache_file(path: Path, header: str, parse: Callable[[list[str]], T]) -> T | None:
+    """
+    Read a cache file whose first line is the header and parse the remaining lines.
+    Caches are optional, so a missing, unreadable, outdated (with another header) or malformed cache is ignored.
+
+    :param parse: Parses the lines after the header and raises an ``IndexError`` or ``ValueError`` if they are
+        malformed.
+    :returns: The parsed cache, or ``None`` if the cache is ignored.
+    """
+    try:
+        lines = path.read_text(encoding='utf-8').splitlines()
+    except FileNotFoundError:
+        logger.debug('No cache found at %s', path)
+        return None
+    except OSError:
+        logger.warning('Ignoring unreadable cache %s', path, exc_info=True)
+        return None
+
+    if not lines or lines[0] != header:
+        logger.debug('Ignoring cache %s with an unknown format', path)
+        return None
+
+    try:
+        return parse(lines[1:])
+    except (IndexError, ValueError):
+        logger.warning('Ignoring malformed cache %s', path, exc_info=True)
+        return None
+
+
+def write_cache_file(path: Path, content: str) -> None:
+    """
+    Atomically replace the cache file with the content.
+    Caches are optional, so errors are logged instead of raised.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent, delete=False) as fh:
+            fh.write(content)
+
+        os.replace(fh.name, path)
+    except OSError:
+        logger.warning('Could not write cache file %s', path, exc_info=True)
+
+
+class CommitCache:
+    """
+    An on-disk cache of a value per commit hash. A commit is immutable, so a value that is derived from the commit
+    (and a fixed configuration) never changes and has to be computed only once.
+
+    The cache holds at most ``max_entries`` values and drops the least recently used ones first, so its memory and
+    its file don't grow with the history. The values that are looked up or set in a run are the most recently used
+    ones, the commits a run walks first (the newest ones) before the later ones, as the next run walks them first
+    again. A run that walks more commits than the cache holds (e.g. the first run on a large history) only caches
+    the newest ones. The order of the values is only saved along with new values, so a warm run doesn't write the file.
+
+    The file starts with a header line, a file with another header (e.g. of an older format) is ignored.
+    Each following line is ``<commit sha>\t<value>``, from the least to the most recently used value.
+    """
+
+    def __init__(self, path: Path, header: str, max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        self.path = path
+        self.header = header
+        self.max_entries = max_entries
+        self._used: dict[str, str] = {}
+        """The values that were looked up or set in this run, in that order."""
+        self._unused: OrderedDict[str, str] = read_cache_file(path, header, self._parse) or OrderedDict()
+        """The values of the file that were not looked up yet, from the least to the most recently used."""
+        self._changed = False
+
+    def __len__(self) -> int:
+        return len(self._used) + len(self._unused)
+
+    def get(self, sha: str) -> str | None:
+        """Get the cached value of the commit, or ``None`` if it is not cached."""
+        value = self._used.get(sha)
+
+        if value is None:
+            value = self._unused.pop(sha, None)
+
+            if value is not None:
+                self._used[sha] = value
+
+        return value
+
+    def set(self, sha: str, value: str) -> None:
+        """Cache the value of the commit, unless the cache is full of the values of this run."""
+        self._unused.pop(sha, None)
+
+        if sha not in self._used and len(self) >= self.max_entries:
+            if not self._unused:
+                return
+
+            self._unused.popitem(last=False)
+
+        self._used[sha] = value
+        self._changed = True
+
+    def save(self) -> None:
+        """Write the values, if new values were set."""
+        if not self._changed:
+            return
+
+        lines = [self.header]
+        lines.extend(f'{sha}\t{value}' for sha, value in self._unused.items())
+        lines.extend(f'{sha}\t{value}' for sha, value in reversed(self._used.items()))
+
+        write_cache_file(self.path, '\n'.join(lines) + '\n')
+        self._changed = False
+
+    def _parse(self, lines: list[str]) -> OrderedDict[str, str]:
+        """Parse the lines of the file, the least recently used values beyond ``max_entries`` are dropped."""
+        return OrderedDict(line.split('\t', 1) for line in lines[-self.max_entries:])
@@ -0,0 +1,279 @@
+"""Read the parents, commit timestamps and generation numbers of commits from the commit-graph file of git."""
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from .oid_table import OidTable
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'CommitGraph'
+]
+
+SIGNATURE = b'CGPH'
+"""The first bytes of every commit-graph file."""
+
+HASH_SIZES = {1: 20, 2: 32}
+"""The size of an object hash for each hash version of the file header (SHA-1 and SHA-256)."""
+
+PARENT_NONE = 0x70000000
+"""The parent position of a commit without this parent."""
+
+PARENT_EXTRA_EDGES = 0x80000000
+"""Set on the second parent of an octopus merge, the other bits point into the extra edge list."""
+
+_HEADER = struct.Struct('>4sBBBB')
+_CHUNK_ENTRY = struct.Struct('>4sQ')
+_COMMIT_DATA = struct.Struct('>IIII')
+_EDGE = struct.Struct('>I')
+
+
+class CommitGraph:
+    """
+    The memory-mapped commit-graph of a repository, which git writes to ``objects/info/commit-graph`` or as a chain
+    of split files to ``objects/info/commit-graphs``.
+
+    The graph stores the parents, the commit timestamp and the generation number of every commit it contains in a
+    fixed binary layout, so a commit can be looked up without reading and inflating its object. Commits are addressed
+    by their position in the graph. Commits created after the graph was written are not in it and have to be read
+    from their objects instead.
+    """
+
+    def __init__(self, layers: list[_GraphLayer]) -> None:
+        self._layers = layers
+        """The layers of the graph, the base layer first."""
+
+    @classmethod
+    def open(cls, git_dir: str | os.PathLike[str]) -> CommitGraph | None:
+        """
+        Open the commit-graph of a repository, like git the single file is preferred over a chain of split files.
+
+        :param git_dir: The git directory shared by all worktrees (``git.Repo.common_dir``).
+        :returns: The graph, or ``None`` if the repository has no readable commit-graph or git would not use it,
+            because the history is changed by grafts, replace refs or a shallow clone.
+        """
+        git_dir = Path(git_dir)
+
+        if _has_rewritten_history(git_dir):
+            logger.debug('Not using the commit-graph, because the history of %s is rewritten', git_dir)
+            return None
+
+        info_dir = git_dir / 'objects' / 'info'
+        layers: list[_GraphLayer] = []
+
+        try:
+            layer = _GraphLayer.open(info_dir / 'commit-graph', layers)
+
+            if layer is not None:
+                layers.append(layer)
+            else:
+                for name in _read_chain(info_dir / 'commit-graphs' / 'commit-graph-chain'):
+                    layer = _GraphLayer.open(info_dir / 'commit-graphs' / f'graph-{name}.graph', layers)
+
+                    if layer is None:
+                        break
+
+                    layers.append(layer)
+        except (OSError, ValueError, struct.error):
+            logger.warning('Ignoring the unreadable commit-graph of %s', git_dir, exc_info=True)
+
+            for layer in layers:
+                layer.data.close()
+
+            layers = []
+
+        if not layers:
+            logger.debug('No commit-graph found in %s', info_dir)
+            return None
+
+        logger.debug('Using the commit-graph of %s with %s layers', git_dir, len(layers))
+        return cls(layers)
+
+    def close(self) -> None:
+        """Unmap the files of the graph."""
+        for layer in self._layers:
+            layer.data.close()
+
+        self._layers = []
+
+    def find(self, sha: str) -> int | None:
+        """Get the position of a commit in the graph, or ``None`` if the graph doesn't contain the commit."""
+        try:
+            oid = bytes.fromhex(sha)
+        except ValueError:
+            return None
+
+        for layer in reversed(self._layers):
+            position = layer.oids.find(oid)
+
+            if position is not None:
+                return layer.base_count + position
+
+        return None
+
+    def get_sha(self, position: int) -> str:
+        """Get the full hash of the commit at the position."""
+        layer = self._get_layer(position)
+        return layer.oids.get(position - layer.base_count).hex()
+
+    def get_parents(self, position: int) -> tuple[int, ...]:
+        """Get the positions of the parents of the commit at the position, in the order of the commit."""
+        layer = self._get_layer(position)
+        first, second, _, _ = layer.get_commit_data(position - layer.base_count)
+
+        if first == PARENT_NONE:
+            return ()
+
+        if second == PARENT_NONE:
+            return (first,)
+
+        if not second & PARENT_EXTRA_EDGES:
+            return first, second
+
+        return first, *layer.get_extra_edges(second & ~PARENT_EXTRA_EDGES)
+
+    def get_committed_date(self, position: int) -> int:
+        """Get the committer timestamp of the commit at the position, in seconds since the epoch."""
+        layer = self._get_layer(position)
+        _, _, generation_and_date, date = layer.get_commit_data(position - layer.base_count)
+        # The two lowest bits of the generation number are the two highest bits of the 34-bit timestamp.
+        return (generation_and_date & 0b11) << 32 | date
+
+    def get_generation(self, position: int) -> int:
+        """
+        Get the topological level of the commit at the position: 1 for root commits, otherwise one more than the
+        highest level of its parents. A commit can only reach commits with a lower level.
+        Graphs written by old versions of git have no levels, all commits have the level 0 then.
+        """
+        layer = self._get_layer(position)
+        _, _, generation_and_date, _ = layer.get_commit_data(position - layer.base_count)
+        return generation_and_date >> 2
+
+    def _get_layer(self, position: int) -> _GraphLayer:
+        """Get the layer that contains the commit at the position."""
+        for layer in reversed(self._layers):
+            if position >= layer.base_count:
+                return layer
+
+        raise IndexError(f'Position {position} is not in the commit-graph')
+
+
+class _GraphLayer:
+    """A single commit-graph file, which is a layer of the graph on top of the layers of its base files."""
+
+    def __init__(
+            self,
+            data: mmap.mmap,
+            hash_size: int,
+            chunks: dict[bytes, int],
+            base_count: int
+    ) -> None:
+        self.data = data
+        self.hash_size = hash_size
+        self.base_count = base_count
+        """The number of commits in the base layers, the positions of the commits of this layer start after them."""
+        self.oids = OidTable(data, chunks[b'OIDF'], chunks[b'OIDL'], hash_size)
+        """The sorted hashes of the commits of this layer."""
+        self.data_offset = chunks[b'CDAT']
+        self.edges_offset = chunks.get(b'EDGE')
+
+    @classmethod
+    def open(cls, path: Path, base_layers: list[_GraphLayer]) -> _GraphLayer | None:
+        """
+        Map a commit-graph file.
+
+        :param base_layers: The layers below this layer in the chain of split files.
+        :returns: The layer, or ``None`` if the file doesn't exist.
+        """
+        try:
+            with path.open('rb') as fh:
+                data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+        try:
+            signature, version, hash_version, chunk_count, base_graph_count = _HEADER.unpack_from(data)
+
+            if signature != SIGNATURE or version != 1 or hash_version not in HASH_SIZES:
+                raise ValueError(f'{path} is not a commit-graph file of version 1')
+
+            if base_graph_count != len(base_layers):
+                raise ValueError(f'{path} has {base_graph_count} base graphs, but {len(base_layers)} are below it')
+
+            chunks: dict[bytes, int] = dict(
+                _CHUNK_ENTRY.iter_unpack(data[_HEADER.size:_HEADER.size + chunk_count * _CHUNK_ENTRY.size])
+            )
+
+            missing = {b'OIDF', b'OIDL', b'CDAT'} - chunks.keys()
+
+            if missing:
+                raise ValueError(f'{path} has no {b", ".join(sorted(missing)).decode("ascii")} chunk')
+
+            return cls(data, HASH_SIZES[hash_version], chunks, sum(layer.count for layer in base_layers))
+        except Exception:
+            data.close()
+            raise
+
+    @property
+    def count(self) -> int:
+        """The number of commits in this layer."""
+        return self.oids.count
+
+    def get_commit_data(self, index: int) -> tuple[int, int, int, int]:
+        """
+        Get the commit data of the commit at the position within the layer, which follows the hash of its tree:
+        the positions of the first two parents, the generation number with the two highest bits of the timestamp
+        and the lower 32 bits of the timestamp.
+        """
+        return _COMMIT_DATA.unpack_from(self.data, self.data_offset + index * (self.hash_size + 16) + self.hash_size)
+
+    def get_extra_edges(self, index: int) -> list[int]:
+        """Get the parents after the first one of an octopus merge, the last one has the highest bit set."""
+        if self.edges_offset is None:
+            raise ValueError('The commit-graph has an octopus merge, but no extra edge list')
+
+        parents: list[int] = []
+
+        while True:
+            (parent,) = _EDGE.unpack_from(self.data, self.edges_offset + index * _EDGE.size)
+            parents.append(parent & ~PARENT_EXTRA_EDGES)
+
+            if parent & PARENT_EXTRA_EDGES:
+                return parents
+
+            index += 1
+
+
+def _read_chain(path: Path) -> list[str]:
+    """Read the hashes of the files of a split commit-graph, the base file first."""
+    try:
+        return path.read_text(encoding='ascii').split()
+    except FileNotFoundError:
+        return []
+
+
+def _has_rewritten_history(git_dir: Path) -> bool:
+    """
+    Check whether the parents of commits are changed by a shallow clone, grafts or replace refs.
+    Git ignores the commit-graph then, as it contains the parents of the commit objects.
+    """
+    if (git_dir / 'shallow').exists() or (git_dir / 'info' / 'grafts').exists():
+        return True
+
+    if any(files for _, _, files in os.walk(git_dir / 'refs' / 'replace')):
+        return True
+
+    try:
+        with (git_dir / 'packed-refs').open('rb') as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return False
+
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return data.find(b' refs/replace/') >= 0
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,505 @@
+"""
+Walk the commit history through the commit-graph and the object reader of a session without creating
+``git.Commit`` objects.
+"""
+import heapq
+import itertools
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+
+from .session import BATCH_SIZE, GitObject, GitSession
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+SLOP = 5
+"""The number of uninteresting commits git still visits after only uninteresting commits are left to visit."""
+
+__all__ = [
+    'CommitMessage',
+    'CommitNode',
+    'CommitObject',
+    'find_reachable_commits',
+    'iter_commit_messages',
+    'iter_commit_shas',
+    'parse_commit_message',
+    'parse_commit_object',
+    'read_commit_nodes',
+    'read_commits'
+]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CommitMessage:
+    """
+    The hash, the message and the parents of a commit, which is all that is needed to determine the version bump.
+    The attributes are named like the ones of ``git.Commit``, so commit parsers can read both.
+    """
+    hexsha: str
+    """The full hash of the commit."""
+
+    message: str
+    """The raw commit message, the subject line followed by the body."""
+
+    parents: tuple[str, ...] = ()
+    """The hashes of the parent commits, a merge commit has more than one."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CommitNode:
+    """The parts of a commit that are needed to walk the history, which the commit-graph contains as well."""
+    sha: str
+    """The full hash of the commit."""
+
+    parents: tuple[str, ...]
+    """The hashes of the parent commits."""
+
+    committed_date: int
+    """The committer timestamp, in seconds since the epoch."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CommitObject(CommitNode):
+    """A commit that was read from its object, which also has the author timestamp and the message."""
+    author_date: int
+    """The author timestamp, in seconds since the epoch."""
+
+    message: str
+    """The raw commit message, the subject line followed by the body."""
+
+
+def parse_commit_object(commit: GitObject) -> CommitObject:
+    """Parse the raw contents of a commit object."""
+    content = commit.content
+    header_end = content.find(b'\n\n')
+    header = content[:header_end] if header_end >= 0 else content
+    parents: list[str] = []
+    author_date = 0
+    committed_date = 0
+
+    for line in header.split(b'\n'):
+        # The author and committer lines end with "<timestamp> <timezone>".
+        if line.startswith(b'parent '):
+            parents.append(line[7:].decode('ascii'))
+        elif line.startswith(b'author '):
+            author_date = int(line.rsplit(b' ', 2)[1])
+        elif line.startswith(b'committer '):
+            committed_date = int(line.rsplit(b' ', 2)[1])
+
+    return CommitObject(
+        sha=commit.sha,
+        parents=tuple(parents),
+        committed_date=committed_date,
+        author_date=author_date,
+        message=parse_commit_message(commit)
+    )
+
+
+def parse_commit_message(commit: GitObject) -> str:
+    """Get the message from the raw contents of a commit object, decoded with the encoding of the commit."""
+    content = commit.content
+    header_end = content.find(b'\n\n')
+
+    if header_end < 0:
+        return ''
+
+    encoding = 'utf-8'
+    encoding_start = content.find(b'\nencoding ', 0, header_end)
+
+    if encoding_start >= 0:
+        encoding_end = content.find(b'\n', encoding_start + 1)
+        encoding = content[encoding_start + 10:encoding_end].decode('ascii')
+
+    try:
+        return content[header_end + 2:].decode(encoding, errors='replace')
+    except LookupError:
+        return content[header_end + 2:].decode('utf-8', errors='replace')
+
+
+def read_commits(session: GitSession, revs: Sequence[str]) -> list[CommitObject | None]:
+    """
+    Read the commits named by the revisions in one batch.
+    Revisions that don't name a commit (e.g. the missing parents of a shallow clone) are ``None``.
+    """
+    return [
+        parse_commit_object(commit) if commit is not None and commit.type == 'commit' else None
+        for commit in session.read_objects(revs)
+    ]
+
+
+def read_commit_nodes(session: GitSession, shas: Sequence[str]) -> list[CommitNode | None]:
+    """
+    Read the parents and commit timestamps of the commits.
+    Commits in the commit-graph are looked up there, the others are read from their objects in one batch.
+    Hashes that don't name a commit are ``None``.
+    """
+    graph = session.commit_graph
+
+    if graph is None:
+        return list(read_commits(session, shas))
+
+    nodes: list[CommitNode | None] = []
+    missing: list[int] = []
+
+    for sha in shas:
+        position = graph.find(sha)
+
+        if position is None:
+            missing.append(len(nodes))
+            nodes.append(None)
+        else:
+            nodes.append(CommitNode(
+                sha=sha,
+                parents=tuple(graph.get_sha(parent) for parent in graph.get_parents(position)),
+                committed_date=graph.get_committed_date(position)
+            ))
+
+    for index, commit in zip(missing, read_commits(session, [shas[index] for index in missing])):
+        nodes[index] = commit
+
+    return nodes
+
+
+def iter_commit_messages(
+        session: GitSession,
+        rev: str = 'HEAD',
+        exclude: str | None = None,
+        max_age: int | None = None,
+        first_parent: bool = False
+) -> Iterator[CommitMessage]:
+    """
+    Walk the history of ``rev`` in the order of ``git log`` (newest commit first) and yield the hashes and messages.
+    The history is walked through the commit-graph, if the repository has one, and only the messages of the yielded
+    commits are read through the object reader of the session, in batches.
+
+    Without ``exclude`` and ``max_age`` the commits are yielded while walking. Otherwise, the walk works like
+    ``git log --max-age=<max_age> <exclude>..<rev>``: the commits reachable from ``exclude`` and the commits older
+    than ``max_age`` (and their ancestors) are uninteresting. The walk stops as soon as only uninteresting commits are
+    left to visit and the interesting commits are yielded afterward, as an uninteresting commit can still be reached
+    through a commit that is visited later.
+
+    The memory of the walk grows with the number of walked commits (their hashes and parents), but only the messages
+    of one batch of commits are held at a time.
+
+    :param rev: The revision to start the walk at.
+    :param exclude: A revision whose history is excluded.
+    :param max_age: Exclude commits with a committer timestamp older than this timestamp.
+    :param first_parent: Only follow the first parent of interesting commits, like ``git log --first-parent``.
+        The side branches of merges are not walked then, but their commits can still be uninteresting.
+    """
+    yield from _read_messages(session, _walk_history(session, rev, exclude, max_age, first_parent))
+
+
+def iter_commit_shas(
+        session: GitSession,
+        rev: str = 'HEAD',
+        exclude: str | None = None,
+        max_age: int | None = None,
+        first_parent: bool = False
+) -> Iterator[str]:
+    """
+    Walk the history like ``iter_commit_messages`` and yield only the hashes, so the messages of the commits in the
+    commit-graph are never read.
+    """
+    for commit in _walk_history(session, rev, exclude, max_age, first_parent):
+        yield commit.sha
+
+
+def find_reachable_commits(session: GitSession, shas: Iterable[str], rev: str = 'HEAD') -> set[str] | None:
+    """
+    Get the commits that are reachable from ``rev`` through the commit-graph.
+
+    The commits outside the graph, which are newer than the graph, are read from their objects. Within the graph,
+    the walk skips all commits whose generation number is lower than the lowest one of the wanted commits,
+    as they can't reach any of them, and stops as soon as all wanted commits are found.
+
+    :param shas: The hashes of the wanted commits.
+    :returns: The hashes of the wanted commits that are reachable, or ``None`` if the repository has no
+        commit-graph or a wanted commit is not in it, so the generation numbers can't limit the walk.
+    """
+    graph = session.commit_graph
+
+    if graph is None:
+        return None
+
+    wanted: dict[int, str] = {}
+
+    for sha in shas:
+        position = graph.find(sha)
+
+        if position is None:
+            logger.debug('Commit %s is not in the commit-graph', sha)
+            return None
+
+        wanted[position] = sha
+
+    start = session.read_object(f'{rev}^{{commit}}')
+
+    if not wanted or start is None:
+        return set()
+
+    min_generation = min(graph.get_generation(position) for position in wanted)
+    stack = _enter_commit_graph(session, start.sha)
+    visited = set(stack)
+    found: set[str] = set()
+
+    while stack and len(found) < len(wanted):
+        position = stack.pop()
+
+        if position in wanted:
+            found.add(wanted[position])
+
+        for parent in graph.get_parents(position):
+            if parent not in visited and graph.get_generation(parent) >= min_generation:
+                visited.add(parent)
+                stack.append(parent)
+
+    logger.debug('Visited %s commits of the commit-graph to find %s reachable commits', len(visited), len(found))
+    return found
+
+
+def _walk_history(
+        session: GitSession,
+        rev: str,
+        exclude: str | None,
+        max_age: int | None,
+        first_parent: bool
+) -> Iterator[CommitNode]:
+    """Walk the commits of ``iter_commit_messages`` without their messages."""
+    start, *excluded = read_commits(session, [f'{rev}^{{commit}}', *([f'{exclude}^{{commit}}'] if exclude else [])])
+
+    if start is None:
+        logger.debug('Revision %s does not point to a commit', rev)
+        return
+
+    if exclude is None and max_age is None:
+        yield from _walk(session, start, first_parent)
+        return
+
+    yield from _walk_limited(session, start, excluded[0] if excluded else None, max_age, first_parent)
+
+
+def _enter_commit_graph(session: GitSession, sha: str) -> list[int]:
+    """
+    Walk the commits that were created after the commit-graph was written, starting at the given commit.
+
+    :returns: The positions of the commits of the graph where the walk enters it.
+    """
+    graph = session.commit_graph
+    assert graph is not None
+    pending = [sha]
+    seen = set(pending)
+    positions: list[int] = []
+
+    while pending:
+        outside = []
+
+        for current in pending:
+            position = graph.find(current)
+
+            if position is None:
+                outside.append(current)
+            else:
+                positions.append(position)
+
+        pending = []
+
+        for commit in read_commits(session, outside):
+            if commit is not None:
+                pending.extend(parent for parent in commit.parents if parent not in seen)
+                seen.update(commit.parents)
+
+    return positions
+
+
+def _read_messages(session: GitSession, commits: Iterator[CommitNode]) -> Iterator[CommitMessage]:
+    """
+    Add the messages to the walked commits. The messages of commits that were looked up in the commit-graph are
+    read in batches, so a caller that stops early doesn't read the messages of the remaining commits.
+    """
+    while batch := list(itertools.islice(commits, BATCH_SIZE)):
+        missing = [commit.sha for commit in batch if not isinstance(commit, CommitObject)]
+        messages = {
+            commit.sha: parse_commit_message(commit)
+            for commit in session.read_objects(missing) if commit is not None and commit.type == 'commit'
+        }
+
+        for commit in batch:
+            message = commit.message if isinstance(commit, CommitObject) else messages.get(commit.sha)
+
+            if message is None:
+                logger.debug('Skipping commit %s of the commit-graph, because its object does not exist', commit.sha)
+                continue
+
+            yield CommitMessage(hexsha=commit.sha, message=message, parents=commit.parents)
+
+
+def _walk(session: GitSession, start: CommitNode, first_parent: bool) -> Iterator[CommitNode]:
+    """Walk all ancestors (or the first-parent chain) of the start commit, newest first."""
+    # The counter keeps the insertion order of commits with the same timestamp and the commits are never compared.
+    counter = 0
+    queue = [(-start.committed_date, counter, start)]
+    seen = {start.sha}
+
+    while queue:
+        _, _, commit = heapq.heappop(queue)
+        yield commit
+
+        parents = commit.parents[:1] if first_parent else commit.parents
+        new_parents = [parent_sha for parent_sha in parents if parent_sha not in seen]
+        seen.update(new_parents)
+
+        for parent in read_commit_nodes(session, new_parents):
+            if parent is not None:
+                counter += 1
+                heapq.heappush(queue, (-parent.committed_date, counter, parent))
+
+
+def _walk_limited(
+        session: GitSession,
+        start: CommitNode,
+        excluded: CommitNode | None,
+        max_age: int | None,
+        first_parent: bool
+) -> Iterator[CommitNode]:
+    """Walk the ancestors of the start commit that are not ancestors of the excluded commit or too old."""
+    if excluded is not None and excluded.sha == start.sha:
+        return
+
+    walk = _LimitedWalk(session, max_age, first_parent)
+    walk.push(start, interesting=True)
+
+    if excluded is not None:
+        walk.push(excluded, interesting=False)
+
+    # The candidates are released while they are yielded, so the kept messages don't outlive their batch.
+    candidates = walk.run()
+    candidates.reverse()
+
+    while candidates:
+        candidate = candidates.pop()
+
+        if candidate.sha not in walk.uninteresting:
+            yield candidate
+
+
+def _without_message(commit: CommitNode) -> CommitNode:
+    """Drop the message of a commit that was read from its object."""
+    if isinstance(commit, CommitObject):
+        return CommitNode(sha=commit.sha, parents=commit.parents, committed_date=commit.committed_date)
+
+    return commit
+
+
+class _LimitedWalk:
+    """
+    The state of a walk with uninteresting commits, which follows ``limit_list`` of git.
+
+    This includes the few extra uninteresting commits git visits after only uninteresting commits are left to visit,
+    because a commit with a wrong timestamp can still mark visited commits as uninteresting.
+    """
+
+    def __init__(self, session: GitSession, max_age: int | None, first_parent: bool) -> None:
+        self.session = session
+        self.max_age = max_age
+        self.first_parent = first_parent
+        self.uninteresting: set[str] = set()
+        """The hashes of the uninteresting commits, candidates can become uninteresting later in the walk."""
+        # The counter keeps the insertion order of commits with the same timestamp and the commits are never compared.
+        self._counter = 0
+        self._queue: list[tuple[int, int, CommitNode]] = []
+        self._queued: set[str] = set()
+        self._seen: set[str] = set()
+        self._visited_parents: dict[str, tuple[str, ...]] = {}
+        self._interesting_queued = 0
+
+    def push(self, commit: CommitNode, interesting: bool) -> None:
+        """Add a commit to the commits to visit."""
+        self._counter += 1
+        heapq.heappush(self._queue, (-commit.committed_date, self._counter, commit))
+        self._queued.add(commit.sha)
+        self._seen.add(commit.sha)
+
+        if not interesting:
+            self.uninteresting.add(commit.sha)
+        elif commit.sha not in self.uninteresting:
+            self._interesting_queued += 1
+
+    def run(self) -> list[CommitNode]:
+        """
+        Visit the commits and get the candidates in the order they were visited.
+
+        Only the messages of the first ``BATCH_SIZE`` candidates are kept, which covers the usual range since a
+        release. The messages of later candidates are read again in batches when they are yielded, so the memory of
+        a huge range only grows with the number of its commits, not with the size of their messages.
+        """
+        candidates: list[CommitNode] = []
+        last_date = float('inf')
+        slop = SLOP
+
+        while self._queue:
+            commit = self._pop()
+
+            if commit.sha not in self.uninteresting:
+                last_date = commit.committed_date
+                candidates.append(commit if len(candidates) < BATCH_SIZE else _without_message(commit))
+                continue
+
+            # Keep going while interesting commits are left or the next commit is newer than the last candidate.
+            if self._interesting_queued > 0 or (self._queue and last_date <= -self._queue[0][0]):
+                slop = SLOP
+            elif not self._queue or slop == 1:
+                break
+            else:
+                slop -= 1
+
+        return candidates
+
+    def _pop(self) -> CommitNode:
+        """
+        Visit the next commit: mark its parents if it is uninteresting and add its unseen parents.
+        Like git, only the first parent of an interesting commit is added in first-parent mode, but all parents of an
+        uninteresting commit.
+        """
+        _, _, commit = heapq.heappop(self._queue)
+        self._queued.discard(commit.sha)
+        self._visited_parents[commit.sha] = commit.parents
+
+        if commit.sha not in self.uninteresting:
+            self._interesting_queued -= 1
+
+            if self.max_age is not None and commit.committed_date < self.max_age:
+                self.uninteresting.add(commit.sha)
+
+        parents = commit.parents
+
+        if commit.sha in self.uninteresting:
+            for parent_sha in parents:
+                self._mark_uninteresting(parent_sha)
+        elif self.first_parent:
+            parents = parents[:1]
+
+        new_parents = [parent_sha for parent_sha in parents if parent_sha not in self._seen]
+
+        for parent in read_commit_nodes(self.session, new_parents):
+            if parent is not None:
+                self.push(parent, interesting=True)
+
+        return commit
+
+    def _mark_uninteresting(self, sha: str) -> None:
+        """Mark the commit and all its visited ancestors as uninteresting."""
+        pending = [sha]
+
+        while pending:
+            current = pending.pop()
+
+            if current in self.uninteresting:
+                continue
+
+            self.uninteresting.add(current)
+
+            if current in self._queued:
+                self._interesting_queued -= 1
+
+            pending.extend(self._visited_parents.get(current, ()))
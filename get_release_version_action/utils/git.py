@@ -1,44 +1,186 @@
 """Utilities for working with git repositories."""
+import heapq
 import logging
+from collections.abc import Callable, Iterator
+from operator import attrgetter
+from typing import TypeAlias
 
-import git
-
-from .commands import run_command
+from .commits import find_reachable_commits, parse_commit_object
+from .refs import GitTag, TagRef
+from .session import GitSession
+from .tag_index import TagIndex
 
 logger = logging.getLogger('wemogy.get-release-version-action')
 
 __all__ = [
+    'GitTag',
+    'TagNameFilter',
+    'TagSortKey',
     'create_git_tag',
+    'get_reachable_tag_names',
     'get_sorted_tags',
+    'iter_tags_newest_first',
+    'read_tags',
     'tag_creation_history'
 ]
 
 tag_creation_history: list[str] = []
 
+TagNameFilter: TypeAlias = Callable[[str], bool]
+"""A filter for tag names, only tags whose name passes the filter are resolved to their commits."""
+
+TagSortKey: TypeAlias = Callable[[GitTag], tuple[int, ...]]
+"""A sort key for tags, the tag with the smallest key is the newest."""
+
+TAG_INDEX_FILE_NAME = 'tag-index'
+"""The file name of the tag index in the cache directory."""
 
-def create_git_tag(version: str, username: str, email: str) -> None:
+
+def create_git_tag(session: GitSession, version: str, username: str, email: str) -> None:
     """Create a new git tag for the given version and push it if a remote is configured."""
     logger.info('Setting git username and email to %s <%s>', username, email)
-    run_command('git', 'config', 'user.email', email)
-    run_command('git', 'config', 'user.name', username)
+
+    with session.repo.config_writer() as config:
+        config.set_value('user', 'email', email)
+        config.set_value('user', 'name', username)
 
     logger.info('Creating tag %s', version)
 
     # Create the tag
-    run_command('git', 'tag', '--annotate', '--message', f'Release {version}', version)
+    session.run('tag', '--annotate', '--message', f'Release {version}', version)
     tag_creation_history.append(version)
 
-    git_remote = run_command('git', 'remote', 'show')
-
-    if git_remote == '':
+    if not session.repo.remotes:
         logger.info('No remote found, skipping pushing')
         return
 
-    run_command('git', 'push', 'origin', version)
+    session.run('push', 'origin', version)
 
     logger.info('Pushed tag %s to remote', version)
 
 
-def get_sorted_tags(repo: git.Repo) -> list[git.TagReference]:
+def read_tags(
+        session: GitSession,
+        name_filter: TagNameFilter | None = None,
+        only_reachable: bool = False
+) -> list[GitTag]:
+    """
+    Get all tags of a repo in alphabetical order.
+    If ``only_reachable`` is true, tags on commits that are not reachable from ``HEAD`` are skipped.
+
+    First, the tag references are read directly from the ``packed-refs`` file and the loose refs, which doesn't
+    read any objects. Then, the tags that pass ``name_filter`` are resolved to their commits and the commit
+    timestamps are read through the object reader of the session.
+    Tags that do not point to a commit are skipped.
+
+    Both steps are backed by a ``TagIndex`` in the cache directory, so a run only reads what changed since the
+    previous run.
+
+    The reachability of the resolved tags is checked through the commit-graph (see ``find_reachable_commits``).
+    If the repository has no commit-graph or a tag is not in it, git checks all tags instead.
+    """
+    index = TagIndex(session.cache_dir / TAG_INDEX_FILE_NAME)
+    tags = index.read_tags(session.repo.common_dir, name_filter, lambda missing: _resolve_tags(session, missing))
+    index.save()
+
+    if not only_reachable:
+        return tags
+
+    reachable_commits = find_reachable_commits(session, {tag.commit_sha for tag in tags})
+
+    if reachable_commits is not None:
+        return [tag for tag in tags if tag.commit_sha in reachable_commits]
+
+    reachable_names = get_reachable_tag_names(session)
+    return [tag for tag in tags if tag.name in reachable_names]
+
+
+def get_reachable_tag_names(session: GitSession) -> set[str]:
+    """
+    Get the names of all tags on commits that are reachable from ``HEAD``.
+
+    All tags are checked by a single ``git for-each-ref --merged`` call, which uses the generation numbers of the
+    commit-graph file (if the repository has one) to stop walking the history early,
+    instead of running ``git merge-base --is-ancestor`` for each tag.
+    """
+    names = set(session.run('for-each-ref', '--merged=HEAD', '--format=%(refname:strip=2)', 'refs/tags').splitlines())
+    logger.debug('Found %s tags that are reachable from HEAD', len(names))
+    return names
+
+
+def _resolve_tags(session: GitSession, refs: list[TagRef]) -> list[GitTag]:
+    """Read the commits of the given tag references in one batch."""
+    # If the peeled hash is already known from the packed-refs file, the tag object is never read.
+    commits = session.read_objects([
+        ref.peeled_sha if ref.peeled_sha is not None else f'{ref.object_sha}^{{commit}}' for ref in refs
+    ])
+    tags: list[GitTag] = []
+
+    for ref, commit in zip(refs, commits):
+        if commit is None or commit.type != 'commit':
+            logger.debug('Skipping tag %s, because it does not point to a commit', ref.name)
+            continue
+
+        tags.append(GitTag(
+            name=ref.name,
+            commit_sha=commit.sha,
+            committed_date=parse_commit_object(commit).committed_date
+        ))
+
+    return tags
+
+
+def get_sorted_tags(session: GitSession) -> list[GitTag]:
     """Get all tags of a repo sorted by the time of the referenced commit, newest to oldest."""
-    return sorted(repo.tags, key=lambda t: t.commit.committed_datetime, reverse=True)
+    # The sort is stable, so tags of the same commit keep their alphabetical order.
+    # Sorting by the integer timestamp is faster than packing keys like the heap of iter_tags_newest_first does.
+    return sorted(read_tags(session), key=attrgetter('committed_date'), reverse=True)
+
+
+def iter_tags_newest_first(
+        session: GitSession,
+        name_filter: TagNameFilter | None = None,
+        only_reachable: bool = False,
+        sort_key: TagSortKey | None = None
+) -> Iterator[GitTag]:
+    """
+    Lazily yield all tags of a repo in the order of ``get_sorted_tags``, newest to oldest.
+    Only tags whose names pass ``name_filter`` (and that are reachable from ``HEAD``, if ``only_reachable`` is true)
+    are resolved and yielded.
+
+    The tags are kept in a heap, so building it costs O(n) and every yielded tag O(log n).
+    Callers that stop after the first matching tag don't pay for sorting the tags they never look at.
+
+    :param sort_key: Order the tags by this key instead of the commit timestamp, smallest key first.
+        Tags with the same key keep their alphabetical order.
+    """
+    tags = read_tags(session, name_filter, only_reachable)
+
+    if sort_key is not None:
+        keyed_heap = [(*sort_key(tag), position) for position, tag in enumerate(tags)]
+        heapq.heapify(keyed_heap)
+
+        while keyed_heap:
+            yield tags[heapq.heappop(keyed_heap)[-1]]
+
+        return
+
+    heap, mask = _get_sort_keys(tags)
+    heapq.heapify(heap)
+
+    while heap:
+        yield tags[heapq.heappop(heap) & mask]
+
+
+def _get_sort_keys(tags: list[GitTag]) -> tuple[list[int], int]:
+    """
+    Get an integer sort key for each tag, which orders the tags newest to oldest.
+
+    Each key packs the negated commit timestamp and the position of the tag in the alphabetically ordered list as
+    the tie-break, which is a lot cheaper to heapify than tuples or datetime objects.
+
+    :returns: The keys and the mask to get the position of the tag from a key.
+    """
+    shift = len(tags).bit_length()
+    keys = [(-tag.committed_date << shift) | position for position, tag in enumerate(tags)]
+    return keys, (1 << shift) - 1
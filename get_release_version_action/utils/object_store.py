@@ -0,0 +1,382 @@
+"""Read git objects directly from the pack files and the loose objects of a repository, without a git process."""
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+
+from .oid_table import OidTable
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'ObjectStore',
+    'apply_delta'
+]
+
+OBJECT_TYPES = {1: 'commit', 2: 'tree', 3: 'blob', 4: 'tag'}
+"""The object types of the pack entry headers, which are not deltas."""
+
+OFS_DELTA = 6
+"""The type of a pack entry that is a delta against the entry at a relative offset in the same pack."""
+
+REF_DELTA = 7
+"""The type of a pack entry that is a delta against the object with the given hash."""
+
+INDEX_SIGNATURE = b'\xfftOc'
+"""The first bytes of a pack index file of version 2 or later."""
+
+CHUNK_SIZE = 8192
+"""The number of compressed bytes that are passed to zlib at once."""
+
+DELTA_BASE_CACHE_SIZE = 256
+"""The number of delta bases that are kept in memory, deltas of the same commit often share their base."""
+
+MAX_DELTA_DEPTH = 10_000
+"""The maximum length of a delta chain, a longer chain is treated as a corrupt pack."""
+
+_OFFSET = struct.Struct('>I')
+_LARGE_OFFSET = struct.Struct('>Q')
+
+
+class ObjectStore:
+    """
+    The object database of a repository, read in-process from the memory-mapped pack files (``objects/pack``)
+    and the loose objects (``objects/xx/...``).
+
+    Deltified pack entries are resolved against their base objects, which are kept in a small cache.
+    Objects that are stored elsewhere (e.g. in the object database of an alternate repository) are not found.
+    """
+
+    def __init__(self, objects_dir: Path, packs: list[_Pack], hash_size: int) -> None:
+        self.objects_dir = objects_dir
+        self.hash_size = hash_size
+        self._packs = packs
+        self._delta_bases: dict[tuple[int, int], tuple[int, bytes]] = {}
+
+    @classmethod
+    def open(cls, git_dir: str | os.PathLike[str], hash_size: int = 20) -> ObjectStore:
+        """
+        Map the pack files of a repository. Packs with an unreadable or unsupported index are skipped.
+
+        :param git_dir: The git directory shared by all worktrees (``git.Repo.common_dir``).
+        :param hash_size: The size of an object hash, 20 for SHA-1 and 32 for SHA-256 repositories.
+        """
+        objects_dir = Path(git_dir) / 'objects'
+        packs: list[_Pack] = []
+
+        for index_path in sorted((objects_dir / 'pack').glob('pack-*.idx')):
+            try:
+                pack = _Pack.open(index_path, hash_size)
+            except (OSError, ValueError, struct.error):
+                logger.warning('Ignoring the unreadable pack %s', index_path, exc_info=True)
+                continue
+
+            if pack is not None:
+                packs.append(pack)
+
+        logger.debug('Reading objects from %s packs in %s', len(packs), objects_dir)
+        return cls(objects_dir, packs, hash_size)
+
+    def close(self) -> None:
+        """Unmap the pack files."""
+        for pack in self._packs:
+            pack.close()
+
+        self._packs = []
+        self._delta_bases.clear()
+
+    def read(self, sha: str) -> tuple[str, bytes] | None:
+        """
+        Read an object.
+
+        :returns: The type and the raw contents of the object, or ``None`` if it is not in the store.
+        :raises ValueError: If the object is stored, but corrupt.
+        """
+        try:
+            oid = bytes.fromhex(sha)
+        except ValueError:
+            return None
+
+        if len(oid) != self.hash_size:
+            return None
+
+        for pack_index, pack in enumerate(self._packs):
+            index = pack.oids.find(oid)
+
+            if index is not None:
+                type_id, content = self._read_packed(pack_index, pack.get_offset(index))
+                return OBJECT_TYPES[type_id], content
+
+        return self._read_loose(sha)
+
+    def _read_loose(self, sha: str) -> tuple[str, bytes] | None:
+        """Read a loose object, which is a zlib-compressed file with a ``<type> <size>\\0`` header."""
+        try:
+            data = zlib.decompress((self.objects_dir / sha[:2] / sha[2:]).read_bytes())
+        except FileNotFoundError:
+            return None
+        except zlib.error as exc:
+            raise ValueError(f'Loose object {sha} is corrupt') from exc
+
+        header_end = data.index(b'\0')
+        object_type, size = data[:header_end].split(b' ')
+
+        if int(size) != len(data) - header_end - 1:
+            raise ValueError(f'Loose object {sha} has the wrong size')
+
+        return object_type.decode('ascii'), data[header_end + 1:]
+
+    def _read_packed(self, pack_index: int, offset: int) -> tuple[int, bytes]:
+        """Read the pack entry at the offset and resolve its delta chain."""
+        pack = self._packs[pack_index]
+        deltas: list[bytes] = []
+        base_key: tuple[int, int] | None = None
+
+        while True:
+            base_key = (pack_index, offset)
+            cached = self._delta_bases.get(base_key)
+
+            if cached is not None:
+                type_id, content = cached
+                break
+
+            type_id, size, data_offset, base = pack.read_entry_header(offset)
+
+            if type_id in OBJECT_TYPES:
+                content = pack.inflate(data_offset, size)
+                break
+
+            if len(deltas) >= MAX_DELTA_DEPTH:
+                raise ValueError(f'The delta chain at offset {offset} of {pack.path} is too long')
+
+            deltas.append(pack.inflate(data_offset, size))
+
+            if type_id == OFS_DELTA:
+                assert isinstance(base, int)
+                offset = base
+            else:
+                assert isinstance(base, bytes)
+                base_index = pack.oids.find(base)
+
+                if base_index is not None:
+                    offset = pack.get_offset(base_index)
+                    continue
+
+                # The base of a delta is usually in the same pack, only thin packs refer to other packs.
+                base_object = self.read(base.hex())
+
+                if base_object is None:
+                    raise ValueError(f'The delta base {base.hex()} of {pack.path} does not exist')
+
+                type_id = next(key for key, value in OBJECT_TYPES.items() if value == base_object[0])
+                content = base_object[1]
+                base_key = None
+                break
+
+        if deltas and base_key is not None:
+            self._cache_delta_base(base_key, type_id, content)
+
+        for delta in reversed(deltas):
+            content = apply_delta(content, delta)
+
+        return type_id, content
+
+    def _cache_delta_base(self, key: tuple[int, int], type_id: int, content: bytes) -> None:
+        """Remember a delta base by its pack and offset, the oldest base is dropped when the cache is full."""
+        if len(self._delta_bases) >= DELTA_BASE_CACHE_SIZE:
+            del self._delta_bases[next(iter(self._delta_bases))]
+
+        self._delta_bases[key] = (type_id, content)
+
+
+class _Pack:
+    """A memory-mapped pack file and its index of version 2."""
+
+    def __init__(self, path: Path, pack: mmap.mmap, index: mmap.mmap, hash_size: int) -> None:
+        self.path = path
+        self.pack = pack
+        self.index = index
+        self.oids = OidTable(index, 8, 8 + 256 * 4, hash_size)
+        """The sorted hashes of the objects in the pack."""
+        # The names are followed by a CRC32 and a 32-bit offset per object, and then the 64-bit offsets.
+        self._offsets_offset = self.oids.names_offset + self.oids.count * (hash_size + 4)
+        self._large_offsets_offset = self._offsets_offset + self.oids.count * 4
+        self._view = memoryview(pack)
+
+    @classmethod
+    def open(cls, index_path: Path, hash_size: int) -> _Pack | None:
+        """
+        Map a pack index and its pack file.
+
+        :returns: The pack, or ``None`` if the pack file doesn't exist (e.g. because it is still being written).
+        """
+        pack_path = index_path.with_suffix('.pack')
+
+        try:
+            with index_path.open('rb') as index_fh, pack_path.open('rb') as pack_fh:
+                index = mmap.mmap(index_fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+                try:
+                    pack = mmap.mmap(pack_fh.fileno(), 0, access=mmap.ACCESS_READ)
+                except BaseException:
+                    index.close()
+                    raise
+        except FileNotFoundError:
+            return None
+
+        try:
+            if index[:4] != INDEX_SIGNATURE or index[4:8] != b'\0\0\0\2' or pack[:4] != b'PACK':
+                raise ValueError(f'{index_path} is not a pack index of version 2')
+
+            return cls(pack_path, pack, index, hash_size)
+        except BaseException:
+            index.close()
+            pack.close()
+            raise
+
+    def close(self) -> None:
+        """Unmap the pack and its index."""
+        self._view.release()
+        self.pack.close()
+        self.index.close()
+
+    def get_offset(self, index: int) -> int:
+        """Get the offset of the entry of the object at the index in the pack file."""
+        (offset,) = _OFFSET.unpack_from(self.index, self._offsets_offset + index * 4)
+
+        if offset & 0x80000000:
+            (offset,) = _LARGE_OFFSET.unpack_from(self.index, self._large_offsets_offset + (offset & 0x7fffffff) * 8)
+
+        return int(offset)
+
+    def read_entry_header(self, offset: int) -> tuple[int, int, int, int | bytes | None]:
+        """
+        Read the header of the pack entry at the offset.
+
+        :returns: The type, the inflated size, the offset of the compressed data and the base of a delta:
+            the offset of the base entry for ``OFS_DELTA`` and the hash of the base object for ``REF_DELTA``.
+        """
+        pack = self.pack
+        byte = pack[offset]
+        type_id = (byte >> 4) & 0b111
+        size = byte & 0b1111
+        shift = 4
+        position = offset + 1
+
+        while byte & 0x80:
+            byte = pack[position]
+            size |= (byte & 0x7f) << shift
+            shift += 7
+            position += 1
+
+        if type_id == OFS_DELTA:
+            byte = pack[position]
+            distance = byte & 0x7f
+            position += 1
+
+            while byte & 0x80:
+                byte = pack[position]
+                distance = ((distance + 1) << 7) | (byte & 0x7f)
+                position += 1
+
+            return type_id, size, position, offset - distance
+
+        if type_id == REF_DELTA:
+            hash_size = self.oids.hash_size
+            return type_id, size, position + hash_size, pack[position:position + hash_size]
+
+        if type_id not in OBJECT_TYPES:
+            raise ValueError(f'Unknown type {type_id} of the entry at offset {offset} of {self.path}')
+
+        return type_id, size, position, None
+
+    def inflate(self, offset: int, size: int) -> bytes:
+        """
+        Decompress the zlib stream at the offset. The stream is passed to zlib in chunks, so zlib doesn't copy the
+        rest of the pack file as unused data.
+        """
+        decompressor = zlib.decompressobj()
+        chunks: list[bytes] = []
+
+        try:
+            while not decompressor.eof:
+                chunk = self._view[offset:offset + CHUNK_SIZE]
+
+                if not chunk:
+                    raise ValueError(f'The entry at offset {offset} of {self.path} is truncated')
+
+                chunks.append(decompressor.decompress(chunk))
+                offset += len(chunk)
+        except zlib.error as exc:
+            raise ValueError(f'The entry at offset {offset} of {self.path} is corrupt') from exc
+
+        content = b''.join(chunks)
+
+        if len(content) != size:
+            raise ValueError(f'The entry at offset {offset} of {self.path} has the wrong size')
+
+        return content
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """
+    Apply a git delta to its base object. The delta starts with the sizes of the base and the result, followed by
+    instructions that either copy a range of the base or insert the bytes that follow the instruction.
+    """
+    base_size, position = _read_delta_size(delta, 0)
+    result_size, position = _read_delta_size(delta, position)
+
+    if base_size != len(base):
+        raise ValueError(f'The delta expects a base of {base_size} bytes, but the base has {len(base)} bytes')
+
+    result = bytearray()
+
+    while position < len(delta):
+        instruction = delta[position]
+        position += 1
+
+        if instruction & 0x80:
+            # The lower 7 bits select which bytes of the little-endian offset (4 bytes) and size (3 bytes) follow.
+            copy_offset = 0
+            copy_size = 0
+
+            for i in range(4):
+                if instruction & (1 << i):
+                    copy_offset |= delta[position] << (8 * i)
+                    position += 1
+
+            for i in range(3):
+                if instruction & (0x10 << i):
+                    copy_size |= delta[position] << (8 * i)
+                    position += 1
+
+            result += base[copy_offset:copy_offset + (copy_size or 0x10000)]
+        elif instruction:
+            result += delta[position:position + instruction]
+            position += instruction
+        else:
+            raise ValueError('The delta contains the reserved instruction 0')
+
+    if len(result) != result_size:
+        raise ValueError(f'The delta should result in {result_size} bytes, but resulted in {len(result)} bytes')
+
+    return bytes(result)
+
+
+def _read_delta_size(delta: bytes, position: int) -> tuple[int, int]:
+    """Read a size at the start of a delta, which is stored in little-endian groups of 7 bits."""
+    size = 0
+    shift = 0
+
+    while True:
+        byte = delta[position]
+        size |= (byte & 0x7f) << shift
+        shift += 7
+        position += 1
+
+        if not byte & 0x80:
+            return size, position
@@ -0,0 +1,54 @@
+"""Look up object hashes in the sorted hash tables of the binary files of git."""
+import mmap
+import struct
+
+__all__ = [
+    'OidTable'
+]
+
+_FANOUT = struct.Struct('>256I')
+
+
+class OidTable:
+    """
+    A sorted table of object hashes with a fanout table, as stored in pack index and commit-graph files.
+    The fanout table contains the number of hashes whose first byte is less than or equal to its index, so a lookup
+    only has to binary search the hashes with the same first byte.
+    """
+
+    def __init__(self, data: mmap.mmap, fanout_offset: int, names_offset: int, hash_size: int) -> None:
+        self.data = data
+        self.names_offset = names_offset
+        self.hash_size = hash_size
+        self.fanout: tuple[int, ...] = _FANOUT.unpack_from(data, fanout_offset)
+
+    @property
+    def count(self) -> int:
+        """The number of hashes in the table."""
+        return self.fanout[255]
+
+    def find(self, oid: bytes) -> int | None:
+        """Get the index of the hash in the table, or ``None`` if the table doesn't contain it."""
+        if len(oid) != self.hash_size:
+            return None
+
+        low = self.fanout[oid[0] - 1] if oid[0] > 0 else 0
+        high = self.fanout[oid[0]]
+
+        while low < high:
+            middle = (low + high) // 2
+            current = self.get(middle)
+
+            if current < oid:
+                low = middle + 1
+            elif current > oid:
+                high = middle
+            else:
+                return middle
+
+        return None
+
+    def get(self, index: int) -> bytes:
+        """Get the hash at the index."""
+        start = self.names_offset + index * self.hash_size
+        return self.data[start:start + self.hash_size]
@@ -0,0 +1,127 @@
+"""Recognize cherry-picked commits by the patch ids of their changes, which are cached between runs."""
+import logging
+import subprocess
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from .cache import CommitCache
+from .commits import iter_commit_shas, read_commits
+from .session import GitSession
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'PatchIdCache',
+    'find_cherry_picks',
+    'get_patch_ids'
+]
+
+CACHE_HEADER = 'get-release-version-action patch id cache v1'
+"""The first line of the cache file, a cache with another header is ignored."""
+
+PATCH_ID_CACHE_FILE_NAME = 'patch-ids'
+"""The file name of the patch id cache in the cache directory."""
+
+
+class PatchIdCache(CommitCache):
+    """
+    An on-disk cache of the patch ids of commits, so the patch id of a commit (which means diffing the commit against
+    its parent) is computed only once.
+
+    Commits without a patch id (merges and commits without changes) are stored with an empty patch id.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, CACHE_HEADER)
+
+    def get_patch_ids(self, session: GitSession, shas: Sequence[str]) -> dict[str, str]:
+        """
+        Get the patch ids of the commits, the ones that are not in the cache yet are computed by git.
+
+        :returns: The patch id of every commit that has one.
+        """
+        patch_ids = {sha: self.get(sha) for sha in shas}
+        missing = [sha for sha, patch_id in patch_ids.items() if patch_id is None]
+
+        if missing:
+            logger.debug('Computing the patch ids of %s of %s commits', len(missing), len(patch_ids))
+            computed = compute_patch_ids(session, missing)
+
+            for sha in missing:
+                patch_id = computed.get(sha, '')
+                patch_ids[sha] = patch_id
+                self.set(sha, patch_id)
+
+        return {sha: patch_id for sha, patch_id in patch_ids.items() if patch_id}
+
+
+def compute_patch_ids(session: GitSession, shas: Sequence[str]) -> dict[str, str]:
+    """
+    Compute the patch ids of the commits with ``git diff-tree --stdin -p | git patch-id --stable``, so all commits
+    are diffed by two processes. The hashes are passed through a file, so git can't wait for the session to read
+    its output while the session still writes the hashes.
+
+    :returns: The patch id of every commit that has one.
+    """
+    with tempfile.TemporaryFile('w+b') as shas_file:
+        shas_file.write(''.join(f'{sha}\n' for sha in shas).encode('ascii'))
+        shas_file.seek(0)
+
+        session.spawned_processes += 2
+
+        with subprocess.Popen(
+            ['git', f'--git-dir={session.repo.git_dir}', 'diff-tree', '--stdin', '-p', '--root'],
+            stdin=shas_file,
+            stdout=subprocess.PIPE
+        ) as diff_tree, subprocess.Popen(
+            ['git', f'--git-dir={session.repo.git_dir}', 'patch-id', '--stable'],
+            stdin=diff_tree.stdout,
+            stdout=subprocess.PIPE
+        ) as patch_id:
+            assert diff_tree.stdout is not None
+            # Only patch-id reads the diff, so diff-tree gets a SIGPIPE if patch-id exits early.
+            diff_tree.stdout.close()
+            output, _ = patch_id.communicate()
+
+    if diff_tree.returncode != 0 or patch_id.returncode != 0:
+        raise subprocess.CalledProcessError(diff_tree.returncode or patch_id.returncode, 'git diff-tree | git patch-id')
+
+    # Each line is "<patch id> <commit hash>".
+    return {sha: patch_id for patch_id, sha in (line.split() for line in output.decode('ascii').splitlines())}
+
+
+def get_patch_ids(session: GitSession, shas: Sequence[str]) -> dict[str, str]:
+    """Get the patch ids of the commits through the ``PatchIdCache`` in the cache directory (see ``PatchIdCache``)."""
+    cache = PatchIdCache(session.cache_dir / PATCH_ID_CACHE_FILE_NAME)
+    patch_ids = cache.get_patch_ids(session, shas)
+    cache.save()
+    return patch_ids
+
+
+def find_cherry_picks(session: GitSession, shas: Sequence[str], upstream: str) -> set[str]:
+    """
+    Get the commits whose changes are already contained in the history of ``upstream``, because they were
+    cherry-picked from or onto it. Two commits contain the same changes if they have the same patch id.
+
+    A cherry-pick keeps the author timestamp of the original commit and both commits are committed after it, so only
+    the commits of ``upstream`` that are not older than the oldest author timestamp of the commits are compared.
+
+    :param shas: The commits to check, which must not be reachable from ``upstream``.
+    :param upstream: The revision whose history is searched for the changes of the commits.
+    """
+    if not shas:
+        return set()
+
+    author_dates = [commit.author_date for commit in read_commits(session, shas) if commit is not None]
+
+    if not author_dates:
+        return set()
+
+    upstream_shas = list(iter_commit_shas(session, upstream, max_age=min(author_dates)))
+    logger.debug('Comparing the patch ids of %s commits with %s commits of %s', len(shas), len(upstream_shas), upstream)
+
+    patch_ids = get_patch_ids(session, [*shas, *upstream_shas])
+    upstream_patch_ids = {patch_ids[sha] for sha in upstream_shas if sha in patch_ids}
+
+    return {sha for sha in shas if patch_ids.get(sha) in upstream_patch_ids}
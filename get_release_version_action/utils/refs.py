@@ -0,0 +1,145 @@
+"""Read the tag references of a git repository directly from the ``packed-refs`` file and the loose refs."""
+import logging
+import mmap
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'GitTag',
+    'SHA_PATTERN',
+    'TagRef',
+    'get_packed_refs_state',
+    'read_loose_tag_refs',
+    'read_packed_tag_refs',
+    'read_tag_refs'
+]
+
+_SHA_REGEX = '(?:[0-9a-f]{40}|[0-9a-f]{64})'
+
+SHA_PATTERN = re.compile(_SHA_REGEX)
+"""A full object hash, SHA-1 or SHA-256. Use ``fullmatch``, as it also matches the beginning of longer strings."""
+
+_PACKED_TAG_PATTERN = re.compile(
+    rf'^({_SHA_REGEX}) refs/tags/([^\n]+)\n(?:\^({_SHA_REGEX})\n)?'.encode('ascii'),
+    re.MULTILINE
+)
+"""A tag line in the ``packed-refs`` file, optionally followed by the peeled line of an annotated tag."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class GitTag:
+    """
+    A git tag, peeled to the commit it points to.
+    The record has slots instead of a ``__dict__``, as a repository can have a lot of tags.
+    """
+    name: str
+    """The name of the tag, without the ``refs/tags/`` prefix."""
+
+    commit_sha: str
+    """The full hash of the commit the tag points to."""
+
+    committed_date: int
+    """The committer timestamp of the commit the tag points to, in seconds since the epoch."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TagRef:
+    """A tag reference as stored in the repository, not yet resolved to a commit."""
+    name: str
+    """The name of the tag, without the ``refs/tags/`` prefix."""
+
+    object_sha: str
+    """The hash of the object the reference points to (a commit or an annotated tag object)."""
+
+    peeled_sha: str | None
+    """
+    The hash of the object the tag points to after peeling annotated tags,
+    or ``None`` if it is not known without reading the tag object.
+    """
+
+
+def read_tag_refs(common_dir: str | os.PathLike[str]) -> list[TagRef]:
+    """
+    Read all tag references in alphabetical order without reading any objects.
+
+    Packed tags are read from the memory-mapped ``packed-refs`` file, which also contains the peeled hashes of
+    annotated tags (the ``^<sha>`` lines), if the file was written with the ``peeled`` trait.
+    Loose tags in ``refs/tags`` take precedence over packed tags, their peeled hashes are unknown.
+
+    :param common_dir: The git directory shared by all worktrees (``git.Repo.common_dir``).
+    """
+    refs = read_packed_tag_refs(common_dir)
+    refs.update(read_loose_tag_refs(common_dir))
+    return [refs[name] for name in sorted(refs)]
+
+
+def get_packed_refs_state(common_dir: str | os.PathLike[str]) -> str:
+    """
+    Get a string that changes whenever the ``packed-refs`` file changes.
+    Git always replaces the file by renaming a new file, so the inode, size and modification time identify it.
+    """
+    try:
+        stat = os.stat(Path(common_dir) / 'packed-refs')
+    except FileNotFoundError:
+        return 'none'
+
+    return f'{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}'
+
+
+def read_packed_tag_refs(common_dir: str | os.PathLike[str]) -> dict[str, TagRef]:
+    """Read the tags of the ``packed-refs`` file."""
+    path = Path(common_dir) / 'packed-refs'
+    refs: dict[str, TagRef] = {}
+
+    try:
+        with path.open('rb') as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return refs
+
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header = data.readline()
+                # Without the peeled trait, a tag without a peeled line can still be an annotated tag.
+                peeled_known = header.startswith(b'# pack-refs with:') and b' peeled' in header
+
+                for match in _PACKED_TAG_PATTERN.finditer(data):
+                    object_sha = match.group(1).decode('ascii')
+                    peeled_sha = match.group(3)
+                    name = match.group(2).decode('utf-8')
+
+                    refs[name] = TagRef(
+                        name=name,
+                        object_sha=object_sha,
+                        peeled_sha=peeled_sha.decode('ascii') if peeled_sha is not None else
+                        object_sha if peeled_known else None
+                    )
+    except FileNotFoundError:
+        logger.debug('No packed-refs file found at %s', path)
+
+    return refs
+
+
+def read_loose_tag_refs(common_dir: str | os.PathLike[str]) -> dict[str, TagRef]:
+    """Read the loose tags, which are files in the ``refs/tags`` directory containing the object hash."""
+    tags_dir = Path(common_dir) / 'refs' / 'tags'
+    refs: dict[str, TagRef] = {}
+
+    for directory, _, file_names in os.walk(tags_dir):
+        for file_name in file_names:
+            if file_name.endswith('.lock'):
+                continue
+
+            path = Path(directory, file_name)
+            name = path.relative_to(tags_dir).as_posix()
+            content = path.read_text(encoding='ascii', errors='replace').strip()
+
+            if SHA_PATTERN.fullmatch(content) is None:
+                logger.debug('Skipping loose tag %s, because it is not a direct reference: %s', name, content)
+                continue
+
+            refs[name] = TagRef(name=name, object_sha=content, peeled_sha=None)
+
+    return refs
@@ -0,0 +1,256 @@
+"""A session with a git repository, which shares one object reader process between all reads of a run."""
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import zlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+import git
+
+from .cache import get_cache_dir
+from .commands import run_command
+from .commit_graph import CommitGraph
+from .object_store import ObjectStore
+from .refs import SHA_PATTERN
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'OBJECT_READERS',
+    'GitObject',
+    'GitSession'
+]
+
+OBJECT_READERS = ('git', 'in-process')
+"""
+The possible object readers of a session: a ``git cat-file --batch`` process or the in-process ``ObjectStore``,
+which falls back to the git process for the objects it can't read.
+"""
+
+BATCH_SIZE = 256
+"""
+The number of object requests written to ``git cat-file --batch`` before the responses are read.
+The requests of a batch have to fit into the pipe buffer, otherwise git and the session would wait for each other.
+"""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class GitObject:
+    """A git object as returned by ``git cat-file --batch``."""
+    sha: str
+    """The full hash of the object."""
+
+    type: str
+    """The type of the object: ``commit``, ``tree``, ``blob`` or ``tag``."""
+
+    content: bytes
+    """The raw contents of the object."""
+
+
+class GitSession:
+    """
+    A session with a git repository for a single run of the action.
+
+    All objects are read through one long-lived ``git cat-file --batch`` process, which is started on the first read
+    and stopped when the session is closed. Other git commands are run through the session as well, so the number of
+    spawned git processes of a run is known. The commit-graph of the repository is mapped on first use as well.
+
+    With the ``in-process`` object reader, objects are read from the pack files and loose objects by an
+    ``ObjectStore`` instead. Only the revisions it can't resolve (e.g. ``HEAD~1`` or objects of an alternate
+    repository) are still read through the git process.
+    """
+
+    def __init__(
+            self,
+            repo: git.Repo,
+            object_reader: str = 'git',
+            cache_dir: str | os.PathLike[str] | None = None
+    ) -> None:
+        """
+        :param object_reader: How objects are read, one of ``OBJECT_READERS``.
+        :param cache_dir: The directory for the caches that persist between runs.
+            Defaults to a directory inside the git directory (see ``get_cache_dir``).
+        """
+        if object_reader not in OBJECT_READERS:
+            raise ValueError(f'Unknown object reader "{object_reader}", expected one of {", ".join(OBJECT_READERS)}')
+
+        self.repo = repo
+        self.object_reader = object_reader
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_cache_dir(repo)
+        """The directory for the caches that persist between runs."""
+        self.spawned_processes = 0
+        """The number of git processes the session has started."""
+        self._reader: subprocess.Popen[bytes] | None = None
+        self._object_store: ObjectStore | None = None
+        self._commit_graph: CommitGraph | None = None
+        self._commit_graph_opened = False
+
+    def __enter__(self) -> GitSession:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    @property
+    def commit_graph(self) -> CommitGraph | None:
+        """
+        The commit-graph of the repository, or ``None`` if it has none or git would not use it
+        (e.g. because ``core.commitGraph`` is disabled).
+        """
+        if not self._commit_graph_opened:
+            self._commit_graph_opened = True
+
+            if self.repo.config_reader().get_value('core', 'commitGraph', True):
+                self._commit_graph = CommitGraph.open(self.repo.common_dir)
+
+        return self._commit_graph
+
+    def close(self) -> None:
+        """Stop the object reader process and unmap the commit-graph and the object store."""
+        if self._commit_graph is not None:
+            self._commit_graph.close()
+            self._commit_graph = None
+
+        if self._object_store is not None:
+            self._object_store.close()
+            self._object_store = None
+
+        if self._reader is None:
+            return
+
+        assert self._reader.stdin is not None
+        self._reader.stdin.close()
+        self._reader.wait()
+        self._reader = None
+
+    def run(self, *args: str) -> str:
+        """
+        Run a git command in the repository and return its output.
+
+        :raises subprocess.CalledProcessError: If the command did not exit successful.
+        """
+        self.spawned_processes += 1
+        return run_command('git', '-C', self.repo.working_dir, *args)
+
+    def read_object(self, rev: str) -> GitObject | None:
+        """Read a single object, or get ``None`` if it does not exist (see ``read_objects``)."""
+        return self.read_objects([rev])[0]
+
+    def read_objects(self, revs: Sequence[str]) -> list[GitObject | None]:
+        """
+        Read the objects named by the revisions (e.g. a hash, ``HEAD`` or ``<hash>^{commit}``).
+        The requests are written in batches, so reading many objects doesn't wait for git once per object.
+
+        :returns: The objects in the order of the revisions, ``None`` for revisions that don't name an object.
+        """
+        if self.object_reader == 'in-process':
+            return self._read_objects_in_process(revs)
+
+        return self._read_objects_with_git(revs)
+
+    def _read_objects_with_git(self, revs: Sequence[str]) -> list[GitObject | None]:
+        """Read the objects through the object reader process."""
+        objects: list[GitObject | None] = []
+
+        if not revs:
+            return objects
+
+        stdin, stdout = self._get_reader()
+
+        for start in range(0, len(revs), BATCH_SIZE):
+            batch = revs[start:start + BATCH_SIZE]
+            stdin.write(''.join(f'{rev}\n' for rev in batch).encode('utf-8'))
+            stdin.flush()
+            objects.extend(_read_response(stdout) for _ in batch)
+
+        return objects
+
+    def _read_objects_in_process(self, revs: Sequence[str]) -> list[GitObject | None]:
+        """Read the objects through the object store, the revisions it can't resolve are read by git."""
+        objects = [self._read_object_in_process(rev) for rev in revs]
+        unresolved = [index for index, obj in enumerate(objects) if obj is None]
+
+        if unresolved:
+            logger.debug('Reading %s objects that are not in the object store through git', len(unresolved))
+
+            for index, obj in zip(unresolved, self._read_objects_with_git([revs[index] for index in unresolved])):
+                objects[index] = obj
+
+        return objects
+
+    def _read_object_in_process(self, rev: str) -> GitObject | None:
+        """
+        Read the object of a hash, ``HEAD`` or a full ref name, optionally peeled to a commit by a ``^{commit}``
+        suffix, through the object store.
+
+        :returns: The object, or ``None`` if the revision has to be resolved by git, which includes the objects the
+            object store fails to read.
+        """
+        name = rev.removesuffix('^{commit}')
+        peel = name != rev
+
+        if SHA_PATTERN.fullmatch(name) is None:
+            if name != 'HEAD' and not name.startswith('refs/'):
+                return None
+
+            try:
+                name = git.SymbolicReference.dereference_recursive(self.repo, name)
+            except ValueError:
+                return None
+
+        if self._object_store is None:
+            object_format = self.repo.config_reader().get_value('extensions', 'objectformat', 'sha1')
+            self._object_store = ObjectStore.open(self.repo.common_dir, 32 if object_format == 'sha256' else 20)
+
+        try:
+            obj = self._object_store.read(name)
+
+            # Annotated tags are peeled, like git does for the ^{commit} suffix.
+            while peel and obj is not None and obj[0] == 'tag':
+                name = obj[1][7:obj[1].index(b'\n')].decode('ascii')
+                obj = self._object_store.read(name)
+        except (ValueError, zlib.error) as exc:
+            # git reads the objects the object store doesn't support, and reports corrupt objects as missing.
+            logger.debug('Reading %s through git, because the object store cannot read it: %s', rev, exc)
+            return None
+
+        if obj is None or (peel and obj[0] != 'commit'):
+            return None
+
+        return GitObject(sha=name, type=obj[0], content=obj[1])
+
+    def _get_reader(self) -> tuple[IO[bytes], IO[bytes]]:
+        """Get the pipes of the object reader process, starting it on the first call."""
+        if self._reader is None:
+            logger.debug('Starting the object reader of %s', self.repo.git_dir)
+            self.spawned_processes += 1
+            # The process lives as long as the session and is stopped by close().
+            self._reader = subprocess.Popen(  # pylint: disable=consider-using-with
+                ['git', f'--git-dir={self.repo.git_dir}', 'cat-file', '--batch'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE
+            )
+
+        assert self._reader.stdin is not None and self._reader.stdout is not None
+        return self._reader.stdin, self._reader.stdout
+
+
+def _read_response(stdout: IO[bytes]) -> GitObject | None:
+    """
+    Read the response to one request: a ``<sha> <type> <size>`` header line followed by the contents and a newline,
+    or a ``<rev> missing`` / ``<rev> ambiguous`` line.
+    """
+    header = stdout.readline().split()
+
+    if len(header) != 3:
+        logger.debug('Object %s does not exist', b' '.join(header[:-1]).decode('utf-8', errors='replace'))
+        return None
+
+    content = stdout.read(int(header[2]))
+    stdout.read(1)
+    return GitObject(sha=header[0].decode('ascii'), type=header[1].decode('ascii'), content=content)
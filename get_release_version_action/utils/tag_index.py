@@ -0,0 +1,138 @@
+"""An on-disk index of the tags and their commits, which is refreshed incrementally between runs."""
+import logging
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+from .cache import read_cache_file, write_cache_file
+from .refs import GitTag, TagRef, get_packed_refs_state, read_loose_tag_refs, read_packed_tag_refs
+
+logger = logging.getLogger('wemogy.get-release-version-action')
+
+__all__ = [
+    'TagIndex'
+]
+
+INDEX_HEADER = 'get-release-version-action tag index v1'
+"""The first line of the index file, an index with another header is ignored."""
+
+
+class TagIndex:
+    """
+    An on-disk index of the tag references and the commits they point to.
+
+    The tags of the ``packed-refs`` file are stored together with the state of the file, so they are only parsed
+    again after the file changed. Loose tags are always read, as there are usually only a few of them.
+    The commit hash and commit timestamp of every resolved tag object are stored as well. Objects are immutable,
+    so only tags that were added or moved since the last run need to be resolved.
+
+    The rows are kept as the raw tab-separated strings of the index file and are only parsed for the tags whose
+    name passes the name filter, so loading the index is a single split per row.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._packed_refs_state: str | None = None
+        self._packed_refs: dict[str, str] = {}
+        """The ``<object sha>\\t<peeled sha>`` row of every packed tag name, in alphabetical order."""
+        self._commits: dict[str, str] = {}
+        """
+        The ``<commit sha>\\t<commit timestamp>`` row of every resolved tag object hash,
+        or ``\\t`` if the object doesn't point to a commit.
+        """
+        self._loose_refs: dict[str, TagRef] = {}
+        self._changed = False
+        self._load()
+
+    def read_tags(
+            self,
+            common_dir: str | os.PathLike[str],
+            name_filter: Callable[[str], bool] | None,
+            resolver: Callable[[list[TagRef]], list[GitTag]]
+    ) -> list[GitTag]:
+        """
+        Get the tags whose names pass the filter in alphabetical order.
+        Tags that do not point to a commit are skipped.
+
+        :param common_dir: The git directory shared by all worktrees (``git.Repo.common_dir``).
+        :param name_filter: Only tags whose names pass this filter are resolved.
+        :param resolver: Resolves the tag references that are not in the index yet.
+        """
+        state = get_packed_refs_state(common_dir)
+
+        if state != self._packed_refs_state:
+            logger.debug('The packed-refs file changed since the tag index was written, reading it')
+            packed_refs = read_packed_tag_refs(common_dir)
+            self._packed_refs = {
+                name: f'{packed_refs[name].object_sha}\t{packed_refs[name].peeled_sha or ""}'
+                for name in sorted(packed_refs)
+            }
+            self._packed_refs_state = state
+            self._changed = True
+
+        self._loose_refs = read_loose_tag_refs(common_dir)
+        names = sorted(self._packed_refs.keys() | self._loose_refs.keys()) if self._loose_refs else self._packed_refs
+        candidates = [self._get_ref(name) for name in names if name_filter is None or name_filter(name)]
+        logger.debug('Reading %s of %s tags', len(candidates), len(names))
+
+        missing = [ref for ref in candidates if ref.object_sha not in self._commits]
+
+        if missing:
+            logger.debug('Resolving %s tags that are not in the tag index yet', len(missing))
+            resolved = {tag.name: f'{tag.commit_sha}\t{tag.committed_date}' for tag in resolver(missing)}
+
+            for ref in missing:
+                self._commits[ref.object_sha] = resolved.get(ref.name, '\t')
+
+            self._changed = True
+
+        tags: list[GitTag] = []
+
+        for ref in candidates:
+            commit_sha, committed_date = self._commits[ref.object_sha].split('\t')
+
+            if commit_sha:
+                tags.append(GitTag(name=ref.name, commit_sha=commit_sha, committed_date=int(committed_date)))
+
+        return tags
+
+    def save(self) -> None:
+        """Write the index, if it changed. Commits of tags that were removed are dropped."""
+        if not self._changed:
+            return
+
+        referenced = {row.split('\t', 1)[0] for row in self._packed_refs.values()}
+        referenced.update(ref.object_sha for ref in self._loose_refs.values())
+
+        lines = [INDEX_HEADER, self._packed_refs_state or '']
+        lines.extend(f'{name}\t{row}' for name, row in self._packed_refs.items())
+        lines.append('')
+        lines.extend(f'{object_sha}\t{row}' for object_sha, row in self._commits.items() if object_sha in referenced)
+
+        write_cache_file(self.path, '\n'.join(lines) + '\n')
+        self._changed = False
+
+    def _get_ref(self, name: str) -> TagRef:
+        """Get the reference of the tag, loose tags take precedence over packed tags."""
+        loose_ref = self._loose_refs.get(name)
+
+        if loose_ref is not None:
+            return loose_ref
+
+        object_sha, peeled_sha = self._packed_refs[name].split('\t')
+        return TagRef(name=name, object_sha=object_sha, peeled_sha=peeled_sha or None)
+
+    def _load(self) -> None:
+        """Load the index file, an unreadable or outdated index is treated as empty (see ``read_cache_file``)."""
+        index = read_cache_file(self.path, INDEX_HEADER, _parse_index)
+
+        if index is not None:
+            self._packed_refs_state, self._packed_refs, self._commits = index
+
+
+def _parse_index(lines: list[str]) -> tuple[str, dict[str, str], dict[str, str]]:
+    """Parse the lines of the index file after the header: the packed-refs state, the packed tags and the commits."""
+    separator = lines.index('', 1)
+    packed_refs = dict(line.split('\t', 1) for line in lines[1:separator])
+    commits = dict(line.split('\t', 1) for line in lines[separator + 1:])
+    return lines[0], packed_refs, commits
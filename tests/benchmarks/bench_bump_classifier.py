@@ -0,0 +1,39 @@
+"""
+Benchmark: The number of commit messages per second the built-in ``CommitClassifier`` and the ``AngularCommitParser``
+of ``semantic_release`` classify by their version bump.
+
+The messages are a mix of conventional commits with bodies, breaking change footers and other messages (see
+``create_commit_messages``), and are classified through ``get_bump_function``, like the bump analysis does.
+"""
+import functools
+from collections.abc import Callable
+
+from bench_utils import create_commit_messages, create_commit_messages_parser, measure
+from get_release_version_action.algorithms.commit_classifier import BUMP_CLASSIFIERS
+from get_release_version_action.algorithms.semantic import get_bump_function
+from get_release_version_action.utils import CommitMessage
+
+
+def main() -> None:
+    """Run the benchmark."""
+    args = create_commit_messages_parser(__doc__, 100_000).parse_args()
+    commits = create_commit_messages(args.commits)
+    results: dict[str, list[int]] = {}
+
+    print(f'{args.commits} commit messages')
+
+    for bump_classifier in BUMP_CLASSIFIERS:
+        get_bump = get_bump_function(bump_classifier)
+        duration, results[bump_classifier] = measure(functools.partial(_classify, get_bump, commits))
+        print(f'  {bump_classifier:8} {args.commits / duration:12,.0f} messages / s')
+
+    assert results['fast'] == results['angular']
+
+
+def _classify(get_bump: Callable[[CommitMessage], int], commits: list[CommitMessage]) -> list[int]:
+    """Get the bumps of all commits."""
+    return [get_bump(commit) for commit in commits]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: The peak memory of determining the version bump for a growing number of commits.
+
+Runs ``analyze_commits`` for a first release (all commits) and for a range since a tag at the first commit, with
+``fix:`` commits only, so the walk never stops early at a major change. The peak is measured with ``tracemalloc``.
+The commits and their bumps are reduced while they are walked, so only the hashes of the walked commits are kept
+and the peak doesn't grow with the size of the messages.
+"""
+# pylint: disable=duplicate-code
+import subprocess
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import git
+
+from bench_utils import create_synthetic_repo
+from get_release_version_action.algorithms.semantic import analyze_commits
+from get_release_version_action.utils import GitSession, read_tags
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--commits',
+        type=int,
+        nargs='+',
+        default=[5_000, 10_000, 20_000, 40_000],
+        help='The numbers of commits.'
+    )
+    parser.add_argument('--message-size', type=int, default=2048, help='The size of the commit message bodies.')
+    parser.add_argument('--commit-graph', action='store_true', help='Write a commit-graph file before walking.')
+    args = parser.parse_args()
+
+    for commits in args.commits:
+        _benchmark(commits, args.message_size, args.commit_graph)
+
+
+def _benchmark(commits: int, message_size: int, commit_graph: bool) -> None:
+    """Measure the peak memory for a history of ``commits`` commits."""
+    body = 'x' * message_size
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory)
+        create_synthetic_repo(path, commits, lambda i: f'fix: commit {i}\n\n{body}', tags=[(0, 'v0.0.1')])
+
+        if commit_graph:
+            subprocess.run(['git', 'commit-graph', 'write', '--reachable'], cwd=path, check=True)
+
+        with git.Repo(path) as repo, GitSession(repo) as session:
+            tag = read_tags(session)[0]
+            first_release_peak = _measure_peak(lambda: analyze_commits(session, None, None))
+            range_peak = _measure_peak(lambda: analyze_commits(session, tag, '0.0.1'))
+
+    messages_size = commits * message_size
+
+    print(
+        f'{commits:6} commits ({messages_size / 2 ** 20:7.1f} MiB of messages):'
+        f' first release {first_release_peak / 2 ** 20:6.2f} MiB ({first_release_peak / commits:6.1f} B / commit)'
+        f' | range {range_peak / 2 ** 20:6.2f} MiB ({range_peak / commits:6.1f} B / commit)'
+    )
+
+
+def _measure_peak(function: Callable[[], object]) -> int:
+    """Get the peak of the memory allocated while running the function, in bytes."""
+    tracemalloc.start()
+
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    main()
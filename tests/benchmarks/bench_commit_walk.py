@@ -0,0 +1,90 @@
+"""
+Benchmark: Collect the messages of the commits since the last tag for a growing number of commits past the tag.
+
+Compares the former skip-based pagination, which starts a new ``git rev-list`` for every page of 50 commits,
+re-walks all skipped commits and loads the message of every ``git.Commit`` separately, with the single walk of
+``get_new_commits`` through the object reader of a ``GitSession``.
+The time per commit of the streaming walk stays constant, while it grows linearly for the pagination.
+With ``--commit-graph``, the history is walked through a commit-graph file written after the repository was created.
+With ``--object-reader in-process``, the objects are read from the pack files instead of a ``git cat-file`` process.
+"""
+# pylint: disable=duplicate-code
+from argparse import ArgumentParser
+import subprocess
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import git
+
+from bench_utils import create_synthetic_repo, measure
+from get_release_version_action.algorithms.semantic import get_new_commits
+from get_release_version_action.utils import OBJECT_READERS, GitSession, GitTag, read_tags
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--commits',
+        type=int,
+        nargs='+',
+        default=[1_000, 2_000, 4_000, 8_000],
+        help='The numbers of commits past the tag.'
+    )
+    parser.add_argument('--commit-graph', action='store_true', help='Write a commit-graph file before walking.')
+    parser.add_argument('--object-reader', choices=OBJECT_READERS, default='git', help='How objects are read.')
+    args = parser.parse_args()
+
+    for commits in args.commits:
+        _benchmark(commits, args.commit_graph, args.object_reader)
+
+
+def _benchmark(commits: int, commit_graph: bool, object_reader: str) -> None:
+    """Measure both implementations for a history with ``commits`` commits past the tag."""
+    with TemporaryDirectory() as directory:
+        path = Path(directory)
+        create_synthetic_repo(path, commits + 1, tags=[(0, 'v0.0.1')])
+
+        if commit_graph:
+            subprocess.run(['git', 'commit-graph', 'write', '--reachable'], cwd=path, check=True)
+
+        with git.Repo(path) as repo, GitSession(repo, object_reader) as session:
+            tag = read_tags(session)[0]
+            paginated_time, paginated = measure(lambda: _get_new_commits_paginated(repo, tag), repeat=1)
+            streaming_time, streaming = measure(lambda: list(get_new_commits(session, tag)))
+
+    assert paginated == [(commit.hexsha, commit.message) for commit in streaming]
+    assert len(streaming) == commits
+
+    print(
+        f'{commits:6} commits: paginated {paginated_time * 1000:9.2f} ms'
+        f' ({paginated_time / commits * 1e6:7.2f} us / commit)'
+        f' | streaming {streaming_time * 1000:9.2f} ms ({streaming_time / commits * 1e6:7.2f} us / commit)'
+    )
+
+
+def _get_new_commits_paginated(repo: git.Repo, tag: GitTag) -> list[tuple[str, str]]:
+    """The former implementation of ``get_new_commits`` without logging, which also reads the commit messages."""
+    max_commits = 50
+    commit_offset = 0
+    new_commits: list[tuple[str, str]] = []
+
+    while True:
+        i = 0
+
+        for commit in repo.iter_commits(max_count=max_commits, skip=commit_offset):
+            i += 1
+
+            if commit.hexsha == tag.commit_sha:
+                return new_commits
+
+            new_commits.append((commit.hexsha, str(commit.message)))
+
+        commit_offset += max_commits
+
+        if i < max_commits:
+            return new_commits
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: The speedup of classifying the commits of a large history in worker processes, by the number of workers.
+
+A synthetic repository with a commit-graph is created from the commit messages of ``create_commit_messages``.
+Its whole history is walked by ``get_new_commits`` and classified by ``classify_commits`` with an empty cache, like
+the first run of the action on a repository, once in this process and once per number of workers with a
+``parallel_threshold`` of 1. Unlike the action, the walk doesn't stop at the first major bump.
+"""
+import functools
+import subprocess
+import tempfile
+from pathlib import Path
+
+import git
+
+from bench_utils import create_commit_messages, create_commit_messages_parser, create_synthetic_repo, measure
+from get_release_version_action.algorithms.classification_pool import get_worker_count
+from get_release_version_action.algorithms.commit_classifier import BUMP_CLASSIFIERS
+from get_release_version_action.algorithms.semantic import BUMP_CACHE_HEADER, classify_commits, get_new_commits
+from get_release_version_action.models import Inputs
+from get_release_version_action.utils import CommitCache, GitSession
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = create_commit_messages_parser(__doc__, 200_000)
+    parser.add_argument(
+        '--workers',
+        type=int,
+        nargs='+',
+        help='The numbers of worker processes, defaults to the powers of two up to the number of CPUs.'
+    )
+    args = parser.parse_args()
+
+    cpus = get_worker_count()
+    workers = args.workers or sorted({*(2 ** i for i in range(1, cpus.bit_length())), cpus} - {1})
+    messages = [commit.message for commit in create_commit_messages(args.commits)]
+
+    print(f'{args.commits} commits, {cpus} CPUs')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'repo'
+        path.mkdir()
+        create_synthetic_repo(path, args.commits, messages.__getitem__)
+        subprocess.run(['git', 'commit-graph', 'write', '--reachable'], cwd=path, check=True)
+
+        with git.Repo(path) as repo, GitSession(repo) as session:
+            for bump_classifier in BUMP_CLASSIFIERS:
+                _benchmark(session, bump_classifier, workers)
+
+
+def _benchmark(session: GitSession, bump_classifier: str, workers: list[int]) -> None:
+    """Measure the walk in this process and with each number of workers."""
+    serial_duration, expected = measure(
+        functools.partial(_walk, session, Inputs(bump_classifier=bump_classifier), 1), repeat=1
+    )
+    print(f'  {bump_classifier:8} in process {serial_duration:8.2f} s')
+
+    for count in workers:
+        inputs = Inputs(bump_classifier=bump_classifier, parallel_threshold=1)
+        duration, bumps = measure(functools.partial(_walk, session, inputs, count), repeat=1)
+        print(f'  {bump_classifier:8} {count:3} workers {duration:8.2f} s   speedup {serial_duration / duration:5.2f}x')
+        assert bumps == expected
+
+
+def _walk(session: GitSession, inputs: Inputs, workers: int) -> dict[str, int]:
+    """Walk and classify all commits with a new, empty cache, which isn't saved."""
+    cache = CommitCache(session.cache_dir / 'bench-bumps', BUMP_CACHE_HEADER)
+    return dict(classify_commits(get_new_commits(session, None), inputs, cache, workers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: Read and resolve the candidate tags of a 50k-tag repository with a cold and a warm tag index.
+
+A cold run builds the index, a warm run reuses it and a run after adding a tag refreshes it incrementally.
+"""
+import shutil
+import subprocess
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import git
+
+from bench_utils import create_synthetic_repo, measure
+from get_release_version_action.utils import GitSession, read_tags
+from get_release_version_action.utils.cache import get_cache_dir
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--tags', type=int, default=50_000, help='The number of tags (one per commit).')
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory)
+        create_synthetic_repo(path, args.tags, tags=((i, f'v0.0.{i}') for i in range(args.tags)))
+
+        with git.Repo(path) as repo, GitSession(repo) as session:
+            cache_dir = get_cache_dir(repo)
+
+            def cold_run() -> list[object]:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                return list(read_tags(session))
+
+            cold_time, cold_tags = measure(cold_run)
+            warm_time, warm_tags = measure(lambda: list(read_tags(session)))
+
+            subprocess.run(['git', 'tag', 'v1.0.0'], cwd=path, check=True)
+            incremental_time, incremental_tags = measure(lambda: list(read_tags(session)), repeat=1)
+            filtered_time, _ = measure(lambda: list(read_tags(session, lambda name: name.endswith('00'))))
+
+    assert cold_tags == warm_tags
+    assert len(incremental_tags) == len(warm_tags) + 1
+
+    print(f'{args.tags} tags, all tags are candidates')
+    print(f'  cold index:             {cold_time * 1000:8.2f} ms')
+    print(f'  warm index:             {warm_time * 1000:8.2f} ms')
+    print(f'  warm index, 1 new tag:  {incremental_time * 1000:8.2f} ms')
+    print(f'  warm index, 1 % of the tags are candidates: {filtered_time * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
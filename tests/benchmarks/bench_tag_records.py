@@ -0,0 +1,89 @@
+"""
+Benchmark: Memory and sort time of 100k tag records.
+
+Compares the slotted ``GitTag`` records with equivalent records that have a ``__dict__``, and sorting by integer
+keys with sorting by timezone-aware ``datetime`` objects (like GitPython's ``committed_datetime``).
+"""
+# pylint: disable=duplicate-code
+import gc
+import heapq
+import random
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from bench_utils import START_DATE, measure
+from get_release_version_action.utils import GitTag
+
+
+@dataclass(frozen=True, kw_only=True)
+class DictGitTag:
+    """A ``GitTag`` without slots."""
+    name: str
+    commit_sha: str
+    committed_date: int
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--tags', type=int, default=100_000, help='The number of tag records.')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    rows = [
+        (f'v0.0.{i}', f'{rng.getrandbits(160):040x}', START_DATE + rng.randrange(10 ** 7))
+        for i in range(args.tags)
+    ]
+
+    slots_memory = _measure_memory(lambda: [GitTag(name=n, commit_sha=s, committed_date=d) for n, s, d in rows])
+    dict_memory = _measure_memory(lambda: [DictGitTag(name=n, commit_sha=s, committed_date=d) for n, s, d in rows])
+
+    tags = [GitTag(name=n, commit_sha=s, committed_date=d) for n, s, d in rows]
+    datetime_time, _ = measure(lambda: sorted(
+        tags, key=lambda t: datetime.fromtimestamp(t.committed_date, timezone.utc), reverse=True
+    ))
+    attribute_time, _ = measure(lambda: sorted(tags, key=lambda t: t.committed_date, reverse=True))
+    packed_time, _ = measure(lambda: _sort_packed(tags))
+    heap_time, _ = measure(lambda: _heapify_packed(tags))
+
+    print(f'{args.tags} tag records')
+    print(f'  memory (records only): slots {slots_memory / 2 ** 20:7.2f} MiB | dict {dict_memory / 2 ** 20:7.2f} MiB')
+    print(f'  sort by datetime key:        {datetime_time * 1000:8.2f} ms')
+    print(f'  sort by integer attribute:   {attribute_time * 1000:8.2f} ms')
+    print(f'  sort packed integer keys:    {packed_time * 1000:8.2f} ms')
+    print(f'  heapify packed integer keys: {heap_time * 1000:8.2f} ms')
+
+
+def _measure_memory(create: Callable[[], list[object]]) -> int:
+    """Measure the memory allocated by the records, excluding the strings they share with the input rows."""
+    gc.collect()
+    tracemalloc.start()
+    records = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def _sort_packed(tags: list[GitTag]) -> list[GitTag]:
+    """Sort by the packed keys of ``iter_tags_newest_first``."""
+    shift = len(tags).bit_length()
+    keys = [(-tag.committed_date << shift) | position for position, tag in enumerate(tags)]
+    keys.sort()
+    mask = (1 << shift) - 1
+    return [tags[key & mask] for key in keys]
+
+
+def _heapify_packed(tags: list[GitTag]) -> list[int]:
+    """The heap of ``iter_tags_newest_first``."""
+    shift = len(tags).bit_length()
+    heap = [(-tag.committed_date << shift) | position for position, tag in enumerate(tags)]
+    heapq.heapify(heap)
+    return heap
+
+
+if __name__ == '__main__':
+    main()
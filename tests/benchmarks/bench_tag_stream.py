@@ -0,0 +1,68 @@
+"""
+Benchmark: Find the newest matching tag when the match is among the 10 newest of 50k tags.
+
+Compares fully sorting all tags (``get_sorted_tags``) with the lazy heap-ordered stream (``iter_tags_newest_first``),
+and resolving all tags with resolving only the tags whose name passes a filter (about 1 % of the tags).
+"""
+# pylint: disable=duplicate-code
+import heapq
+import random
+from argparse import ArgumentParser
+from itertools import islice
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import git
+
+from bench_utils import create_synthetic_repo, measure
+from get_release_version_action.utils import GitSession, GitTag, get_sorted_tags, iter_tags_newest_first, read_tags
+from get_release_version_action.utils.git import _get_sort_keys
+
+MATCH_POSITION = 10
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--tags', type=int, default=50_000, help='The number of tags (one per commit).')
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory)
+        # Shuffle the tag names, so the alphabetical order of for-each-ref doesn't presort the tags by date.
+        names = [f'v0.0.{i}' for i in range(args.tags)]
+        random.Random(0).shuffle(names)
+        create_synthetic_repo(path, args.tags, tags=enumerate(names))
+
+        with git.Repo(path) as repo, GitSession(repo) as session:
+            tags = read_tags(session)
+
+            sort_time, _ = measure(lambda: sorted(tags, key=lambda t: t.committed_date, reverse=True)[MATCH_POSITION])
+            heap_time, _ = measure(lambda: _heap_pick(tags))
+            sorted_total, sorted_tag = measure(lambda: get_sorted_tags(session)[MATCH_POSITION])
+            stream_total, stream_tag = measure(
+                lambda: next(islice(iter_tags_newest_first(session), MATCH_POSITION, None))
+            )
+            filtered_total, _ = measure(lambda: next(iter_tags_newest_first(session, lambda name: name.endswith('00'))))
+
+    assert sorted_tag == stream_tag
+
+    print(f'{args.tags} tags, match at position {MATCH_POSITION + 1}')
+    print(f'  ordering only: sorted {sort_time * 1000:8.2f} ms | heap {heap_time * 1000:8.2f} ms')
+    print(f'  incl. reading: sorted {sorted_total * 1000:8.2f} ms | heap {stream_total * 1000:8.2f} ms')
+    print(f'  incl. reading, name filter: heap {filtered_total * 1000:8.2f} ms')
+
+
+def _heap_pick(tags: list[GitTag]) -> GitTag:
+    """The in-memory part of ``iter_tags_newest_first``, with its sort keys."""
+    heap, mask = _get_sort_keys(tags)
+    heapq.heapify(heap)
+
+    for _ in range(MATCH_POSITION):
+        heapq.heappop(heap)
+
+    return tags[heapq.heappop(heap) & mask]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Helpers for the benchmarks: synthetic repositories, commit messages and timing."""
+import random
+import subprocess
+import time
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TypeVar
+
+from get_release_version_action.utils import CommitMessage
+
+__all__ = [
+    'create_commit_messages',
+    'create_commit_messages_parser',
+    'create_synthetic_repo',
+    'measure'
+]
+
+T = TypeVar('T')
+
+START_DATE = 1_700_000_000
+"""The committer timestamp of the first synthetic commit, every following commit is one second newer."""
+
+MESSAGE_HEADERS = [
+    'feat: add a thing', 'fix(parser): fix a thing', 'chore: update dependencies', 'feat!: break a thing',
+    'docs: document a thing', 'Merge pull request #1 from branch', 'perf: speed up a thing', 'WIP'
+]
+"""The headers of the synthetic commit messages, conventional commits and other messages."""
+
+MESSAGE_BODIES = [
+    '', '\n\nA body that explains the change.\n\nSigned-off-by: someone',
+    '\n\nA body.\n\nBREAKING CHANGE: the thing is removed', '\n\n' + 'A long body line.\n' * 20
+]
+"""The bodies of the synthetic commit messages, with footers and a breaking change."""
+
+
+def create_synthetic_repo(
+        path: Path,
+        commits: int,
+        messages: Callable[[int], str] = lambda i: f'chore: commit {i}',
+        tags: Iterable[tuple[int, str]] = ()
+) -> None:
+    """
+    Create a linear git history on the ``main`` branch with ``git fast-import``.
+
+    :param path: The directory to create the repository in.
+    :param commits: The number of commits.
+    :param messages: Returns the commit message for the commit with the given index.
+    :param tags: Pairs of commit index and tag name, the tags are created as lightweight tags.
+    """
+    subprocess.run(['git', 'init', '--quiet', '--initial-branch=main', str(path)], check=True)
+
+    with subprocess.Popen(['git', 'fast-import', '--quiet'], cwd=path, stdin=subprocess.PIPE) as process:
+        assert process.stdin is not None
+
+        for i in range(commits):
+            message = messages(i).encode('utf-8')
+            process.stdin.write(
+                f'commit refs/heads/main\nmark :{i + 1}\n'
+                f'committer Benchmark <benchmark@example.com> {START_DATE + i} +0000\n'
+                f'data {len(message)}\n'.encode('utf-8') + message + b'\n\n'
+            )
+
+        for i, name in tags:
+            process.stdin.write(f'reset refs/tags/{name}\nfrom :{i + 1}\n\n'.encode('utf-8'))
+
+        process.stdin.close()
+
+    if process.returncode != 0:
+        raise RuntimeError(f'git fast-import exited with code {process.returncode}')
+
+    # Cloned repositories have their tags in the packed-refs file, fast-import creates loose refs.
+    subprocess.run(['git', 'pack-refs', '--all'], cwd=path, check=True)
+    subprocess.run(['git', 'checkout', '--quiet', 'main'], cwd=path, check=True)
+
+
+def create_commit_messages(count: int) -> list[CommitMessage]:
+    """Create ``count`` commits in memory with random combinations of ``MESSAGE_HEADERS`` and ``MESSAGE_BODIES``."""
+    generator = random.Random(42)
+    return [
+        CommitMessage(hexsha=f'{i:040x}', message=generator.choice(MESSAGE_HEADERS) + generator.choice(MESSAGE_BODIES))
+        for i in range(count)
+    ]
+
+
+def create_commit_messages_parser(description: str | None, commits: int) -> ArgumentParser:
+    """
+    Create the argument parser of a benchmark over the commits of ``create_commit_messages``, with the
+    ``--commits`` argument.
+
+    :param description: The description of the benchmark, usually the docstring of its script.
+    :param commits: The default number of commits.
+    """
+    parser = ArgumentParser(description=description)
+    parser.add_argument('--commits', type=int, default=commits, help='The number of commits.')
+    return parser
+
+
+def measure(function: Callable[[], T], repeat: int = 3) -> tuple[float, T]:
+    """Run ``function`` ``repeat`` times and return the fastest duration in seconds and the last result."""
+    best = float('inf')
+    result: T
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
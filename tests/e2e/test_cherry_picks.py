@@ -0,0 +1,95 @@
+"""Test the scenarios where the changes of a commit are already part of the previous version."""
+# pylint: disable=too-many-locals,too-many-lines,duplicate-code,too-many-statements,unused-import,redefined-outer-name
+from assertpy import assert_that
+
+from test_utils import ActionInputs, ActionOutputs, CommitMessages, logging, TestRepo, repo, run_action
+
+
+def test_merge_cherry_pick_of_released_fix(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a released ``fix:`` commit was cherry-picked onto ``release-beta`` and
+    ``release-beta`` was merged back into ``release``.
+    """
+    # Arrange
+    args_release = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=True
+    )
+
+    expected_output_feature = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    expected_output_fix = ActionOutputs(
+        version='0.1.1',
+        version_name='v0.1.1',
+        previous_version='0.1.0',
+        previous_version_name='v0.1.0',
+        tag_created=True
+    )
+
+    args_all_commits = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    # The cherry-pick on release-beta is a new commit of release.
+    expected_output_all_commits = ActionOutputs(
+        version='0.1.2',
+        version_name='v0.1.2',
+        previous_version='0.1.1',
+        previous_version_name='v0.1.1',
+        tag_created=True
+    )
+
+    args_ignore_cherry_picks = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        ignore_cherry_picks=True,
+        create_tag=False
+    )
+
+    expected_output_ignore_cherry_picks = ActionOutputs(
+        version='0.1.1',
+        version_name='v0.1.1',
+        previous_version='0.1.1',
+        previous_version_name='v0.1.1',
+        tag_created=False
+    )
+
+    # Act
+    repo.commit(CommitMessages.FEATURE)
+    repo.merge('main', 'release')
+    actual_output_feature = run_action(args_release)
+
+    repo.checkout('main')
+    fix_commit = repo.commit(CommitMessages.FIX)
+    repo.merge('main', 'release')
+    actual_output_fix = run_action(args_release)
+
+    repo.cherrypick(fix_commit, 'release-beta')
+    repo.merge('release-beta', 'release', "Merge branch 'release-beta' into release")
+
+    actual_output_all_commits = run_action(args_all_commits)
+    actual_output_ignore_cherry_picks = run_action(args_ignore_cherry_picks)
+
+    # Assert
+    assert_that(actual_output_feature).is_equal_to(expected_output_feature)
+    assert_that(actual_output_fix).is_equal_to(expected_output_fix)
+    assert_that(actual_output_all_commits).is_equal_to(expected_output_all_commits)
+    assert_that(actual_output_ignore_cherry_picks).is_equal_to(expected_output_ignore_cherry_picks)
@@ -0,0 +1,95 @@
+"""Test the scenarios where the commit types and their bumps are configured by a commit types config file."""
+# pylint: disable=too-many-locals,too-many-lines,duplicate-code,too-many-statements,unused-import,redefined-outer-name
+from assertpy import assert_that
+
+from test_utils import ActionInputs, ActionOutputs, CommitMessages, logging, TestRepo, repo, run_action
+
+
+def test_refactor_bumps_patch(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a ``refactor:`` commit, first with the default commit types and then with a
+    config in which ``refactor`` bumps the patch version.
+    """
+    # Arrange
+    (repo.path / 'commit-types.yaml').write_text('patch: [fix, perf, refactor]\n', encoding='utf-8')
+
+    args_default = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    expected_output_default = ActionOutputs(
+        version='0.0.0',
+        version_name='v0.0.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=False
+    )
+
+    args_config = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        commit_types_config='commit-types.yaml',
+        create_tag=True
+    )
+
+    expected_output_config = ActionOutputs(
+        version='0.0.1',
+        version_name='v0.0.1',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    # Act
+    repo.commit('refactor: test')
+    repo.merge('main', 'release')
+
+    actual_output_default = run_action(args_default)
+    actual_output_config = run_action(args_config)
+    tag_config = repo.get_latest_tag_name()
+
+    # Assert
+    assert_that(actual_output_default).is_equal_to(expected_output_default)
+
+    assert_that(actual_output_config).is_equal_to(expected_output_config)
+    assert_that(tag_config).is_equal_to(expected_output_config.version_name)
+
+
+def test_breaking_footer(repo: TestRepo) -> None:
+    """Test Case: Run the action after a ``fix:`` commit with a configured breaking change footer."""
+    # Arrange
+    (repo.path / 'commit-types.yaml').write_text('breaking-footers: [BREAKS]\n', encoding='utf-8')
+
+    args_release = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        commit_types_config='commit-types.yaml',
+        create_tag=True
+    )
+
+    expected_output_release = ActionOutputs(
+        version='1.0.0',
+        version_name='v1.0.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    # Act
+    repo.commit(f'{CommitMessages.FIX}\n\nBREAKS: the API')
+    repo.merge('main', 'release')
+    actual_output_release = run_action(args_release)
+
+    # Assert
+    assert_that(actual_output_release).is_equal_to(expected_output_release)
@@ -0,0 +1,104 @@
+"""Test the scenarios where a release branch only receives merges and only its first-parent chain is analyzed."""
+# pylint: disable=too-many-locals,too-many-lines,duplicate-code,too-many-statements,unused-import,redefined-outer-name
+from assertpy import assert_that
+
+from test_utils import ActionInputs, ActionOutputs, CommitMessages, logging, TestRepo, repo, run_action
+
+
+def test_merge_into_release(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a ``fix:`` and a ``feat:`` commit on ``main`` were merged into ``release`` by a
+    merge commit, whose body is the ``fix:`` title of the pull request.
+    """
+    # Arrange
+    args_release = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=True
+    )
+
+    expected_output_release = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    args_all_commits = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    expected_output_all_commits = ActionOutputs(
+        version='0.2.0',
+        version_name='v0.2.0',
+        previous_version='0.1.0',
+        previous_version_name='v0.1.0',
+        tag_created=True
+    )
+
+    args_first_parent = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        first_parent=True,
+        create_tag=False
+    )
+
+    # The subject of the merge commit is not a conventional commit.
+    expected_output_first_parent = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='0.1.0',
+        previous_version_name='v0.1.0',
+        tag_created=False
+    )
+
+    args_merge_bodies = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        first_parent=True,
+        parse_merge_bodies=True,
+        create_tag=False
+    )
+
+    expected_output_merge_bodies = ActionOutputs(
+        version='0.1.1',
+        version_name='v0.1.1',
+        previous_version='0.1.0',
+        previous_version_name='v0.1.0',
+        tag_created=True
+    )
+
+    # Act
+    repo.checkout('release')
+    repo.commit(CommitMessages.FEATURE)
+    actual_output_release = run_action(args_release)
+
+    repo.checkout('main')
+    repo.commit(CommitMessages.FIX)
+    repo.commit(CommitMessages.FEATURE)
+    repo.merge('main', 'release', f'Merge pull request #1 from main\n\n{CommitMessages.FIX}')
+
+    actual_output_all_commits = run_action(args_all_commits)
+    actual_output_first_parent = run_action(args_first_parent)
+    actual_output_merge_bodies = run_action(args_merge_bodies)
+
+    # Assert
+    assert_that(actual_output_release).is_equal_to(expected_output_release)
+    assert_that(actual_output_all_commits).is_equal_to(expected_output_all_commits)
+    assert_that(actual_output_first_parent).is_equal_to(expected_output_first_parent)
+    assert_that(actual_output_merge_bodies).is_equal_to(expected_output_merge_bodies)
@@ -0,0 +1,138 @@
+"""Test the scenarios where the newest version tag is on a commit that is not reachable from the current branch."""
+# pylint: disable=too-many-locals,too-many-lines,duplicate-code,too-many-statements,unused-import,redefined-outer-name
+from assertpy import assert_that
+
+from test_utils import ActionInputs, ActionOutputs, CommitMessages, logging, TestRepo, repo, run_action
+
+
+def test_feat_on_diverged_branch(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a ``fix:`` commit on ``release`` and after a ``feat:`` commit on ``release-beta``,
+    which doesn't contain the ``fix:`` commit.
+    """
+    # Arrange
+    args_release = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=True
+    )
+
+    expected_output_release = ActionOutputs(
+        version='0.0.1',
+        version_name='v0.0.1',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    args_all_tags = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    expected_output_all_tags = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='0.0.1',
+        previous_version_name='v0.0.1',
+        tag_created=True
+    )
+
+    args_reachable_tags = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        only_reachable_tags=True,
+        create_tag=False
+    )
+
+    expected_output_reachable_tags = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    # Act
+    repo.checkout('release')
+    repo.commit(CommitMessages.FIX)
+    actual_output_release = run_action(args_release)
+
+    repo.checkout('release-beta')
+    repo.commit(CommitMessages.FEATURE)
+    actual_output_all_tags = run_action(args_all_tags)
+    actual_output_reachable_tags = run_action(args_reachable_tags)
+
+    # Assert
+    assert_that(actual_output_release).is_equal_to(expected_output_release)
+    assert_that(actual_output_all_tags).is_equal_to(expected_output_all_tags)
+    assert_that(actual_output_reachable_tags).is_equal_to(expected_output_reachable_tags)
+
+
+def test_fix_on_branch_without_newest_tag(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a ``fix:`` commit on a branch that contains a ``feat:`` commit, which was
+    already released on ``release`` by a version tag that is not reachable from the branch.
+    """
+    # Arrange
+    args_release = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=True
+    )
+
+    expected_output_release = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    args_feature = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    # The feat: commit is part of v0.1.0, so only the fix: commit is new.
+    expected_output_feature = ActionOutputs(
+        version='0.1.1',
+        version_name='v0.1.1',
+        previous_version='0.1.0',
+        previous_version_name='v0.1.0',
+        tag_created=True
+    )
+
+    # Act
+    repo.checkout('release')
+    repo.commit(CommitMessages.FEATURE)
+    repo.create_branch('feature', 'release')
+
+    repo.checkout('release')
+    repo.commit(CommitMessages.FIX)
+    actual_output_release = run_action(args_release)
+
+    repo.checkout('feature')
+    repo.commit(CommitMessages.FIX)
+    actual_output_feature = run_action(args_feature)
+
+    # Assert
+    assert_that(actual_output_release).is_equal_to(expected_output_release)
+    assert_that(actual_output_feature).is_equal_to(expected_output_feature)
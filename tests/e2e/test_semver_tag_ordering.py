@@ -0,0 +1,139 @@
+"""Test the scenarios where the tag on the newest commit is not the highest version."""
+# pylint: disable=too-many-locals,too-many-lines,duplicate-code,too-many-statements,unused-import,redefined-outer-name
+from assertpy import assert_that
+
+from test_utils import ActionInputs, ActionOutputs, CommitMessages, logging, TestRepo, repo, run_action
+
+
+def test_hotfix_on_tagged_commit(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a ``fix:`` commit, tag a hotfix version on the same commit within the same
+    second and run the action for a hotfix after another ``fix:`` commit.
+    """
+    # Arrange
+    args_fix = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=True
+    )
+
+    expected_output_fix = ActionOutputs(
+        version='0.0.1',
+        version_name='v0.0.1',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    args_hotfix_commit_date = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        bumping_suffix='hotfix',
+        only_bump_suffix=True,
+        create_tag=False
+    )
+
+    # Both tags are on the same commit, so the alphabetically first tag is the latest version.
+    expected_output_hotfix_commit_date = ActionOutputs(
+        version='0.0.1-hotfix.1',
+        version_name='v0.0.1-hotfix.1',
+        previous_version='0.0.1',
+        previous_version_name='v0.0.1',
+        tag_created=True
+    )
+
+    args_hotfix_semver = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        bumping_suffix='hotfix',
+        only_bump_suffix=True,
+        tag_ordering='semver',
+        create_tag=False
+    )
+
+    expected_output_hotfix_semver = ActionOutputs(
+        version='0.0.1-hotfix.2',
+        version_name='v0.0.1-hotfix.2',
+        previous_version='0.0.1-hotfix.1',
+        previous_version_name='v0.0.1-hotfix.1',
+        tag_created=True
+    )
+
+    # Act
+    repo.checkout('release')
+    repo.commit(CommitMessages.FIX)
+    actual_output_fix = run_action(args_fix)
+    repo.tag('v0.0.1-hotfix.1')
+
+    repo.commit(CommitMessages.FIX)
+    actual_output_hotfix_commit_date = run_action(args_hotfix_commit_date)
+    actual_output_hotfix_semver = run_action(args_hotfix_semver)
+
+    # Assert
+    assert_that(actual_output_fix).is_equal_to(expected_output_fix)
+    assert_that(actual_output_hotfix_commit_date).is_equal_to(expected_output_hotfix_commit_date)
+    assert_that(actual_output_hotfix_semver).is_equal_to(expected_output_hotfix_semver)
+
+
+def test_fix_after_older_major_version(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a ``fix:`` commit, when the highest version is tagged on an older commit than
+    a lower version.
+    """
+    # Arrange
+    args_commit_date = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    expected_output_commit_date = ActionOutputs(
+        version='0.5.1',
+        version_name='v0.5.1',
+        previous_version='0.5.0',
+        previous_version_name='v0.5.0',
+        tag_created=True
+    )
+
+    args_semver = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        tag_ordering='semver',
+        create_tag=False
+    )
+
+    expected_output_semver = ActionOutputs(
+        version='1.0.1',
+        version_name='v1.0.1',
+        previous_version='1.0.0',
+        previous_version_name='v1.0.0',
+        tag_created=True
+    )
+
+    # Act
+    repo.checkout('release')
+    repo.tag('v1.0.0')
+    repo.commit(CommitMessages.CHORE)
+    repo.tag('v0.5.0')
+    repo.commit(CommitMessages.FIX)
+    actual_output_commit_date = run_action(args_commit_date)
+    actual_output_semver = run_action(args_semver)
+
+    # Assert
+    assert_that(actual_output_commit_date).is_equal_to(expected_output_commit_date)
+    assert_that(actual_output_semver).is_equal_to(expected_output_semver)
@@ -0,0 +1,91 @@
+"""Test the scenarios where squash merges list the squashed conventional commits in their body."""
+# pylint: disable=too-many-locals,too-many-lines,duplicate-code,too-many-statements,unused-import,redefined-outer-name
+from assertpy import assert_that
+
+from test_utils import ActionInputs, ActionOutputs, CommitMessages, logging, TestRepo, repo, run_action
+
+
+def test_squash_merge(repo: TestRepo) -> None:
+    """
+    Test Case: Run the action after a squash merge, whose subject is the pull request title and whose body lists a
+    ``chore:`` and a ``feat:`` commit, first without and then with classifying the entries of the body.
+    """
+    # Arrange
+    args_subject = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        create_tag=False
+    )
+
+    expected_output_subject = ActionOutputs(
+        version='0.0.0',
+        version_name='v0.0.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=False
+    )
+
+    args_entries = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        squash_merge_entries=True,
+        create_tag=True
+    )
+
+    expected_output_entries = ActionOutputs(
+        version='0.1.0',
+        version_name='v0.1.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    # Act
+    repo.commit(f'Add the export (#42)\n\n* {CommitMessages.CHORE}\n\n* {CommitMessages.FEATURE}')
+    repo.merge('main', 'release')
+
+    actual_output_subject = run_action(args_subject)
+    actual_output_entries = run_action(args_entries)
+    tag_entries = repo.get_latest_tag_name()
+
+    # Assert
+    assert_that(actual_output_subject).is_equal_to(expected_output_subject)
+
+    assert_that(actual_output_entries).is_equal_to(expected_output_entries)
+    assert_that(tag_entries).is_equal_to(expected_output_entries.version_name)
+
+
+def test_breaking_entry(repo: TestRepo) -> None:
+    """Test Case: Run the action after a squash merge whose body lists a breaking ``fix!:`` commit."""
+    # Arrange
+    args_release = ActionInputs(
+        git_username='wemogy IT',
+        git_email='it@wemogy.com',
+        prefix='v',
+        suffix=None,
+        reference_version_suffix=None,
+        squash_merge_entries=True,
+        create_tag=True
+    )
+
+    expected_output_release = ActionOutputs(
+        version='1.0.0',
+        version_name='v1.0.0',
+        previous_version='',
+        previous_version_name='',
+        tag_created=True
+    )
+
+    # Act
+    repo.commit(f'Rename the columns (#43)\n\n* {CommitMessages.FEATURE}\n\n* {CommitMessages.BREAKING_FIX}')
+    repo.merge('main', 'release')
+    actual_output_release = run_action(args_release)
+
+    # Assert
+    assert_that(actual_output_release).is_equal_to(expected_output_release)
@@ -123,17 +123,32 @@ class TestRepo:
         self.repo.index.add(file_name)
         return self.repo.index.commit(message)
 
-    def merge(self, source_branch_name: str, dest_branch_name: str) -> None:
+    def tag(self, name: str, commit: Commit | None = None) -> None:
+        """
+        Create a lightweight tag without waiting, so several tags can be created within the same second.
+
+        :param name: The name of the tag.
+        :param commit: The commit to tag. Defaults to the current ``HEAD``.
+        """
+        logger.info('Creating tag %s', name)
+        self.repo.create_tag(name, ref=commit or self.repo.head.commit)
+
+    def merge(self, source_branch_name: str, dest_branch_name: str, message: str | None = None) -> None:
         """
         Merge a branch into another branch and check out the destination branch.
 
         :param source_branch_name: The branch name to merge from.
         :param dest_branch_name: The branch name to merge into.
+        :param message: Always create a merge commit with this message, instead of fast-forwarding if possible.
         :raises GitBranchNotFoundError: If the destination branch was not found.
         """
         logger.info('Merging branch %s into branch %s', source_branch_name, dest_branch_name)
         self.checkout(dest_branch_name)
-        self.repo.git.merge(source_branch_name)
+
+        if message is None:
+            self.repo.git.merge(source_branch_name)
+        else:
+            self.repo.git.merge(source_branch_name, no_ff=True, message=message)
 
     def cherrypick(self, commit: Commit, dest_branch_name: str) -> None:
         """
@@ -0,0 +1,25 @@
+"""Helpers for creating git repositories in the unit tests."""
+import os
+import subprocess
+from pathlib import Path
+
+__all__ = [
+    'GIT_ENV',
+    'git'
+]
+
+GIT_ENV = {
+    **os.environ,
+    'GIT_AUTHOR_NAME': 'wemogy IT',
+    'GIT_AUTHOR_EMAIL': 'it@wemogy.com',
+    'GIT_COMMITTER_NAME': 'wemogy IT',
+    'GIT_COMMITTER_EMAIL': 'it@wemogy.com'
+}
+"""The environment for git commands, with an identity for creating commits and tags."""
+
+
+def git(path: Path, *args: str) -> str:
+    """Run a git command in the repository and return its output."""
+    return subprocess.run(
+        ['git', *args], cwd=path, env=GIT_ENV, check=True, stdout=subprocess.PIPE, text=True
+    ).stdout.strip()
@@ -0,0 +1,183 @@
+"""Test that the version bumps of commits are cached between runs, so a warm run doesn't parse any commit."""
+# pylint: disable=redefined-outer-name
+from pathlib import Path
+
+import git as gitpython
+import pytest
+from assertpy import assert_that
+
+from bench_utils import create_synthetic_repo
+from git_utils import git
+from get_release_version_action.algorithms import semantic
+from get_release_version_action.algorithms.commit_classifier import CommitClassifier
+from get_release_version_action.models import Inputs
+from get_release_version_action.utils import CommitCache, GitSession, GitTag
+
+MESSAGES = [f'fix: commit {i}' if i % 10 else f'feat: commit {i}' for i in range(100)]
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    """Create a repository with a linear history of fixes and features."""
+    path = tmp_path / 'repo'
+    path.mkdir()
+    create_synthetic_repo(path, len(MESSAGES), MESSAGES.__getitem__)
+    return path
+
+
+@pytest.fixture
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the messages the commit classifier parses."""
+    parsed_messages: list[str] = []
+    classify = CommitClassifier.classify
+
+    def recording_classify(self: CommitClassifier, message: str) -> int:
+        parsed_messages.append(message)
+        return classify(self, message)
+
+    monkeypatch.setattr(CommitClassifier, 'classify', recording_classify)
+    return parsed_messages
+
+
+def run(repo_path: Path, inputs: Inputs, cache_dir: Path | None = None, tag: GitTag | None = None) -> tuple[str, bool]:
+    """Determine the next version in a new session, like a run of the action does."""
+    with gitpython.Repo(repo_path) as repo, GitSession(repo, cache_dir=cache_dir) as session:
+        return semantic.analyze_commits(session, tag, '1.2.3', inputs)
+
+
+def get_tag(repo_path: Path, rev: str) -> GitTag:
+    """Get a tag on the commit of the revision, without creating it."""
+    sha, committed_date = git(repo_path, 'log', '-1', '--format=%H %ct', rev).split()
+    return GitTag(name=rev, commit_sha=sha, committed_date=int(committed_date))
+
+
+def test_warm_run_parses_nothing(repo_path: Path, parsed: list[str]) -> None:
+    """Test Case: A second run determines the same version without parsing a commit."""
+    # Act
+    cold_version = run(repo_path, Inputs())
+    cold_parsed = list(parsed)
+    parsed.clear()
+    warm_version = run(repo_path, Inputs())
+
+    # Assert
+    assert_that(cold_version).is_equal_to(('1.3.0', True))
+    assert_that(warm_version).is_equal_to(cold_version)
+    assert_that(sorted(cold_parsed)).is_equal_to(sorted(MESSAGES))
+    assert_that(parsed).is_empty()
+
+
+def test_new_commits_are_parsed(repo_path: Path, parsed: list[str]) -> None:
+    """Test Case: A run after new commits only parses the new commits."""
+    # Arrange
+    run(repo_path, Inputs())
+    parsed.clear()
+    git(repo_path, 'commit', '--quiet', '--allow-empty', '--message', 'feat!: a breaking change')
+
+    # Act
+    version = run(repo_path, Inputs())
+
+    # Assert
+    assert_that(version).is_equal_to(('2.0.0', True))
+    assert_that(parsed).is_equal_to(['feat!: a breaking change\n'])
+
+
+def test_versions_share_cache(repo_path: Path, parsed: list[str]) -> None:
+    """
+    Test Case: Runs since different versions, e.g. of the release and the release-beta channel, only parse the
+    commits that no run has parsed yet.
+    """
+    # Act
+    run(repo_path, Inputs(), tag=get_tag(repo_path, 'HEAD~59'))
+    release_parsed = list(parsed)
+    parsed.clear()
+    run(repo_path, Inputs(), tag=get_tag(repo_path, 'HEAD~79'))
+    beta_parsed = list(parsed)
+    parsed.clear()
+    run(repo_path, Inputs(), tag=get_tag(repo_path, 'HEAD~59'))
+
+    # Assert
+    assert_that(sorted(release_parsed)).is_equal_to(sorted(MESSAGES[41:]))
+    assert_that(sorted(beta_parsed)).is_equal_to(sorted(MESSAGES[21:41]))
+    assert_that(parsed).is_empty()
+
+
+def test_cache_per_configuration(repo_path: Path, parsed: list[str]) -> None:
+    """Test Case: Inputs that change the bumps of commits have their own cache."""
+    # Arrange
+    run(repo_path, Inputs())
+    parsed.clear()
+
+    # Act
+    run(repo_path, Inputs(parse_merge_bodies=True))
+    run(repo_path, Inputs(parse_merge_bodies=True))
+
+    # Assert
+    assert_that(sorted(parsed)).is_equal_to(sorted(MESSAGES))
+    assert_that(list((repo_path / '.git' / 'get-release-version-action').glob('bumps-*'))).is_length(2)
+
+
+def test_cache_dir(repo_path: Path, tmp_path: Path, parsed: list[str]) -> None:
+    """Test Case: The caches are written to the configured cache directory."""
+    # Act
+    run(repo_path, Inputs(), tmp_path / 'cache')
+    parsed.clear()
+    run(repo_path, Inputs(), tmp_path / 'cache')
+
+    # Assert
+    assert_that(parsed).is_empty()
+    assert_that(list((tmp_path / 'cache').glob('bumps-*'))).is_length(1)
+    assert_that(str(repo_path / '.git' / 'get-release-version-action')).does_not_exist()
+
+
+def test_cache_drops_least_recently_used(tmp_path: Path) -> None:
+    """
+    Test Case: A full cache drops the least recently used value for a new one. The values of a run are more recently
+    used than the ones of earlier runs, and the first ones of a run the most recently.
+    """
+    # Arrange
+    cache = CommitCache(tmp_path / 'cache', 'header', max_entries=3)
+
+    for sha in 'abc':
+        cache.set(sha, sha.upper())
+
+    cache.save()
+
+    # Act
+    cache = CommitCache(tmp_path / 'cache', 'header', max_entries=3)
+    values = [cache.get('a'), cache.get('x')]
+    cache.set('d', 'D')
+    cache.save()
+
+    # Assert
+    assert_that(values).is_equal_to(['A', None])
+    assert_that((tmp_path / 'cache').read_text(encoding='utf-8')).is_equal_to('header\nb\tB\nd\tD\na\tA\n')
+
+
+def test_full_cache_keeps_first_values_of_run(tmp_path: Path) -> None:
+    """Test Case: A run that sets more values than the cache holds only caches the first ones, the newest commits."""
+    # Arrange
+    cache = CommitCache(tmp_path / 'cache', 'header', max_entries=2)
+
+    # Act
+    for sha in 'abc':
+        cache.set(sha, sha.upper())
+
+    cache.save()
+
+    # Assert
+    assert_that(cache).is_length(2)
+    assert_that([cache.get(sha) for sha in 'abc']).is_equal_to(['A', 'B', None])
+    assert_that((tmp_path / 'cache').read_text(encoding='utf-8')).is_equal_to('header\nb\tB\na\tA\n')
+
+
+def test_cache_file_larger_than_cache(tmp_path: Path) -> None:
+    """Test Case: Only the most recently used values of a file with more values than the cache holds are loaded."""
+    # Arrange
+    (tmp_path / 'cache').write_text('header\na\tA\nb\tB\nc\tC\n', encoding='utf-8')
+
+    # Act
+    cache = CommitCache(tmp_path / 'cache', 'header', max_entries=2)
+
+    # Assert
+    assert_that(cache).is_length(2)
+    assert_that([cache.get(sha) for sha in 'abc']).is_equal_to([None, 'B', 'C'])
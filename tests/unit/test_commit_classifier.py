@@ -0,0 +1,202 @@
+"""Test that the built-in commit classifier determines the same bumps as the ``AngularCommitParser``."""
+import random
+from itertools import product
+from pathlib import Path
+from typing import cast
+
+import git
+import pytest
+from assertpy import assert_that
+from semantic_release import LevelBump, ParseError
+from semantic_release.commit_parser import AngularCommitParser, AngularParserOptions
+
+from get_release_version_action.algorithms.commit_classifier import CommitClassifier, CommitTypes
+from get_release_version_action.utils import CommitMessage
+
+TYPES = [
+    'feat', 'fix', 'perf', 'chore', 'docs', 'build', 'ci', 'style', 'refactor', 'test', 'Feat', 'FIX', 'feature',
+    'fixup', 'features', 'revert', 'tests', 'bug', ' fix', ''
+]
+CUSTOM_TYPES = CommitTypes(
+    allowed=('feature', 'feat', 'fix', 'perf', 'refactor', 'revert', 'chore'),
+    minor=('feature', 'feat'),
+    patch=('fix', 'perf', 'refactor', 'revert')
+)
+SCOPES = ['', '(api)', '()', '(a)(b)', '(a\n)', '(scope with spaces)', '(a): (b)', '(']
+BREAKING_MARKS = ['', '!', '!!']
+SEPARATORS = [': ', ':', ':  ', ':\t', ':\n', ': \n\n', ' : ', ':\r\n']
+SUBJECTS = ['add a thing', '', 'BREAKING CHANGE: in the subject', 'x\n', 'fix: nested']
+BODIES = [
+    '',
+    '\n',
+    '\n\n',
+    '\n\nA body.',
+    '\n\nA body.\n\nBREAKING CHANGE: it breaks',
+    '\n\nBREAKING CHANGE: it breaks',
+    '\n\nBREAKING-CHANGE: it breaks',
+    '\n\nBREAKING CHANGE:',
+    '\n\nBREAKING CHANGE it breaks',
+    '\n\nBREAKING\nCHANGE: split over two lines',
+    '\n\nBREAKING \nCHANGE: two spaces after joining the lines',
+    '\n\nBREAKING\n\nCHANGE: two paragraphs',
+    '\n\n  BREAKING CHANGE: indented',
+    '\n\n\n\nBREAKING CHANGE: after empty lines',
+    '\n\n \n\nBREAKING CHANGE: after a blank paragraph',
+    '\n\nA body\nBREAKING CHANGE: not at the start of the paragraph',
+    '\nBREAKING CHANGE: no empty line after the subject',
+    '\n\nbreaking change: lowercase',
+    '\r\n\r\nBREAKING CHANGE: windows line endings',
+    '\n\nA body\r\n\r\nBREAKING CHANGE: windows line endings',
+    '\n\nBREAK\rING CHANGE: carriage return',
+    '\n\n\u2003BREAKING CHANGE: unicode space',
+    '\n\n\x1cBREAKING CHANGE: file separator',
+    '\n\nA body\n\n\n\n\nBREAKING CHANGE: many empty lines',
+    '\n\nSigned-off-by: someone\n\nBREAKING-CHANGE: footer'
+]
+
+FUZZ_TOKENS = [
+    'feat', 'fix', 'perf', 'chore', '(', ')', '!', ':', ' ', '\n', '\n\n', '\r', '\t', 'BREAKING', 'CHANGE', '-',
+    'BREAKING CHANGE:', 'x', 'scope', ' '
+]
+
+
+def get_angular_bump(commit_parser: AngularCommitParser, message: str) -> int:
+    """Get the bump the ``AngularCommitParser`` determines, reduced to an integer."""
+    result = commit_parser.parse(cast(git.Commit, CommitMessage(hexsha='0' * 40, message=message)))
+
+    if isinstance(result, ParseError):
+        return 0
+
+    return {LevelBump.MAJOR: 3, LevelBump.MINOR: 2, LevelBump.PATCH: 1}.get(result.bump, 0)
+
+
+def generate_messages() -> list[str]:
+    """Combine the parts of messages above and add random messages of the fuzz tokens."""
+    messages = [
+        ''.join(parts) for parts in product(TYPES, SCOPES, BREAKING_MARKS, SEPARATORS, SUBJECTS, BODIES)
+    ]
+    generator = random.Random(42)
+    messages.extend(
+        ''.join(generator.choices(FUZZ_TOKENS, k=generator.randint(1, 20))) for _ in range(20_000)
+    )
+    return messages
+
+
+@pytest.mark.parametrize('chunk', range(8))
+def test_equivalent_to_angular_commit_parser(chunk: int) -> None:
+    """Test Case: Every message of the corpus gets the bump the ``AngularCommitParser`` determines."""
+    # Arrange
+    commit_parser = AngularCommitParser(AngularParserOptions())
+    classifier = CommitClassifier()
+    messages = generate_messages()[chunk::8]
+
+    # Act
+    actual = {message: classifier.classify(message) for message in messages}
+
+    # Assert
+    expected = {message: get_angular_bump(commit_parser, message) for message in messages}
+    assert_that(actual).is_equal_to(expected)
+    assert_that(set(actual.values())).is_equal_to({0, 1, 2, 3})
+
+
+@pytest.mark.parametrize('chunk', range(2))
+def test_custom_types_equivalent_to_angular_commit_parser(chunk: int) -> None:
+    """Test Case: With configured commit types, every message gets the bump of the ``AngularCommitParser``."""
+    # Arrange
+    commit_parser = AngularCommitParser(AngularParserOptions(
+        allowed_tags=CUSTOM_TYPES.allowed,
+        minor_tags=CUSTOM_TYPES.minor,
+        patch_tags=CUSTOM_TYPES.patch
+    ))
+    classifier = CommitClassifier(CUSTOM_TYPES)
+    messages = generate_messages()[chunk::16]
+
+    # Act
+    actual = {message: classifier.classify(message) for message in messages}
+
+    # Assert
+    expected = {message: get_angular_bump(commit_parser, message) for message in messages}
+    assert_that(actual).is_equal_to(expected)
+    assert_that(set(actual.values())).is_equal_to({0, 1, 2, 3})
+
+
+def test_breaking_footers() -> None:
+    """Test Case: Only the configured breaking change footers are a major bump, a space also matches a line break."""
+    # Arrange
+    classifier = CommitClassifier(CommitTypes(breaking_footers=('BREAKS', 'API CHANGE')))
+    no_footers = CommitClassifier(CommitTypes(breaking_footers=()))
+
+    # Act
+    actual = [
+        classifier.classify('fix: a\n\nBREAKS: it'),
+        classifier.classify('fix: a\n\nAPI\nCHANGE: it'),
+        classifier.classify('fix: a\n\nBREAKING CHANGE: it'),
+        no_footers.classify('fix: a\n\nBREAKING CHANGE: it'),
+        no_footers.classify('fix!: a')
+    ]
+
+    # Assert
+    assert_that(actual).is_equal_to([3, 3, 1, 1, 3])
+
+
+def test_load_commit_types(tmp_path: Path) -> None:
+    """Test Case: The lists of the config file replace the defaults, the missing ones keep them."""
+    # Arrange
+    path = tmp_path / 'commit-types.yaml'
+    path.write_text('patch: [fix, perf, refactor]\nbreaking-footers: [BREAKS]\n', encoding='utf-8')
+
+    # Act
+    commit_types = CommitTypes.load(path)
+
+    # Assert
+    assert_that(commit_types).is_equal_to(
+        CommitTypes(patch=('fix', 'perf', 'refactor'), breaking_footers=('BREAKS',))
+    )
+
+
+@pytest.mark.parametrize('config', ['[feat]', 'unknown: [feat]', 'minor: feat', 'patch: [fix, 1]', 'allowed: []'])
+def test_load_invalid_commit_types(tmp_path: Path, config: str) -> None:
+    """Test Case: A config file that isn't a mapping of the known lists of commit types is rejected."""
+    # Arrange
+    path = tmp_path / 'commit-types.yaml'
+    path.write_text(config, encoding='utf-8')
+
+    # Act & Assert
+    assert_that(CommitTypes.load).raises(ValueError).when_called_with(path)
+
+
+@pytest.mark.parametrize(('message', 'expected'), [
+    ('Add the export (#42)\n\n* feat: export CSV\n\n* fix: rename columns', 2),
+    ('Add the export (#42)\n\n* chore: update\n* fix!: rename columns', 3),
+    ('Add the export (#42)\n\n- fix(report): rename columns', 1),
+    ('Add the export (#42)\n\nfeat: without a list item', 2),
+    ('Add the export (#42)\n\n  *  docs: indented\n*feat: without a space', 0),
+    ('Add the export (#42)\n\nThe feat: is not at the start of the line', 0),
+    ('Add the export (#42)\n\n* feature: unknown type\n* feat:', 0),
+    ('Add the export (#42)\n\n* fix: a\r\n\r\nBREAKING CHANGE: footer of an entry', 3),
+    ('Add the export (#42)\nBREAKING CHANGE: not a paragraph', 0),
+    ('fix: a fix\n\n* feat: an entry', 2),
+    ('feat!: breaking', 3),
+    ('Add the export (#42)', 0)
+])
+def test_classify_entries(message: str, expected: int) -> None:
+    """Test Case: The bump of a message is the maximum bump of its header, the entries of its body and its footers."""
+    # Act
+    actual = CommitClassifier().classify_entries(message)
+
+    # Assert
+    assert_that(actual).is_equal_to(expected)
+
+
+@pytest.mark.parametrize('chunk', range(2))
+def test_classify_entries_includes_header(chunk: int) -> None:
+    """Test Case: The entries of the body never lower the bump of a message."""
+    # Arrange
+    classifier = CommitClassifier()
+    messages = generate_messages()[chunk::16]
+
+    # Act
+    lowered = [message for message in messages if classifier.classify_entries(message) < classifier.classify(message)]
+
+    # Assert
+    assert_that(lowered).is_empty()
@@ -0,0 +1,106 @@
+"""Test that the commit-graph reader and the reachability checks through it agree with git."""
+# pylint: disable=redefined-outer-name
+import subprocess
+from pathlib import Path
+
+import git as gitpython
+import pytest
+from assertpy import assert_that
+
+from git_utils import GIT_ENV, git
+from get_release_version_action.utils import GitSession
+from get_release_version_action.utils.commit_graph import CommitGraph
+from get_release_version_action.utils.commits import find_reachable_commits
+
+START_DATE = 1_700_000_000
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a repository with two branches, a merge and an octopus merge, the tips are not in the commit-graph."""
+    date = START_DATE
+
+    def commit(message: str) -> None:
+        nonlocal date
+        date += 1
+        monkeypatch.setitem(GIT_ENV, 'GIT_COMMITTER_DATE', f'{date} +0000')
+        git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', message)
+
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    commit('chore: initial')
+    git(tmp_path, 'switch', '--quiet', '--create', 'side')
+    commit('feat: side')
+    git(tmp_path, 'switch', '--quiet', '--create', 'other', 'main')
+    commit('fix: other')
+    git(tmp_path, 'switch', '--quiet', 'main')
+    commit('fix: main')
+    git(tmp_path, 'merge', '--quiet', '--no-ff', '--no-edit', 'side', 'other')
+    git(tmp_path, 'switch', '--quiet', 'side')
+    commit('fix: side')
+    git(tmp_path, 'commit-graph', 'write', '--reachable')
+    commit('fix: not in the graph')
+    git(tmp_path, 'switch', '--quiet', 'main')
+    git(tmp_path, 'merge', '--quiet', '--no-ff', '--no-edit', 'side')
+    return tmp_path
+
+
+def test_commit_graph_equals_git(repo_path: Path) -> None:
+    """Test Case: The parents, timestamps and generation numbers are the ones of the commit objects."""
+    # Arrange
+    commits = [line.split() for line in git(repo_path, 'log', '--all', '--format=%H %ct %P').splitlines()]
+    levels: dict[str, int] = {}
+
+    for sha, _, *parents in reversed(commits):
+        levels[sha] = 1 + max((levels[parent] for parent in parents), default=0)
+
+    graph = CommitGraph.open(repo_path / '.git')
+    assert graph is not None
+
+    # Act
+    with_graph = {sha: graph.find(sha) for sha, *_ in commits}
+
+    # Assert
+    assert_that([sha for sha, position in with_graph.items() if position is None]).is_length(2)
+
+    for sha, committed_date, *parents in commits:
+        position = with_graph[sha]
+
+        if position is not None:
+            assert_that(graph.get_sha(position)).is_equal_to(sha)
+            assert_that([graph.get_sha(parent) for parent in graph.get_parents(position)]).is_equal_to(parents)
+            assert_that(graph.get_committed_date(position)).is_equal_to(int(committed_date))
+            assert_that(graph.get_generation(position)).is_equal_to(levels[sha])
+
+    graph.close()
+
+
+def test_commit_graph_without_file(tmp_path: Path) -> None:
+    """Test Case: A repository without a commit-graph has no graph."""
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+
+    assert_that(CommitGraph.open(tmp_path / '.git')).is_none()
+
+
+@pytest.mark.parametrize('rev', ['main', 'side', 'other', 'main~1'])
+def test_find_reachable_commits_equals_git(repo_path: Path, rev: str) -> None:
+    """Test Case: The reachable commits are the ones git considers ancestors, the walk needs no git command."""
+    # Arrange
+    commits = git(repo_path, 'log', '--format=%H', '--max-parents=1', 'main~1', 'side~1', 'other').split()
+    expected = {
+        sha for sha in commits
+        if subprocess.run(['git', 'merge-base', '--is-ancestor', sha, rev], cwd=repo_path, check=False).returncode == 0
+    }
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Act
+        actual = find_reachable_commits(session, commits, rev)
+
+        # Assert
+        assert_that(actual).is_equal_to(expected)
+        assert_that(session.spawned_processes).is_equal_to(1)
+
+
+def test_find_reachable_commits_outside_of_graph(repo_path: Path) -> None:
+    """Test Case: A commit that is not in the commit-graph can't be checked through it."""
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        assert_that(find_reachable_commits(session, [git(repo_path, 'rev-parse', 'side')])).is_none()
@@ -0,0 +1,219 @@
+"""Test that walking the commits through the object reader of a session agrees with git and GitPython."""
+# pylint: disable=redefined-outer-name
+import tracemalloc
+from pathlib import Path
+
+import git as gitpython
+import pytest
+from assertpy import assert_that
+
+from bench_utils import create_synthetic_repo
+from git_utils import GIT_ENV, git
+from get_release_version_action.utils import GitSession
+from get_release_version_action.utils.commits import iter_commit_messages, iter_commit_shas, read_commits
+
+MESSAGES = [
+    'chore: first',
+    'feat(scope): second\n\nWith a body\n\nBREAKING CHANGE: and a footer',
+    'fix: ümläut and emoji 🎉',
+    'fix: a long message\n\n' + 'x' * (1 << 17),
+    'docs: trailing blank lines\n\n\n'
+]
+
+START_DATE = 1_700_000_000
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    """Create a repository with one commit per message."""
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    message_file = tmp_path.parent / f'{tmp_path.name}-message'
+
+    for message in MESSAGES:
+        message_file.write_text(message, encoding='utf-8')
+        git(tmp_path, 'commit', '--quiet', '--allow-empty', '--cleanup=verbatim', '--file', str(message_file))
+
+    return tmp_path
+
+
+@pytest.fixture(params=[None, 'partial', 'split'])
+def merge_repo_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest) -> Path:
+    """
+    Create a repository with release branches that receive merges and cherry-picks, a tag on a side branch,
+    an octopus merge and some commits with the same timestamp.
+
+    The repository has no commit-graph, a commit-graph of the first half of the history or a split commit-graph
+    with a layer for each half.
+    """
+    date = START_DATE
+
+    def commit(message: str, tick: bool = True) -> None:
+        nonlocal date
+        date += tick
+        monkeypatch.setitem(GIT_ENV, 'GIT_COMMITTER_DATE', f'{date} +0000')
+        monkeypatch.setitem(GIT_ENV, 'GIT_AUTHOR_DATE', f'{date} +0000')
+        git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', message)
+
+    def merge(*branches: str) -> None:
+        nonlocal date
+        date += 1
+        monkeypatch.setitem(GIT_ENV, 'GIT_COMMITTER_DATE', f'{date} +0000')
+        git(tmp_path, 'merge', '--quiet', '--no-ff', '--no-edit', *branches)
+
+    def write_commit_graph() -> None:
+        if request.param == 'partial':
+            git(tmp_path, 'commit-graph', 'write', '--reachable')
+        elif request.param == 'split':
+            git(tmp_path, 'commit-graph', 'write', '--reachable', '--split=no-merge')
+
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    commit('chore: initial')
+    git(tmp_path, 'branch', 'release')
+    commit('feat: one')
+    commit('fix: two', tick=False)
+    git(tmp_path, 'switch', '--quiet', 'release')
+    commit('fix: hotfix')
+    git(tmp_path, 'tag', 'v0.0.1')
+    merge('main')
+    git(tmp_path, 'switch', '--quiet', '--create', 'side', 'main~1')
+    commit('feat: side')
+    git(tmp_path, 'tag', 'side-tag')
+    commit('fix: side')
+    git(tmp_path, 'switch', '--quiet', 'main')
+    commit('feat: three')
+    write_commit_graph()
+    merge('side')
+    git(tmp_path, 'switch', '--quiet', '--create', 'octopus-one')
+    commit('fix: octopus one')
+    git(tmp_path, 'switch', '--quiet', '--create', 'octopus-two', 'main')
+    commit('fix: octopus two')
+    git(tmp_path, 'switch', '--quiet', 'main')
+    merge('octopus-one', 'octopus-two')
+    merge('release')
+    commit('fix: four', tick=False)
+    git(tmp_path, 'switch', '--quiet', 'release')
+    merge('main')
+
+    if request.param == 'split':
+        write_commit_graph()
+
+    return tmp_path
+
+
+def test_iter_commit_messages_equals_gitpython(repo_path: Path) -> None:
+    """Test Case: The hashes and messages are the ones of the ``git.Commit`` objects, newest first."""
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Arrange
+        expected = [(commit.hexsha, commit.message) for commit in repo.iter_commits('HEAD')]
+
+        # Act
+        actual = [(commit.hexsha, commit.message) for commit in iter_commit_messages(session)]
+
+    # Assert
+    assert_that(actual).is_length(len(MESSAGES))
+    assert_that(actual).is_equal_to(expected)
+
+
+@pytest.mark.parametrize('rev', ['HEAD', 'main', 'side', 'release~1'])
+@pytest.mark.parametrize('exclude', [None, 'v0.0.1', 'side-tag', 'main~2', 'release~1', 'release'])
+@pytest.mark.parametrize('max_age', [None, START_DATE + 3, START_DATE + 6])
+def test_iter_commit_messages_equals_git_log(
+        merge_repo_path: Path,
+        rev: str,
+        exclude: str | None,
+        max_age: int | None
+) -> None:
+    """Test Case: The selected commits and their order are the ones of ``git log``, with and without messages."""
+    # Arrange
+    args = ['log', '--format=%H', *([f'--max-age={max_age}'] if max_age is not None else [])]
+    expected = git(merge_repo_path, *args, f'{exclude}..{rev}' if exclude is not None else rev, '--').split()
+
+    with gitpython.Repo(merge_repo_path) as repo, GitSession(repo) as session:
+        # Act
+        exclude_sha = git(merge_repo_path, 'rev-parse', exclude) if exclude is not None else None
+        actual = [commit.hexsha for commit in iter_commit_messages(session, rev, exclude_sha, max_age)]
+        actual_shas = list(iter_commit_shas(session, rev, exclude_sha, max_age))
+
+        # Assert
+        assert_that(actual).is_equal_to(expected)
+        assert_that(actual_shas).is_equal_to(expected)
+        assert_that(session.spawned_processes).is_equal_to(1)
+        assert_that(session.commit_graph is not None).is_equal_to(
+            any((merge_repo_path / '.git' / 'objects' / 'info').glob('commit-graph*'))
+        )
+
+
+@pytest.mark.parametrize('rev', ['HEAD', 'main'])
+@pytest.mark.parametrize('exclude', [None, 'v0.0.1', 'side-tag', 'main~2'])
+@pytest.mark.parametrize('max_age', [None, START_DATE + 6])
+def test_iter_commit_messages_first_parent_equals_git_log(
+        merge_repo_path: Path,
+        rev: str,
+        exclude: str | None,
+        max_age: int | None
+) -> None:
+    """Test Case: The selected commits and their order are the ones of ``git log --first-parent``."""
+    # Arrange
+    args = ['log', '--first-parent', '--format=%H', *([f'--max-age={max_age}'] if max_age is not None else [])]
+    expected = git(merge_repo_path, *args, f'{exclude}..{rev}' if exclude is not None else rev, '--').split()
+
+    with gitpython.Repo(merge_repo_path) as repo, GitSession(repo) as session:
+        # Act
+        actual = [
+            commit.hexsha for commit in iter_commit_messages(
+                session,
+                rev,
+                git(merge_repo_path, 'rev-parse', exclude) if exclude is not None else None,
+                max_age,
+                first_parent=True
+            )
+        ]
+
+    # Assert
+    assert_that(actual).is_equal_to(expected)
+
+
+def test_read_commits_equals_git_log(repo_path: Path) -> None:
+    """Test Case: The parents and the author and committer timestamps of the commits are the ones of ``git log``."""
+    # Arrange
+    git(repo_path, 'commit', '--quiet', '--amend', '--allow-empty', '--no-edit', '--date=@1600000000 +0200')
+    expected = [line.split() for line in git(repo_path, 'log', '--format=%H %at %ct %P').splitlines()]
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Act
+        commits = read_commits(session, [sha for sha, *_ in expected])
+
+    # Assert
+    actual = [
+        [commit.sha, str(commit.author_date), str(commit.committed_date), *commit.parents]
+        for commit in commits if commit is not None
+    ]
+    assert_that(actual).is_equal_to(expected)
+
+
+def test_iter_commit_messages_without_commits(tmp_path: Path) -> None:
+    """Test Case: A repository without commits has no commits to walk."""
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+
+    with gitpython.Repo(tmp_path) as repo, GitSession(repo) as session:
+        assert_that(list(iter_commit_messages(session))).is_empty()
+
+
+def test_iter_commit_messages_memory_of_range(tmp_path: Path) -> None:
+    """Test Case: A walk of a huge range doesn't hold the messages of all commits in memory."""
+    # Arrange
+    messages = [f'fix: commit {i}\n\n' + 'x' * 8192 for i in range(4000)]
+    create_synthetic_repo(tmp_path, len(messages), messages.__getitem__)
+
+    with gitpython.Repo(tmp_path) as repo, GitSession(repo) as session:
+        root = git(tmp_path, 'rev-list', '--max-parents=0', 'HEAD')
+        tracemalloc.start()
+
+        # Act
+        walked = sum(1 for _ in iter_commit_messages(session, exclude=root, max_age=0))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    # Assert
+    assert_that(walked).is_equal_to(len(messages) - 1)
+    assert_that(peak).is_less_than(sum(len(message) for message in messages) // 2)
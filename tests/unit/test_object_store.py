@@ -0,0 +1,172 @@
+"""Test that reading objects in-process from the pack files and loose objects agrees with git."""
+# pylint: disable=redefined-outer-name
+import mmap
+from pathlib import Path
+from typing import Any
+
+import git as gitpython
+import pytest
+from assertpy import assert_that
+
+from git_utils import git
+from get_release_version_action.utils import GitSession
+from get_release_version_action.utils.commits import iter_commit_messages
+from get_release_version_action.utils import object_store
+from get_release_version_action.utils.object_store import ObjectStore
+
+BODY = '\n'.join(f'Line {i} of a long body that is the same in every commit message.' for i in range(100))
+
+
+@pytest.fixture(params=['loose', 'ofs-delta', 'ref-delta'])
+def repo_path(tmp_path: Path, request: pytest.FixtureRequest) -> Path:
+    """
+    Create a repository with commits whose messages differ only slightly, files and annotated tags.
+    The objects are loose or packed with deltas against an offset or an object hash.
+    Some commits are created after packing, so they are always loose.
+    """
+    message_file = tmp_path.parent / f'{tmp_path.name}-message'
+
+    def commit(i: int) -> None:
+        (tmp_path / 'file.txt').write_text(f'{BODY}\n{i}\n', encoding='utf-8')
+        message_file.write_text(f'fix: commit {i}\n\n{BODY}\n{i}', encoding='utf-8')
+        git(tmp_path, 'add', 'file.txt')
+        git(tmp_path, 'commit', '--quiet', '--file', str(message_file))
+
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+
+    for i in range(30):
+        commit(i)
+
+        if i % 10 == 0:
+            git(tmp_path, 'tag', '--annotate', '--message', f'Release {i}', f'v{i}')
+
+    git(tmp_path, '-c', 'advice.nestedTag=false', 'tag', '--annotate', '--message', 'Tag of a tag', 'v0-nested', 'v0')
+
+    if request.param != 'loose':
+        use_offsets = 'true' if request.param == 'ofs-delta' else 'false'
+        git(tmp_path, '-c', f'repack.useDeltaBaseOffset={use_offsets}', 'repack', '-a', '-d', '-f', '--quiet')
+
+    for i in range(30, 33):
+        commit(i)
+
+    return tmp_path
+
+
+def test_object_store_equals_git(repo_path: Path) -> None:
+    """Test Case: Every object has the type and contents git reads."""
+    # Arrange
+    shas = git(repo_path, 'cat-file', '--batch-all-objects', '--batch-check=%(objectname)').split()
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        expected = [(obj.type, obj.content) for obj in session.read_objects(shas) if obj is not None]
+
+    store = ObjectStore.open(repo_path / '.git')
+
+    # Act
+    actual = [store.read(sha) for sha in shas]
+
+    # Assert
+    assert_that(actual).is_equal_to(expected)
+    store.close()
+
+
+def test_object_store_resolves_deltas(repo_path: Path) -> None:
+    """Test Case: The packs of the fixture contain the delta chains the object store has to resolve."""
+    packs = list((repo_path / '.git' / 'objects' / 'pack').glob('*.idx'))
+
+    if not packs:
+        pytest.skip('The objects are not packed')
+
+    assert_that(git(repo_path, 'verify-pack', '--verbose', str(packs[0]))).contains('chain length = 2')
+
+
+def test_object_store_without_object(repo_path: Path) -> None:
+    """Test Case: Objects that don't exist are not found."""
+    store = ObjectStore.open(repo_path / '.git')
+
+    assert_that(store.read('0' * 40)).is_none()
+    assert_that(store.read('HEAD')).is_none()
+    store.close()
+
+
+def test_in_process_session_equals_git(repo_path: Path) -> None:
+    """Test Case: A session with the in-process object reader walks the commits without starting git."""
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        expected = [(commit.hexsha, commit.message) for commit in iter_commit_messages(session)]
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo, 'in-process') as session:
+        # Act
+        actual = [(commit.hexsha, commit.message) for commit in iter_commit_messages(session)]
+
+        # Assert
+        assert_that(actual).is_length(33)
+        assert_that(actual).is_equal_to(expected)
+        assert_that(session.spawned_processes).is_equal_to(0)
+
+
+@pytest.mark.parametrize('rev', ['v0^{commit}', 'v0-nested^{commit}', 'refs/tags/v10', 'HEAD~1', 'HEAD^{tree}'])
+def test_in_process_session_resolves_revisions(repo_path: Path, rev: str) -> None:
+    """Test Case: Tags are peeled in-process and revisions the object store can't resolve are read by git."""
+    # Arrange
+    name, separator, suffix = rev.partition('^')
+    revs = [git(repo_path, 'rev-parse', name) + separator + suffix if name.startswith('v') else rev, 'HEAD^{commit}']
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        expected = session.read_objects(revs)
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo, 'in-process') as session:
+        # Act
+        actual = session.read_objects(revs)
+
+        # Assert
+        assert_that(actual).is_equal_to(expected)
+        assert_that(session.spawned_processes).is_equal_to(1 if rev.startswith('HEAD') else 0)
+
+
+def test_in_process_session_reads_corrupt_object_through_git(repo_path: Path) -> None:
+    """Test Case: An object the object store fails to read, here a truncated loose object, is read by git instead."""
+    # Arrange
+    shas = git(repo_path, 'rev-parse', 'HEAD~1', 'HEAD').split()
+    object_path = repo_path / '.git' / 'objects' / shas[1][:2] / shas[1][2:]
+    object_path.chmod(0o644)
+    object_path.write_bytes(object_path.read_bytes()[:20])
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        expected = session.read_objects(shas)
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo, 'in-process') as session:
+        # Act
+        actual = session.read_objects(shas)
+
+        # Assert
+        assert_that(actual).is_equal_to(expected)
+        assert_that(actual[0]).is_not_none()
+        assert_that(session.spawned_processes).is_equal_to(1)
+
+
+def test_object_store_skips_unreadable_pack(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Case: A pack that can't be mapped (here an empty pack file) is skipped and its index is unmapped."""
+    # Arrange
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', 'chore: initial commit')
+    git(tmp_path, 'repack', '-a', '-d', '--quiet')
+    (pack_path,) = (tmp_path / '.git' / 'objects' / 'pack').glob('*.pack')
+    pack_path.chmod(0o644)
+    pack_path.write_bytes(b'')
+    maps: list[mmap.mmap] = []
+    original_mmap = mmap.mmap
+
+    def recording_mmap(*args: Any, **kwargs: Any) -> mmap.mmap:
+        maps.append(original_mmap(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(object_store.mmap, 'mmap', recording_mmap)
+
+    # Act
+    store = ObjectStore.open(tmp_path / '.git')
+
+    # Assert
+    assert_that(store.read(git(tmp_path, 'rev-parse', 'HEAD'))).is_none()
+    assert_that(maps).is_length(1)
+    assert_that(maps[0].closed).is_true()
+    store.close()
@@ -0,0 +1,91 @@
+"""Test that the commits above the parallel threshold are classified by worker processes with the same bumps."""
+# pylint: disable=redefined-outer-name
+import contextlib
+import random
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+
+from get_release_version_action.algorithms import classification_pool, semantic
+from get_release_version_action.algorithms.commit_classifier import CommitClassifier
+from get_release_version_action.models import Inputs
+from get_release_version_action.utils import CommitCache, CommitMessage
+
+HEADERS = ['feat: add a thing', 'fix: fix a thing', 'chore: update dependencies', 'feat!: break a thing', 'WIP']
+BODIES = ['', '\n\nA body.', '\n\nBREAKING CHANGE: the thing is removed']
+
+
+@pytest.fixture
+def commits() -> list[CommitMessage]:
+    """Create random conventional commits."""
+    generator = random.Random(42)
+    return [
+        CommitMessage(hexsha=f'{i:040x}', message=generator.choice(HEADERS) + generator.choice(BODIES))
+        for i in range(300)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Send small chunks to the worker processes, so the commits are spread over several chunks."""
+    monkeypatch.setattr(classification_pool, 'PARALLEL_CHUNK_SIZE', 16)
+
+
+def classify(commits: list[CommitMessage], inputs: Inputs, cache_path: Path) -> dict[str, int]:
+    """Classify the commits with two worker processes and save the cache."""
+    cache = CommitCache(cache_path, semantic.BUMP_CACHE_HEADER)
+    bumps = dict(semantic.classify_commits(commits, inputs, cache, workers=2))
+    cache.save()
+    return bumps
+
+
+def test_same_bumps_as_serial(commits: list[CommitMessage], tmp_path: Path) -> None:
+    """Test Case: The worker processes determine the same bumps as the classification in this process."""
+    # Act
+    parallel = classify(commits, Inputs(parallel_threshold=50), tmp_path / 'parallel')
+    serial = classify(commits, Inputs(parallel_threshold=0), tmp_path / 'serial')
+
+    # Assert
+    assert_that(parallel).is_equal_to(serial)
+    assert_that(parallel).is_length(len(commits))
+    assert_that(set(parallel.values())).is_equal_to({0, 1, 2, 3})
+    assert_that((tmp_path / 'parallel').read_text()).is_equal_to((tmp_path / 'serial').read_text())
+
+
+def test_threshold_classified_in_process(
+        commits: list[CommitMessage],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test Case: Only the commits up to the threshold are classified in this process, the cached ones not at all."""
+    # Arrange
+    classify(commits[:100], Inputs(parallel_threshold=0), tmp_path / 'cache')
+    parsed: list[str] = []
+    original_classify = CommitClassifier.classify
+
+    def recording_classify(self: CommitClassifier, message: str) -> int:
+        parsed.append(message)
+        return original_classify(self, message)
+
+    monkeypatch.setattr(CommitClassifier, 'classify', recording_classify)
+
+    # Act
+    bumps = classify(commits, Inputs(parallel_threshold=50), tmp_path / 'cache')
+
+    # Assert
+    assert_that(bumps).is_length(len(commits))
+    assert_that(parsed).is_equal_to([commit.message for commit in commits[100:150]])
+
+
+def test_stop_early(commits: list[CommitMessage], tmp_path: Path) -> None:
+    """Test Case: Closing the classification before all chunks are done stops the worker processes."""
+    # Arrange
+    cache = CommitCache(tmp_path / 'cache', semantic.BUMP_CACHE_HEADER)
+
+    # Act
+    with contextlib.closing(semantic.classify_commits(commits, Inputs(parallel_threshold=1), cache, 2)) as bumps:
+        first = [next(bumps) for _ in range(20)]
+
+    # Assert
+    assert_that([sha for sha, _ in first]).is_equal_to([commit.hexsha for commit in commits[:20]])
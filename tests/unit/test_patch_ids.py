@@ -0,0 +1,143 @@
+"""Test that cherry-picks are recognized by their patch ids and that the patch ids are cached between runs."""
+# pylint: disable=redefined-outer-name
+import subprocess
+from pathlib import Path
+
+import git as gitpython
+import pytest
+from assertpy import assert_that
+
+from git_utils import GIT_ENV, git
+from get_release_version_action.utils import GitSession
+from get_release_version_action.utils.patch_ids import (
+    PATCH_ID_CACHE_FILE_NAME,
+    PatchIdCache,
+    find_cherry_picks,
+    get_patch_ids
+)
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    """
+    Create a repository with a fix on ``main`` and a ``side`` branch with an unrelated commit, a cherry-pick of the
+    fix, an empty commit and a merge of ``main``.
+    """
+    def commit(file_name: str, message: str) -> None:
+        (tmp_path / file_name).write_text(f'{message}\n', encoding='utf-8')
+        git(tmp_path, 'add', file_name)
+        git(tmp_path, 'commit', '--quiet', '--message', message)
+
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    commit('README.md', 'chore: initial commit')
+    git(tmp_path, 'branch', 'side')
+    commit('fix.txt', 'fix: the fix')
+    git(tmp_path, 'tag', 'fix')
+    commit('other.txt', 'feat: a feature on main')
+
+    git(tmp_path, 'checkout', '--quiet', 'side')
+    commit('side.txt', 'fix: a fix on side')
+    git(tmp_path, 'tag', 'unrelated')
+    git(tmp_path, 'cherry-pick', 'fix')
+    git(tmp_path, 'tag', 'cherry-pick')
+    git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', 'chore: empty')
+    git(tmp_path, 'tag', 'empty')
+    git(tmp_path, 'merge', '--quiet', '--no-edit', 'main')
+    git(tmp_path, 'tag', 'merge')
+    return tmp_path
+
+
+def get_git_patch_id(path: Path, rev: str) -> str:
+    """Get the patch id of a commit from ``git show <rev> | git patch-id --stable``."""
+    diff = subprocess.run(['git', 'show', rev], cwd=path, env=GIT_ENV, check=True, stdout=subprocess.PIPE).stdout
+    output = subprocess.run(
+        ['git', 'patch-id', '--stable'], cwd=path, input=diff, check=True, stdout=subprocess.PIPE
+    ).stdout
+    return output.decode('ascii').split()[0]
+
+
+def test_patch_ids_equal_git(repo_path: Path) -> None:
+    """Test Case: The patch ids equal the ones of git and merges and empty commits have none."""
+    # Arrange
+    shas = {name: git(repo_path, 'rev-parse', name) for name in ['fix', 'cherry-pick', 'unrelated', 'empty', 'merge']}
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Act
+        patch_ids = get_patch_ids(session, list(shas.values()))
+
+    # Assert
+    assert_that(patch_ids).is_equal_to({
+        shas[name]: get_git_patch_id(repo_path, name) for name in ['fix', 'cherry-pick', 'unrelated']
+    })
+    assert_that(patch_ids[shas['fix']]).is_equal_to(patch_ids[shas['cherry-pick']])
+
+
+def test_patch_ids_are_cached(repo_path: Path) -> None:
+    """Test Case: A second run reads the patch ids from the cache without starting git."""
+    # Arrange
+    shas = git(repo_path, 'rev-list', 'side').split()
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        cold_patch_ids = get_patch_ids(session, shas)
+        cold_processes = session.spawned_processes
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Act
+        warm_patch_ids = get_patch_ids(session, shas)
+
+        # Assert
+        assert_that(warm_patch_ids).is_equal_to(cold_patch_ids)
+        assert_that(cold_processes).is_equal_to(2)
+        assert_that(session.spawned_processes).is_equal_to(0)
+
+
+def test_patch_id_cache_ignores_malformed_file(repo_path: Path) -> None:
+    """Test Case: A cache file with an unknown format is ignored and replaced."""
+    # Arrange
+    path = repo_path / '.git' / 'get-release-version-action' / PATCH_ID_CACHE_FILE_NAME
+    path.parent.mkdir()
+    path.write_text('something else\n', encoding='utf-8')
+    sha = git(repo_path, 'rev-parse', 'fix')
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Act
+        cache = PatchIdCache(path)
+        patch_ids = cache.get_patch_ids(session, [sha])
+        cache.save()
+
+        # Assert
+        assert_that(patch_ids).is_equal_to({sha: get_git_patch_id(repo_path, 'fix')})
+        assert_that(PatchIdCache(path).get_patch_ids(session, [sha])).is_equal_to(patch_ids)
+        assert_that(session.spawned_processes).is_equal_to(2)
+
+
+def test_find_cherry_picks(repo_path: Path) -> None:
+    """Test Case: Only the commits whose changes are in the history of the upstream are cherry-picks."""
+    # Arrange
+    shas = git(repo_path, 'rev-list', 'main..side').split()
+
+    with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+        # Act
+        cherry_picks = find_cherry_picks(session, shas, 'main')
+        reverse_cherry_picks = find_cherry_picks(session, [git(repo_path, 'rev-parse', 'fix')], 'cherry-pick')
+
+    # Assert
+    assert_that(cherry_picks).is_equal_to({git(repo_path, 'rev-parse', 'cherry-pick')})
+    assert_that(reverse_cherry_picks).is_equal_to({git(repo_path, 'rev-parse', 'fix')})
+
+
+def test_upstreams_share_cache(repo_path: Path) -> None:
+    """Test Case: The patch ids are cached for all upstreams, so comparing with another upstream computes none."""
+    # Arrange
+    shas = git(repo_path, 'rev-list', 'main..side').split()
+    spawned_processes: list[int] = []
+
+    # Act
+    for upstream in ['main', 'fix', 'main']:
+        with gitpython.Repo(repo_path) as repo, GitSession(repo) as session:
+            find_cherry_picks(session, shas, upstream)
+            spawned_processes.append(session.spawned_processes)
+
+    # Assert
+    # The object reader is the only process of the warm runs, the patch ids are computed by two more processes.
+    assert_that(spawned_processes).is_equal_to([3, 1, 1])
@@ -0,0 +1,64 @@
+"""Test that reading the tag references directly from the files agrees with git."""
+# pylint: disable=redefined-outer-name
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+
+from git_utils import git
+from get_release_version_action.utils.refs import read_tag_refs
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    """Create a repository with lightweight, annotated, nested and non-commit tags, partially packed."""
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', 'chore: first')
+    git(tmp_path, 'tag', 'v0.0.1')
+    git(tmp_path, 'tag', '--annotate', '--message', 'Release v0.0.2-beta', 'v0.0.2-beta')
+    git(tmp_path, 'tag', '--annotate', '--message', 'Nested', 'nested/v0.0.2', 'v0.0.2-beta')
+    git(tmp_path, 'tag', 'tree', 'HEAD^{tree}')
+    git(tmp_path, 'pack-refs', '--all')
+
+    git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', 'fix: second')
+    git(tmp_path, 'tag', 'v0.0.3')
+    git(tmp_path, 'tag', '--annotate', '--message', 'Release v0.0.4', 'v0.0.4')
+    # A loose tag that overrides a packed tag
+    git(tmp_path, 'tag', '--force', 'v0.0.1')
+    return tmp_path
+
+
+def test_read_tag_refs_equals_git(repo_path: Path) -> None:
+    """Test Case: The tag names, object hashes and known peeled hashes are the ones git reports."""
+    # Arrange
+    expected = [line.split(' ') for line in git(
+        repo_path, 'for-each-ref', 'refs/tags', '--format=%(refname:strip=2) %(objectname)'
+    ).splitlines()]
+
+    # Act
+    refs = read_tag_refs(repo_path / '.git')
+
+    # Assert
+    assert_that([ref.name for ref in refs]).is_equal_to([name for name, _ in expected])
+    assert_that([ref.object_sha for ref in refs]).is_equal_to([object_sha for _, object_sha in expected])
+
+    for ref in refs:
+        if ref.peeled_sha is not None:
+            # Annotated tags are peeled recursively, like ``<tag>^{}`` does
+            assert_that(ref.peeled_sha).described_as(ref.name) \
+                .is_equal_to(git(repo_path, 'rev-parse', f'refs/tags/{ref.name}^{{}}'))
+
+    # Only the packed tags have a known peeled hash
+    assert_that([ref.name for ref in refs if ref.peeled_sha is None]).is_equal_to(['v0.0.1', 'v0.0.3', 'v0.0.4'])
+
+
+def test_read_tag_refs_without_tags(tmp_path: Path) -> None:
+    """Test Case: A repository without tags and without a packed-refs file has no tag references."""
+    # Arrange
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+
+    # Act
+    refs = read_tag_refs(tmp_path / '.git')
+
+    # Assert
+    assert_that(refs).is_empty()
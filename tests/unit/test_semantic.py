@@ -0,0 +1,100 @@
+"""Test that the bump analysis stops walking the commits at the first major change."""
+# pylint: disable=redefined-outer-name
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+from assertpy import assert_that
+
+from get_release_version_action.algorithms import semantic
+from get_release_version_action.algorithms.tag_matcher import TagKind, TagNameMatcher
+from get_release_version_action.utils import CommitMessage, GitSession, GitTag, TagNameFilter
+
+MESSAGES = ['fix: newest', 'feat!: breaking', 'feat: older', 'fix: oldest']
+
+
+@pytest.fixture
+def walked(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the commit walk with the messages above and record the messages that were walked."""
+    walked_messages: list[str] = []
+
+    def iter_commit_messages(*_: Any, **__: Any) -> Iterator[CommitMessage]:
+        for i, message in enumerate(MESSAGES):
+            walked_messages.append(message)
+            yield CommitMessage(hexsha=f'{i:040x}', message=message)
+
+    monkeypatch.setattr(semantic, 'iter_commit_messages', iter_commit_messages)
+    return walked_messages
+
+
+@pytest.fixture
+def session(tmp_path: Path) -> GitSession:
+    """A stand-in for a session, the commit walk above doesn't read the repository and only the caches are written."""
+    return cast(GitSession, SimpleNamespace(cache_dir=tmp_path))
+
+
+def test_analyze_commits_stops_at_major(
+        walked: list[str],
+        session: GitSession,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test Case: The commits after the first breaking change are never walked."""
+    # Arrange
+    caplog.set_level(logging.INFO, logger='wemogy.get-release-version-action.semantic')
+
+    # Act
+    next_version = semantic.analyze_commits(session, None, '1.2.3')
+
+    # Assert
+    assert_that(next_version).is_equal_to(('2.0.0', True))
+    assert_that(walked).is_equal_to(MESSAGES[:2])
+
+
+def test_analyze_commits_walks_all_commits_when_debugging(
+        walked: list[str],
+        session: GitSession,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test Case: All commits are walked and logged if debug logging is enabled."""
+    # Arrange
+    caplog.set_level(logging.DEBUG, logger='wemogy.get-release-version-action.semantic')
+
+    # Act
+    next_version = semantic.analyze_commits(session, None, '1.2.3')
+
+    # Assert
+    assert_that(next_version).is_equal_to(('2.0.0', True))
+    assert_that(walked).is_equal_to(MESSAGES)
+
+
+def test_get_current_versions_classifies_tags_once(session: GitSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Case: The name of every scanned tag is classified only once, until both versions are found."""
+    # Arrange
+    names = ['v1.0.1', 'other', 'v1.0.0-ref', 'v1.0.0']
+    classified: list[str] = []
+    classify = TagNameMatcher.classify
+
+    def recording_classify(self: TagNameMatcher, tag_name: str) -> TagKind:
+        classified.append(tag_name)
+        return classify(self, tag_name)
+
+    def iter_tags_newest_first(_: GitSession, name_filter: TagNameFilter, *__: Any) -> Iterator[GitTag]:
+        for i, name in enumerate(names):
+            if name_filter(name):
+                yield GitTag(name=name, commit_sha=f'{i:040x}', committed_date=-i)
+
+    monkeypatch.setattr(TagNameMatcher, 'classify', recording_classify)
+    monkeypatch.setattr(semantic, 'iter_tags_newest_first', iter_tags_newest_first)
+
+    # Act
+    reference_version_tag, current_version_tag = semantic.get_current_versions(
+        session, TagNameMatcher('v', None, 'beta', '-ref'), only_reachable=False
+    )
+
+    # Assert
+    assert_that(reference_version_tag).has_name('v1.0.0-ref')
+    assert_that(current_version_tag).has_name('v1.0.1')
+    assert_that(classified).is_equal_to(names[:3])
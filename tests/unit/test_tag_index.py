@@ -0,0 +1,83 @@
+"""Test that the tag index only resolves tags that were added or moved since the previous run."""
+# pylint: disable=redefined-outer-name,too-few-public-methods
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+
+from git_utils import git
+from get_release_version_action.utils.refs import GitTag, TagRef
+from get_release_version_action.utils.tag_index import TagIndex
+
+
+class RecordingResolver:
+    """Resolves tags with git and records which tags it was asked for."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.requested: list[str] = []
+
+    def __call__(self, refs: list[TagRef]) -> list[GitTag]:
+        self.requested.extend(ref.name for ref in refs)
+        return [
+            GitTag(
+                name=ref.name,
+                commit_sha=git(self.path, 'rev-parse', f'{ref.object_sha}^{{commit}}'),
+                committed_date=int(git(self.path, 'log', '-1', '--format=%ct', ref.object_sha))
+            )
+            for ref in refs
+        ]
+
+
+@pytest.fixture
+def repo_path(tmp_path: Path) -> Path:
+    """Create a repository with two packed tags."""
+    git(tmp_path, 'init', '--quiet', '--initial-branch=main')
+    git(tmp_path, 'commit', '--quiet', '--allow-empty', '--message', 'chore: first')
+    git(tmp_path, 'tag', 'v0.0.1')
+    git(tmp_path, 'tag', '--annotate', '--message', 'Release v0.0.2', 'v0.0.2')
+    git(tmp_path, 'pack-refs', '--all')
+    return tmp_path
+
+
+def run(repo_path: Path) -> tuple[list[str], list[str]]:
+    """Load the index, resolve all tags and save the index, like a run of the action does."""
+    index = TagIndex(repo_path / '.git' / 'get-release-version-action' / 'tag-index')
+    resolver = RecordingResolver(repo_path)
+    tags = index.read_tags(repo_path / '.git', None, resolver)
+    index.save()
+    return [tag.name for tag in tags], resolver.requested
+
+
+def test_warm_run_resolves_nothing(repo_path: Path) -> None:
+    """Test Case: A second run without tag changes resolves no tags."""
+    # Act
+    cold_tags, cold_requested = run(repo_path)
+    warm_tags, warm_requested = run(repo_path)
+
+    # Assert
+    assert_that(cold_tags).is_equal_to(['v0.0.1', 'v0.0.2'])
+    assert_that(cold_requested).is_equal_to(['v0.0.1', 'v0.0.2'])
+    assert_that(warm_tags).is_equal_to(cold_tags)
+    assert_that(warm_requested).is_empty()
+
+
+def test_incremental_refresh(repo_path: Path) -> None:
+    """Test Case: Only added and moved tags are resolved, removed tags disappear."""
+    # Arrange
+    run(repo_path)
+    git(repo_path, 'commit', '--quiet', '--allow-empty', '--message', 'fix: second')
+    git(repo_path, 'tag', 'v0.0.3')
+    git(repo_path, 'tag', '--force', 'v0.0.1')
+    git(repo_path, 'tag', '--delete', 'v0.0.2')
+
+    # Act
+    tags, requested = run(repo_path)
+    git(repo_path, 'pack-refs', '--all')
+    packed_tags, packed_requested = run(repo_path)
+
+    # Assert
+    assert_that(tags).is_equal_to(['v0.0.1', 'v0.0.3'])
+    assert_that(requested).is_equal_to(['v0.0.1', 'v0.0.3'])
+    assert_that(packed_tags).is_equal_to(tags)
+    assert_that(packed_requested).is_empty()
@@ -0,0 +1,74 @@
+"""Test that the compiled tag name matcher is equivalent to the original branching of ``get_current_version``."""
+from itertools import product
+
+import pytest
+from assertpy import assert_that
+
+from get_release_version_action.algorithms.tag_matcher import TagKind, TagNameMatcher
+
+TAG_NAMES = [
+    'v0.0.0', 'v0.0.1', 'v1.2.3', 'v0.0.1-pre', 'v0.0.1-beta', 'v0.0.1-hotfix.1', 'v0.0.2-hotfix.12',
+    'v0.0.1-pre-hotfix.1', 'v0.0.1-beta-hotfix.1', 'v0.0.1-beta-hotfix.2', 'v0.0.1-pre-beta', 'v0.1.0-rc',
+    'v0.1.0-rc-hotfix.1', 'v2.0.0-prebeta', 'vbeta', 'v-hotfix', 'v', 'latest', 'nightly-2024-01-01', '0.0.1',
+    '0.0.1-beta', 'x-v0.0.1', 'product-v0.0.1', 'product-v0.0.1-beta', 'v0.0.1-hotfix-beta', 'v0.0.1-betahotfix',
+    'v0.0.1-beta-hotfix', 'v0.0.1-beta.hotfix.1', 'v0.0.1-pre-hotfix', 'v1.0.0-alpha-hotfix.1-pre'
+]
+
+PREFIXES = ['v', 'product-v', '']
+SUFFIXES = [None, 'pre', 'beta', 'rc']
+REFERENCE_VERSION_SUFFIXES = [None, 'pre', 'beta']
+BUMPING_SUFFIXES = ['hotfix', 'fix']
+
+
+def legacy_matches(
+        tag_name: str,
+        prefix: str,
+        suffix: str | None,
+        bumping_suffix: str,
+        reference_version_suffix: str | None
+) -> bool:
+    """The branching of ``get_current_version`` before the matcher existed."""
+    if not tag_name.startswith(prefix):
+        return False
+
+    if reference_version_suffix is None:
+        if suffix is None:
+            dash_count = tag_name.count('-')
+            return (bumping_suffix in tag_name and dash_count == 1) or dash_count == 0
+
+        return suffix in tag_name
+
+    if tag_name.endswith(reference_version_suffix):
+        return True
+
+    if suffix is None:
+        return tag_name.count('-') == 1 and f'-{bumping_suffix}' in tag_name
+
+    return f'{suffix}-{bumping_suffix}' in tag_name
+
+
+@pytest.mark.parametrize(
+    ('prefix', 'suffix', 'reference_version_suffix', 'bumping_suffix'),
+    list(product(PREFIXES, SUFFIXES, REFERENCE_VERSION_SUFFIXES, BUMPING_SUFFIXES))
+)
+def test_equivalent_to_legacy_logic(
+        prefix: str,
+        suffix: str | None,
+        reference_version_suffix: str | None,
+        bumping_suffix: str
+) -> None:
+    """Test Case: Every tag name is classified like the original logic would have matched it."""
+    # Arrange
+    matcher = TagNameMatcher(prefix, suffix, bumping_suffix, reference_version_suffix)
+
+    for tag_name in TAG_NAMES:
+        expected_current = legacy_matches(tag_name, prefix, suffix, bumping_suffix, None)
+        expected_reference = legacy_matches(tag_name, prefix, suffix, bumping_suffix, reference_version_suffix)
+
+        # Act
+        kind = matcher.classify(tag_name)
+
+        # Assert
+        assert_that(TagKind.CURRENT in kind).described_as(f'{tag_name} is current').is_equal_to(expected_current)
+        assert_that(TagKind.REFERENCE in kind).described_as(f'{tag_name} is reference') \
+            .is_equal_to(expected_reference)
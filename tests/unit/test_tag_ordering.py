@@ -0,0 +1,46 @@
+"""Test the semantic version precedence ordering of version tags."""
+from assertpy import assert_that
+
+from get_release_version_action.algorithms.tag_ordering import get_semver_sort_key
+from get_release_version_action.utils import GitTag
+
+
+def make_tag(name: str, committed_date: int = 1_700_000_000) -> GitTag:
+    """Create a tag on a commit with the given timestamp."""
+    return GitTag(name=name, commit_sha='0' * 40, committed_date=committed_date)
+
+
+def test_orders_by_precedence_and_hotfix_counter() -> None:
+    """Higher versions and higher hotfix counters come first, regardless of the commit timestamps."""
+    tags = [
+        make_tag('v0.0.1', 5),
+        make_tag('v0.0.1-hotfix.2', 1),
+        make_tag('v0.0.1-hotfix.10', 0),
+        make_tag('v0.1.0', 2),
+        make_tag('v1.0.0', 0),
+        make_tag('v0.0.2-beta-hotfix.1', 3)
+    ]
+
+    ordered = sorted(tags, key=get_semver_sort_key('v', 'hotfix'))
+
+    assert_that([tag.name for tag in ordered]).is_equal_to([
+        'v1.0.0', 'v0.1.0', 'v0.0.2-beta-hotfix.1', 'v0.0.1-hotfix.10', 'v0.0.1-hotfix.2', 'v0.0.1'
+    ])
+
+
+def test_commit_date_breaks_ties_between_channels() -> None:
+    """Versions of different release channels have the same precedence, the newest commit comes first."""
+    tags = [make_tag('v0.1.0-pre', 1), make_tag('v0.1.0-beta', 3), make_tag('v0.1.0', 2)]
+
+    ordered = sorted(tags, key=get_semver_sort_key('v', 'hotfix'))
+
+    assert_that([tag.name for tag in ordered]).is_equal_to(['v0.1.0-beta', 'v0.1.0', 'v0.1.0-pre'])
+
+
+def test_invalid_versions_come_last() -> None:
+    """Tags that are not valid semantic versions come after all versions, newest commit first."""
+    tags = [make_tag('vnext', 9), make_tag('v0.0.1', 0), make_tag('v1', 8)]
+
+    ordered = sorted(tags, key=get_semver_sort_key('v', 'hotfix'))
+
+    assert_that([tag.name for tag in ordered]).is_equal_to(['v0.0.1', 'vnext', 'v1'])